@@ -6,7 +6,6 @@ move choice had the highest impact on game outcome.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -21,6 +20,7 @@ from cuttle_engine.state import (
     FourState,
 )
 from analytics.move_ev import analyze_position, PositionAnalysis
+from simulation.runner import load_game_log
 
 if TYPE_CHECKING:
     from cuttle_engine.moves import Move
@@ -152,8 +152,7 @@ def find_critical_positions(
     Returns:
         List of CriticalPosition objects, sorted by EV loss.
     """
-    with open(game_log_path) as f:
-        log = json.load(f)
+    log = load_game_log(game_log_path)
 
     game_id = log["game_id"]
     winner = log["result"]["winner"] if log.get("result") else None
@@ -187,6 +187,71 @@ class EloManager:
 
         return updates
 
+    def update_ratings_from_games_batch(
+        self,
+        games: list[tuple[str, str, int | None, list[str] | None]],
+    ) -> list[dict[str, tuple[RatingUpdate, RatingUpdate]]]:
+        """Update ELO ratings from several games with a single commit.
+
+        Games are applied in order with the same arithmetic as
+        update_ratings_from_game, so the resulting ratings and history match
+        calling it once per game.
+
+        Args:
+            games: (p0_id, p1_id, winner, pools) per game; see
+                update_ratings_from_game.
+
+        Returns:
+            Per game, a dict mapping pool name to (p0_update, p1_update).
+        """
+        current: dict[tuple[str, str], tuple[float, int]] = {}
+        rows: list[tuple[str, float, str, int]] = []
+        results = []
+
+        def lookup(player_id: str, pool: str) -> tuple[float, int]:
+            key = (player_id, pool)
+            if key not in current:
+                record = self._elo_repo.get_or_create_rating(
+                    player_id, pool, self.DEFAULT_RATING
+                )
+                current[key] = (record.rating, record.games_played)
+            return current[key]
+
+        for p0_id, p1_id, winner, pools in games:
+            if winner == 0:
+                result = 1.0
+            elif winner == 1:
+                result = 0.0
+            else:
+                result = 0.5
+
+            updates = {}
+            for pool in pools or ["all"]:
+                r0, games0 = lookup(p0_id, pool)
+                r1, games1 = lookup(p1_id, pool)
+
+                e0 = 1.0 / (1.0 + 10 ** ((r1 - r0) / 400.0))
+                e1 = 1.0 - e0
+
+                new_r0 = r0 + self._k_factor * (result - e0)
+                new_r1 = r1 + self._k_factor * ((1.0 - result) - e1)
+
+                current[(p0_id, pool)] = (new_r0, games0 + 1)
+                current[(p1_id, pool)] = (new_r1, games1 + 1)
+                rows.append((p0_id, new_r0, pool, games0 + 1))
+                rows.append((p1_id, new_r1, pool, games1 + 1))
+
+                updates[pool] = (
+                    RatingUpdate(p0_id, r0, new_r0, new_r0 - r0, games0 + 1),
+                    RatingUpdate(p1_id, r1, new_r1, new_r1 - r1, games1 + 1),
+                )
+            results.append(updates)
+
+        if rows:
+            self._elo_repo.add_ratings(rows)
+
+        return results
+
     def get_leaderboard(
         self,
         pool: str = "all",
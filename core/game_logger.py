@@ -8,6 +8,8 @@ import uuid
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from cuttle_engine.cards import card_strings
+from cuttle_engine.state import PHASE_NAMES
 from db.database import Database, GameRepository, PlayerRepository
 
 if TYPE_CHECKING:
@@ -15,6 +17,13 @@ if TYPE_CHECKING:
     from cuttle_engine.state import GameState
     from core.player_identity import PlayerIdentity
 
+    # (move_number, turn, player, phase, move, state, mcts_stats, llm_thinking)
+    _PendingMove = tuple[
+        int, int, int, str, Move, GameState | None, dict[str, Any] | None, dict[str, Any] | None
+    ]
+    # A GameRepository.add_moves row
+    _MoveRow = tuple[str, int, int, int, str, str, str | None, str | None, str | None]
+
 
 @dataclass
 class GameLogContext:
@@ -26,6 +35,8 @@ class GameLogContext:
     seed: int | None
     start_time: float
     move_count: int = 0
+    # Moves awaiting write, serialized at end_game, off the game loop
+    pending_moves: list[_PendingMove] = field(default_factory=list)
 
 
 class PersistentGameLogger:
@@ -125,7 +136,7 @@ class PersistentGameLogger:
         mcts_stats: dict[str, Any] | None = None,
         llm_thinking: dict[str, Any] | None = None,
     ) -> None:
-        """Log a move to the database.
+        """Log a move; it is written to the database at end_game.
 
         Args:
             game_id: The game ID.
@@ -143,27 +154,36 @@ class PersistentGameLogger:
 
         context.move_count += 1
 
-        # Compress state to JSON if provided
-        state_json = None
-        if state is not None:
-            state_json = json.dumps(_compress_state(state))
-
-        # Convert stats to JSON
-        mcts_stats_json = json.dumps(mcts_stats) if mcts_stats else None
-        llm_thinking_json = json.dumps(llm_thinking) if llm_thinking else None
-
-        self._game_repo.add_move(
-            game_id=game_id,
-            move_number=context.move_count,
-            turn=turn,
-            player=player,
-            phase=phase,
-            move_description=str(move),
-            state_json=state_json,
-            mcts_stats_json=mcts_stats_json,
-            llm_thinking_json=llm_thinking_json,
+        # Keep the raw (immutable) state; serializing it here would put the
+        # string conversions on the caller's game loop
+        context.pending_moves.append(
+            (context.move_count, turn, player, phase, move, state, mcts_stats, llm_thinking)
         )
 
+    def _flush_moves(self, context: GameLogContext) -> None:
+        """Serialize a game's pending moves and write them in one transaction."""
+        rows: list[_MoveRow] = []
+        for (
+            move_number, turn, player, phase, move, state, mcts_stats, llm_thinking
+        ) in context.pending_moves:
+            # Compress state to JSON if provided
+            state_json = None
+            if state is not None:
+                state_json = json.dumps(_compress_state(state))
+
+            # Convert stats to JSON
+            mcts_stats_json = json.dumps(mcts_stats) if mcts_stats else None
+            llm_thinking_json = json.dumps(llm_thinking) if llm_thinking else None
+
+            rows.append((
+                context.game_id, move_number, turn, player, phase, str(move),
+                state_json, mcts_stats_json, llm_thinking_json,
+            ))
+
+        if rows:
+            self._game_repo.add_moves(rows)
+        context.pending_moves.clear()
+
     def end_game(
         self,
         game_id: str,
@@ -173,7 +193,10 @@ class PersistentGameLogger:
         score_p1: int,
         turns: int,
     ) -> None:
-        """End a game and record final results.
+        """End a game, writing its logged moves and final results.
+
+        Safe to call from a worker thread (the database connection is
+        thread-local), which keeps move serialization off the caller's loop.
 
         Args:
             game_id: The game ID.
@@ -188,6 +211,7 @@ class PersistentGameLogger:
             return
 
         duration_ms = (time.perf_counter() - context.start_time) * 1000
+        self._flush_moves(context)
 
         # Update the game record that was created at start_game
         self._game_repo.update_game(
@@ -204,10 +228,14 @@ class PersistentGameLogger:
     def abort_game(self, game_id: str) -> None:
         """Abort logging for a game without recording results.
 
+        Moves logged so far are still written.
+
         Args:
             game_id: The game ID to abort.
         """
-        self._active_games.pop(game_id, None)
+        context = self._active_games.pop(game_id, None)
+        if context is not None:
+            self._flush_moves(context)
 
     def get_active_games(self) -> list[str]:
         """Get list of active game IDs being logged."""
@@ -226,14 +254,14 @@ def _compress_state(state: "GameState") -> dict[str, Any]:
     return {
         "turn": state.turn_number,
         "current_player": state.current_player,
-        "phase": state.phase.name,
+        "phase": PHASE_NAMES[state.phase],
         "deck_size": len(state.deck),
         "scrap_size": len(state.scrap),
         "players": [
             {
-                "hand": [str(c) for c in p.hand],
-                "points": [str(c) for c in p.points_field],
-                "permanents": [str(c) for c in p.permanents],
+                "hand": card_strings(p.hand),
+                "points": card_strings(p.points_field),
+                "permanents": card_strings(p.permanents),
                 "point_total": p.point_total,
                 "kings": p.kings_count,
                 "queens": p.queens_count,
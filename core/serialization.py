@@ -0,0 +1,43 @@
+"""JSON serialization for logs and checkpoints.
+
+Uses orjson when installed (``pip install cuttle-simulation[perf]``) and
+falls back to the stdlib json module otherwise. Both produce the same
+JSON documents; only speed differs.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on environment
+    _HAS_ORJSON = False
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes.
+
+    Args:
+        data: Object to serialize. Unknown types (Path, datetime, ...) are
+            converted with str().
+        indent: Pretty-print with two-space indentation.
+
+    Returns:
+        Encoded JSON.
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, default=str, indent=2).encode()
+    return json.dumps(data, default=str, separators=(",", ":")).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON bytes or text."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
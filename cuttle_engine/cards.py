@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from enum import IntEnum, auto
 from functools import total_ordering
 from typing import ClassVar
@@ -78,7 +79,13 @@ class Card:
     then by suit (for scuttling tiebreaks).
     """
 
-    __slots__ = ("_rank", "_suit")
+    __slots__ = ("_rank", "_suit", "_str", "_point_value")
+
+    # Slot types, for the type checker (set once in __new__)
+    _rank: Rank
+    _suit: Suit
+    _str: str
+    _point_value: int
 
     # Pre-computed card instances for the standard 52-card deck
     _instances: ClassVar[dict[tuple[Rank, Suit], Card]] = {}
@@ -89,6 +96,9 @@ class Card:
             instance = object.__new__(cls)
             instance._rank = rank
             instance._suit = suit
+            # Cards are immutable, so format the display string once up front
+            instance._str = f"{rank.symbol}{suit.symbol}"
+            instance._point_value = rank.value if rank.value <= 10 else 0
             cls._instances[key] = instance
         return cls._instances[key]
 
@@ -103,9 +113,7 @@ class Card:
     @property
     def point_value(self) -> int:
         """Points this card is worth when played for points (A-10 only)."""
-        if self._rank.value <= 10:
-            return self._rank.value
-        return 0
+        return self._point_value
 
     @property
     def can_play_for_points(self) -> bool:
@@ -163,7 +171,7 @@ class Card:
         return f"Card({self._rank.name}, {self._suit.name})"
 
     def __str__(self) -> str:
-        return f"{self._rank.symbol}{self._suit.symbol}"
+        return self._str
 
     def can_scuttle(self, target: Card) -> bool:
         """Whether this card can scuttle the target card.
@@ -181,9 +189,21 @@ class Card:
         return False
 
 
+# The 52 interned cards in standard deck order
+_STANDARD_DECK: tuple[Card, ...] = tuple(Card(rank, suit) for suit in Suit for rank in Rank)
+
+
 def create_deck() -> list[Card]:
     """Create a standard 52-card deck."""
-    return [Card(rank, suit) for suit in Suit for rank in Rank]
+    return list(_STANDARD_DECK)
+
+
+def card_strings(cards: Iterable[Card]) -> list[str]:
+    """Display strings for cards, e.g. for logging.
+
+    Reads each card's cached string directly, skipping the str() dispatch.
+    """
+    return [card._str for card in cards]
 
 
 def shuffle_deck(deck: list[Card], seed: int | None = None) -> list[Card]:
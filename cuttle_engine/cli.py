@@ -176,18 +176,23 @@ def watch_game(seed: int | None = None, delay: float = 0.5) -> None:
     print(format_state(state, show_opponent_hand=True))
 
 
-def run_tournament(num_games: int = 100, seed: int = 42) -> None:
+def run_tournament(num_games: int = 100, seed: int = 42, workers: int = 1) -> None:
     """Run a tournament between strategies."""
-    from simulation.runner import run_batch
+    from functools import partial
+
+    from simulation.runner import run_batch_parallel
     from strategies.heuristic import HeuristicStrategy
     from strategies.random_strategy import RandomStrategy
 
     print(f"\nRunning {num_games} games: Random vs Random")
 
-    strategy0 = RandomStrategy(seed=seed)
-    strategy1 = RandomStrategy(seed=seed + 1000)
-
-    results = run_batch(strategy0, strategy1, num_games, start_seed=seed, log_moves=False)
+    results = run_batch_parallel(
+        partial(RandomStrategy, seed=seed),
+        partial(RandomStrategy, seed=seed + 1000),
+        num_games,
+        start_seed=seed,
+        num_workers=workers,
+    )
 
     p0_wins = sum(1 for r in results if r.winner == 0)
     p1_wins = sum(1 for r in results if r.winner == 1)
@@ -204,10 +209,13 @@ def run_tournament(num_games: int = 100, seed: int = 42) -> None:
 
     print(f"\nRunning {num_games} games: Heuristic vs Random")
 
-    strategy0 = HeuristicStrategy(seed=seed)
-    strategy1 = RandomStrategy(seed=seed + 1000)
-
-    results = run_batch(strategy0, strategy1, num_games, start_seed=seed, log_moves=False)
+    results = run_batch_parallel(
+        partial(HeuristicStrategy, seed=seed),
+        partial(RandomStrategy, seed=seed + 1000),
+        num_games,
+        start_seed=seed,
+        num_workers=workers,
+    )
 
     p0_wins = sum(1 for r in results if r.winner == 0)
     p1_wins = sum(1 for r in results if r.winner == 1)
@@ -243,6 +251,9 @@ def main() -> None:
         "--games", type=int, default=100, help="Number of games"
     )
     tournament_parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    tournament_parser.add_argument(
+        "--workers", type=int, default=1, help="Worker processes (default: 1)"
+    )
 
     args = parser.parse_args()
 
@@ -251,7 +262,7 @@ def main() -> None:
     elif args.command == "watch":
         watch_game(seed=args.seed, delay=args.delay)
     elif args.command == "tournament":
-        run_tournament(num_games=args.games, seed=args.seed)
+        run_tournament(num_games=args.games, seed=args.seed, workers=args.workers)
     else:
         parser.print_help()
 
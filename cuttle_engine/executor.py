@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import Any
+
 from cuttle_engine.cards import Card, Rank
 from cuttle_engine.moves import (
     Counter,
@@ -25,6 +28,7 @@ from cuttle_engine.state import (
     GameState,
     PlayerState,
     SevenState,
+    WinReason,
 )
 
 
@@ -50,32 +54,13 @@ def execute_move(state: GameState, move: Move) -> GameState:
     if state.is_game_over:
         raise IllegalMoveError("Game is already over")
 
-    match move:
-        case Draw():
-            return _execute_draw(state)
-        case PlayPoints():
-            return _execute_play_points(state, move)
-        case Scuttle():
-            return _execute_scuttle(state, move)
-        case PlayOneOff():
-            return _execute_play_one_off(state, move)
-        case PlayPermanent():
-            return _execute_play_permanent(state, move)
-        case Counter():
-            return _execute_counter(state, move)
-        case DeclineCounter():
-            return _execute_decline_counter(state)
-        case ResolveSeven():
-            return _execute_resolve_seven(state, move)
-        case Discard():
-            return _execute_discard(state, move)
-        case Pass():
-            return _execute_pass(state)
-        case _:
-            raise IllegalMoveError(f"Unknown move type: {type(move)}")
+    execute = _EXECUTORS.get(type(move))
+    if execute is None:
+        execute = _subclass_executor(type(move))
+    return execute(state, move)
 
 
-def _execute_draw(state: GameState) -> GameState:
+def _execute_draw(state: GameState, move: Draw) -> GameState:
     """Execute a draw action."""
     if state.phase != GamePhase.MAIN:
         raise IllegalMoveError("Can only draw during main phase")
@@ -97,9 +82,7 @@ def _execute_draw(state: GameState) -> GameState:
     new_players = (players[0], players[1])
 
     # End turn
-    return _end_turn(
-        state.with_players(new_players).with_deck(new_deck).with_consecutive_passes(0)
-    )
+    return _end_turn(state, players=new_players, deck=new_deck, consecutive_passes=0)
 
 
 def _execute_play_points(state: GameState, move: PlayPoints) -> GameState:
@@ -116,12 +99,12 @@ def _execute_play_points(state: GameState, move: PlayPoints) -> GameState:
     # Remove from hand, add to points field
     new_hand = tuple(c for c in player.hand if c != move.card)
     new_points = player.points_field + (move.card,)
-    new_player = player.with_hand(new_hand).with_points_field(new_points)
+    new_player = player.with_updates(hand=new_hand, points_field=new_points)
 
     # Update players
     players = list(state.players)
     players[state.current_player] = new_player
-    new_state = state.with_players((players[0], players[1])).with_consecutive_passes(0)
+    new_state = state.with_updates(players=(players[0], players[1]), consecutive_passes=0)
 
     # Check for win
     new_state = _check_win(new_state)
@@ -171,12 +154,12 @@ def _execute_scuttle(state: GameState, move: Scuttle) -> GameState:
         players = list(state.players)
         players[state.current_player] = new_player
         players[state.opponent] = new_opponent
-        new_state = (
-            state.with_players((players[0], players[1]))
-            .with_scrap(new_scrap)
-            .with_consecutive_passes(0)
+        return _end_turn(
+            state,
+            players=(players[0], players[1]),
+            scrap=new_scrap,
+            consecutive_passes=0,
         )
-        return _end_turn(new_state)
 
     # Both cards go to scrap
     new_scrap = state.scrap + (move.card, move.target)
@@ -184,14 +167,13 @@ def _execute_scuttle(state: GameState, move: Scuttle) -> GameState:
     players = list(state.players)
     players[state.current_player] = new_player
     players[state.opponent] = new_opponent
-    new_state = (
-        state.with_players((players[0], players[1]))
-        .with_scrap(new_scrap)
-        .with_consecutive_passes(0)
+    return _end_turn(
+        state,
+        players=(players[0], players[1]),
+        scrap=new_scrap,
+        consecutive_passes=0,
     )
 
-    return _end_turn(new_state)
-
 
 def _execute_play_one_off(state: GameState, move: PlayOneOff) -> GameState:
     """Execute playing a card as a one-off effect."""
@@ -217,11 +199,11 @@ def _execute_play_one_off(state: GameState, move: PlayOneOff) -> GameState:
         target_player=move.target_player,
     )
 
-    new_state = (
-        state.with_players((players[0], players[1]))
-        .with_phase(GamePhase.COUNTER)
-        .with_counter_state(counter_state)
-        .with_consecutive_passes(0)
+    new_state = state.with_updates(
+        players=(players[0], players[1]),
+        phase=GamePhase.COUNTER,
+        counter_state=counter_state,
+        consecutive_passes=0,
     )
 
     # Note: current_player doesn't change during counter phase
@@ -275,7 +257,7 @@ def _execute_play_permanent(state: GameState, move: PlayPermanent) -> GameState:
 
         # Add Jack and stolen card to our jacks
         new_jacks = player.jacks + ((move.card, move.target_card),)
-        new_player = player.with_hand(new_hand).with_jacks(new_jacks)
+        new_player = player.with_updates(hand=new_hand, jacks=new_jacks)
 
         players = list(state.players)
         players[state.current_player] = new_player
@@ -284,12 +266,12 @@ def _execute_play_permanent(state: GameState, move: PlayPermanent) -> GameState:
     else:
         # 8, Q, K just add to permanents
         new_permanents = player.permanents + (move.card,)
-        new_player = player.with_hand(new_hand).with_permanents(new_permanents)
+        new_player = player.with_updates(hand=new_hand, permanents=new_permanents)
 
         players = list(state.players)
         players[state.current_player] = new_player
 
-    new_state = state.with_players((players[0], players[1])).with_consecutive_passes(0)
+    new_state = state.with_updates(players=(players[0], players[1]), consecutive_passes=0)
 
     # Check for win (King might lower threshold)
     new_state = _check_win(new_state)
@@ -332,12 +314,12 @@ def _execute_counter(state: GameState, move: Counter) -> GameState:
     )
 
     # Stay in counter phase, but now the other player can counter
-    return state.with_players((players[0], players[1])).with_counter_state(
-        new_counter_state
+    return state.with_updates(
+        players=(players[0], players[1]), counter_state=new_counter_state
     )
 
 
-def _execute_decline_counter(state: GameState) -> GameState:
+def _execute_decline_counter(state: GameState, move: DeclineCounter) -> GameState:
     """Execute declining to counter."""
     if state.phase != GamePhase.COUNTER:
         raise IllegalMoveError("Can only decline counter during counter phase")
@@ -356,15 +338,15 @@ def _execute_decline_counter(state: GameState) -> GameState:
         new_state = _resolve_one_off(new_state, counter_state)
     # else: Even number of counters means effect is cancelled
 
-    # Clear counter state and return to main phase (or handle phase transitions)
-    new_state = new_state.with_counter_state(None)
-
-    # If not in a special phase, end turn
+    # Clear counter state. If the effect didn't enter a special phase,
+    # return to main phase and end turn.
     if new_state.phase == GamePhase.COUNTER:
-        new_state = new_state.with_phase(GamePhase.MAIN)
+        new_state = new_state.with_updates(counter_state=None, phase=GamePhase.MAIN)
         new_state = _check_win(new_state)
         if not new_state.is_game_over:
             new_state = _end_turn(new_state)
+    else:
+        new_state = new_state.with_counter_state(None)
 
     return new_state
 
@@ -411,10 +393,10 @@ def _resolve_ace(state: GameState) -> GameState:
             cards_to_scrap.append(jack)
             cards_to_scrap.append(stolen)
 
-        new_players[i] = player.with_points_field(()).with_jacks(())
+        new_players[i] = player.with_updates(points_field=(), jacks=())
 
     new_scrap = state.scrap + tuple(cards_to_scrap)
-    return state.with_players((new_players[0], new_players[1])).with_scrap(new_scrap)
+    return state.with_updates(players=(new_players[0], new_players[1]), scrap=new_scrap)
 
 
 def _resolve_two(
@@ -444,7 +426,7 @@ def _resolve_two(
     players[target_player] = new_player
     new_scrap = state.scrap + (target_card,)
 
-    return state.with_players((players[0], players[1])).with_scrap(new_scrap)
+    return state.with_updates(players=(players[0], players[1]), scrap=new_scrap)
 
 
 def _resolve_three(state: GameState, caster: int, target_card: Card | None) -> GameState:
@@ -463,7 +445,7 @@ def _resolve_three(state: GameState, caster: int, target_card: Card | None) -> G
     players = list(state.players)
     players[caster] = new_player
 
-    return state.with_players((players[0], players[1])).with_scrap(new_scrap)
+    return state.with_updates(players=(players[0], players[1]), scrap=new_scrap)
 
 
 def _resolve_four(state: GameState, target_player: int | None) -> GameState:
@@ -480,7 +462,7 @@ def _resolve_four(state: GameState, target_player: int | None) -> GameState:
 
     # Enter discard phase
     four_state = FourState(player=target_player, cards_to_discard=cards_to_discard)
-    return state.with_phase(GamePhase.DISCARD_FOUR).with_four_state(four_state)
+    return state.with_updates(phase=GamePhase.DISCARD_FOUR, four_state=four_state)
 
 
 def _resolve_five(state: GameState, caster: int) -> GameState:
@@ -500,7 +482,7 @@ def _resolve_five(state: GameState, caster: int) -> GameState:
     players = list(state.players)
     players[caster] = new_player
 
-    return state.with_players((players[0], players[1])).with_deck(new_deck)
+    return state.with_updates(players=(players[0], players[1]), deck=new_deck)
 
 
 def _resolve_six(state: GameState) -> GameState:
@@ -517,10 +499,10 @@ def _resolve_six(state: GameState) -> GameState:
             cards_to_scrap.append(jack)
             cards_to_scrap.append(stolen)
 
-        new_players[i] = player.with_permanents(()).with_jacks(())
+        new_players[i] = player.with_updates(permanents=(), jacks=())
 
     new_scrap = state.scrap + tuple(cards_to_scrap)
-    return state.with_players((new_players[0], new_players[1])).with_scrap(new_scrap)
+    return state.with_updates(players=(new_players[0], new_players[1]), scrap=new_scrap)
 
 
 def _resolve_seven(state: GameState, caster: int) -> GameState:
@@ -534,10 +516,8 @@ def _resolve_seven(state: GameState, caster: int) -> GameState:
     new_deck = state.deck[num_reveal:]
 
     seven_state = SevenState(revealed_cards=revealed, player=caster)
-    return (
-        state.with_deck(new_deck)
-        .with_phase(GamePhase.RESOLVE_SEVEN)
-        .with_seven_state(seven_state)
+    return state.with_updates(
+        deck=new_deck, phase=GamePhase.RESOLVE_SEVEN, seven_state=seven_state
     )
 
 
@@ -554,13 +534,13 @@ def _resolve_nine(
     if target_card in player.permanents:
         new_permanents = tuple(c for c in player.permanents if c != target_card)
         new_hand = player.hand + (target_card,)
-        new_player = player.with_permanents(new_permanents).with_hand(new_hand)
+        new_player = player.with_updates(permanents=new_permanents, hand=new_hand)
     elif any(j == target_card for j, _ in player.jacks):
         # Returning a Jack - stolen card goes back to original owner's points
         stolen = next(s for j, s in player.jacks if j == target_card)
         new_jacks = tuple((j, s) for j, s in player.jacks if j != target_card)
         new_hand = player.hand + (target_card,)
-        new_player = player.with_jacks(new_jacks).with_hand(new_hand)
+        new_player = player.with_updates(jacks=new_jacks, hand=new_hand)
 
         # Return stolen card to opponent
         opponent_idx = 1 - target_player
@@ -598,11 +578,11 @@ def _execute_resolve_seven(state: GameState, move: ResolveSeven) -> GameState:
     new_deck = other_cards + state.deck  # Put unused back on top
 
     # Clear seven state
-    new_state = (
-        state.with_deck(new_deck)
-        .with_seven_state(None)
-        .with_phase(GamePhase.MAIN)
-        .with_current_player(player_idx)
+    new_state = state.with_updates(
+        deck=new_deck,
+        seven_state=None,
+        phase=GamePhase.MAIN,
+        current_player=player_idx,
     )
 
     # Now execute the chosen play
@@ -631,8 +611,8 @@ def _execute_resolve_seven(state: GameState, move: ResolveSeven) -> GameState:
             new_scrap = new_state.scrap + (move.card, move.target_card)
             players = list(new_state.players)
             players[opponent_idx] = new_opponent
-            new_state = new_state.with_players((players[0], players[1])).with_scrap(
-                new_scrap
+            new_state = new_state.with_updates(
+                players=(players[0], players[1]), scrap=new_scrap
             )
 
         case MoveType.PLAY_ONE_OFF:
@@ -660,8 +640,8 @@ def _execute_resolve_seven(state: GameState, move: ResolveSeven) -> GameState:
                 target_card=move.target_card,
                 target_player=target_player,
             )
-            new_state = new_state.with_phase(GamePhase.COUNTER).with_counter_state(
-                counter_state
+            new_state = new_state.with_updates(
+                phase=GamePhase.COUNTER, counter_state=counter_state
             )
             return new_state
 
@@ -757,18 +737,18 @@ def _execute_discard(state: GameState, move: Discard) -> GameState:
     if remaining > 0 and len(new_hand) > 0:
         # More cards to discard
         new_four_state = FourState(player=player_idx, cards_to_discard=remaining)
-        return (
-            state.with_players((players[0], players[1]))
-            .with_scrap(new_scrap)
-            .with_four_state(new_four_state)
+        return state.with_updates(
+            players=(players[0], players[1]),
+            scrap=new_scrap,
+            four_state=new_four_state,
         )
     else:
         # Done discarding, return to main phase and end turn
-        new_state = (
-            state.with_players((players[0], players[1]))
-            .with_scrap(new_scrap)
-            .with_four_state(None)
-            .with_phase(GamePhase.MAIN)
+        new_state = state.with_updates(
+            players=(players[0], players[1]),
+            scrap=new_scrap,
+            four_state=None,
+            phase=GamePhase.MAIN,
         )
         new_state = _check_win(new_state)
         if not new_state.is_game_over:
@@ -776,7 +756,7 @@ def _execute_discard(state: GameState, move: Discard) -> GameState:
         return new_state
 
 
-def _execute_pass(state: GameState) -> GameState:
+def _execute_pass(state: GameState, move: Pass) -> GameState:
     """Execute passing the turn."""
     if state.phase != GamePhase.MAIN:
         raise IllegalMoveError("Can only pass during main phase")
@@ -791,25 +771,27 @@ def _execute_pass(state: GameState) -> GameState:
         p0_points = state.players[0].point_total
         p1_points = state.players[1].point_total
         if p0_points > p1_points:
-            from cuttle_engine.state import WinReason
-
             return state.with_winner(0, WinReason.EMPTY_DECK_POINTS)
         elif p1_points > p0_points:
-            from cuttle_engine.state import WinReason
-
             return state.with_winner(1, WinReason.EMPTY_DECK_POINTS)
         # Tie - game continues? Or draw? For now continue
         # Actually in cuttle, if both pass consecutively it's a draw or continue
         # Let's say game continues (reset passes)
         new_passes = 0
 
-    return _end_turn(state.with_consecutive_passes(new_passes))
+    return _end_turn(state, consecutive_passes=new_passes)
+
 
+def _end_turn(state: GameState, **changes: Any) -> GameState:
+    """End the current turn and switch to the other player.
 
-def _end_turn(state: GameState) -> GameState:
-    """End the current turn and switch to the other player."""
+    Any extra field changes are applied in the same allocation as the
+    turn switch, so callers can finish a move with a single new state.
+    """
     new_turn = state.turn_number + 1 if state.current_player == 1 else state.turn_number
-    return state.with_current_player(state.opponent).with_turn_number(new_turn)
+    return state.with_updates(
+        current_player=state.opponent, turn_number=new_turn, **changes
+    )
 
 
 def _check_win(state: GameState) -> GameState:
@@ -818,3 +800,36 @@ def _check_win(state: GameState) -> GameState:
     if winner is not None:
         return state.with_winner(winner, reason)
     return state
+
+
+def _subclass_executor(move_type: type) -> Callable[[GameState, Any], GameState]:
+    """Find the executor for a move class missing from _EXECUTORS.
+
+    A subclass of a move class runs its base's executor, as a class pattern
+    would match it; the result is cached for later moves.
+
+    Raises:
+        IllegalMoveError: If move_type is not a subclass of any move class.
+    """
+    for base in move_type.__mro__[1:]:
+        execute = _EXECUTORS.get(base)
+        if execute is not None:
+            _EXECUTORS[move_type] = execute
+            return execute
+    raise IllegalMoveError(f"Unknown move type: {move_type}")
+
+
+# execute_move dispatch on the exact move class (subclasses are added on
+# first use by _subclass_executor)
+_EXECUTORS: dict[type, Callable[[GameState, Any], GameState]] = {
+    Draw: _execute_draw,
+    PlayPoints: _execute_play_points,
+    Scuttle: _execute_scuttle,
+    PlayOneOff: _execute_play_one_off,
+    PlayPermanent: _execute_play_permanent,
+    Counter: _execute_counter,
+    DeclineCounter: _execute_decline_counter,
+    ResolveSeven: _execute_resolve_seven,
+    Discard: _execute_discard,
+    Pass: _execute_pass,
+}
@@ -20,6 +20,33 @@ from cuttle_engine.moves import (
 )
 from cuttle_engine.state import GamePhase, GameState
 
+# Last (state, moves) pair served by get_legal_moves. Keyed by identity:
+# states are immutable, so a hit is always valid for that exact object.
+_last_legal: tuple[GameState | None, tuple[Move, ...]] = (None, ())
+
+
+def get_legal_moves(state: GameState) -> list[Move]:
+    """Generate legal moves, reusing the result for the same state object.
+
+    A game loop that generates moves for a state and then hands the state to
+    a strategy (e.g. MCTS building its root node) only pays for generation
+    once. Returns a fresh list each call, so callers may mutate it.
+
+    Args:
+        state: Current game state.
+
+    Returns:
+        List of all legal moves for the current player/phase.
+    """
+    global _last_legal
+    cached_state, cached_moves = _last_legal
+    if cached_state is state:
+        return list(cached_moves)
+
+    moves = generate_legal_moves(state)
+    _last_legal = (state, tuple(moves))
+    return moves
+
 
 def generate_legal_moves(state: GameState) -> list[Move]:
     """Generate all legal moves for the current game state.
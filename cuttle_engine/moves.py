@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from enum import IntEnum, auto
 from typing import TYPE_CHECKING
 
+from cuttle_engine.cards import Rank
+
 if TYPE_CHECKING:
     from cuttle_engine.cards import Card
 
@@ -137,8 +139,6 @@ class PlayPermanent(Move):
         return MoveType.PLAY_PERMANENT
 
     def __str__(self) -> str:
-        from cuttle_engine.cards import Rank
-
         if self.card.rank == Rank.JACK and self.target_card:
             return f"Play {self.card} to steal {self.target_card}"
         elif self.card.rank == Rank.EIGHT:
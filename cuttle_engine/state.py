@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
 from enum import IntEnum, auto
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from cuttle_engine.cards import Rank, create_deck, shuffle_deck
 
 if TYPE_CHECKING:
     from cuttle_engine.cards import Card
@@ -20,6 +24,11 @@ class GamePhase(IntEnum):
     GAME_OVER = auto()  # Game has ended
 
 
+# Phase -> name for per-move logging; GamePhase.name goes through a slow
+# enum descriptor on every access
+PHASE_NAMES: dict[GamePhase, str] = {phase: sys.intern(phase.name) for phase in GamePhase}
+
+
 class WinReason(IntEnum):
     """How the game was won."""
 
@@ -43,34 +52,39 @@ class PlayerState:
     points_field: tuple[Card, ...]
     permanents: tuple[Card, ...]
     jacks: tuple[tuple[Card, Card], ...] = ()  # (Jack, stolen_card) pairs
+    # Derived totals, computed on first use. The executor carries an
+    # untouched player's state across moves, so these are usually cached.
+    _point_total: int | None = field(default=None, init=False, repr=False, compare=False)
+    _kings_count: int | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def point_total(self) -> int:
         """Total points from point cards (including Jack-stolen cards)."""
-        total = sum(card.point_value for card in self.points_field)
-        # Add points from cards we stole with Jacks
-        total += sum(stolen.point_value for _, stolen in self.jacks)
+        total = self._point_total
+        if total is None:
+            total = sum(card.point_value for card in self.points_field)
+            # Add points from cards we stole with Jacks
+            total += sum(stolen.point_value for _, stolen in self.jacks)
+            object.__setattr__(self, "_point_total", total)
         return total
 
     @property
     def queens_count(self) -> int:
         """Number of Queens protecting this player."""
-        from cuttle_engine.cards import Rank
-
         return sum(1 for card in self.permanents if card.rank == Rank.QUEEN)
 
     @property
     def kings_count(self) -> int:
         """Number of Kings reducing point threshold."""
-        from cuttle_engine.cards import Rank
-
-        return sum(1 for card in self.permanents if card.rank == Rank.KING)
+        count = self._kings_count
+        if count is None:
+            count = sum(1 for card in self.permanents if card.rank == Rank.KING)
+            object.__setattr__(self, "_kings_count", count)
+        return count
 
     @property
     def has_glasses(self) -> bool:
         """Whether player has an Eight (sees opponent's hand)."""
-        from cuttle_engine.cards import Rank
-
         return any(card.rank == Rank.EIGHT for card in self.permanents)
 
     def with_hand(self, hand: tuple[Card, ...]) -> PlayerState:
@@ -109,6 +123,24 @@ class PlayerState:
             jacks=jacks,
         )
 
+    def with_updates(self, **changes: Any) -> PlayerState:
+        """Return new state with several fields updated in one allocation.
+
+        Equivalent to chaining the individual ``with_*`` methods, but avoids
+        building an intermediate PlayerState for each step.
+
+        Raises:
+            TypeError: If a change names a field PlayerState doesn't have.
+        """
+        if not _PLAYER_FIELDS.issuperset(changes):
+            _reject_unknown_fields(changes, _PLAYER_FIELDS)
+        return PlayerState(
+            hand=changes.get("hand", self.hand),
+            points_field=changes.get("points_field", self.points_field),
+            permanents=changes.get("permanents", self.permanents),
+            jacks=changes.get("jacks", self.jacks),
+        )
+
 
 @dataclass(frozen=True, slots=True)
 class CounterState:
@@ -224,6 +256,15 @@ class GameState:
         """Whether the game has ended."""
         return self.winner is not None
 
+    @property
+    def acting_player(self) -> int:
+        """Player who must make the next move.
+
+        Can differ from current_player in the COUNTER, DISCARD_FOUR and
+        RESOLVE_SEVEN phases.
+        """
+        return _ACTING_PLAYER.get(self.phase, _current_player)(self)
+
     def point_threshold(self, player: int) -> int:
         """Point threshold for a player to win (21 minus 7 per King)."""
         kings = self.players[player].kings_count
@@ -445,6 +486,58 @@ class GameState:
             win_reason=win_reason,
         )
 
+    def with_updates(self, **changes: Any) -> GameState:
+        """Return new state with several fields updated in one allocation.
+
+        Equivalent to chaining the individual ``with_*`` methods, but avoids
+        building an intermediate GameState for each step. Used on the
+        executor's hot path, where a single move touches several fields.
+
+        Raises:
+            TypeError: If a change names a field GameState doesn't have.
+        """
+        if not _GAME_FIELDS.issuperset(changes):
+            _reject_unknown_fields(changes, _GAME_FIELDS)
+        return GameState(
+            players=changes.get("players", self.players),
+            deck=changes.get("deck", self.deck),
+            scrap=changes.get("scrap", self.scrap),
+            current_player=changes.get("current_player", self.current_player),
+            phase=changes.get("phase", self.phase),
+            turn_number=changes.get("turn_number", self.turn_number),
+            consecutive_passes=changes.get("consecutive_passes", self.consecutive_passes),
+            counter_state=changes.get("counter_state", self.counter_state),
+            seven_state=changes.get("seven_state", self.seven_state),
+            four_state=changes.get("four_state", self.four_state),
+            winner=changes.get("winner", self.winner),
+            win_reason=changes.get("win_reason", self.win_reason),
+        )
+
+
+# Fields with_updates accepts; anything else is a typo that would otherwise
+# be silently dropped
+_PLAYER_FIELDS = frozenset(f.name for f in fields(PlayerState) if f.init)
+_GAME_FIELDS = frozenset(f.name for f in fields(GameState) if f.init)
+
+
+def _reject_unknown_fields(changes: dict[str, Any], known: frozenset[str]) -> None:
+    unknown = sorted(set(changes) - known)
+    raise TypeError(f"with_updates() got unexpected field(s): {', '.join(unknown)}")
+
+
+# Phases whose mover isn't current_player; a dict lookup is cheaper than
+# comparing IntEnum members in a branch chain every turn. Each phase
+# guarantees its sub-state is set, hence the untyped state argument.
+_ACTING_PLAYER: dict[GamePhase, Callable[[Any], int]] = {
+    GamePhase.COUNTER: lambda s: s.counter_state.waiting_for_player,
+    GamePhase.DISCARD_FOUR: lambda s: s.four_state.player,
+    GamePhase.RESOLVE_SEVEN: lambda s: s.seven_state.player,
+}
+
+
+def _current_player(state: GameState) -> int:
+    return state.current_player
+
 
 def create_initial_state(deck: list[Card] | None = None, seed: int | None = None) -> GameState:
     """Create the initial game state.
@@ -456,8 +549,6 @@ def create_initial_state(deck: list[Card] | None = None, seed: int | None = None
     Returns:
         Initial game state with cards dealt.
     """
-    from cuttle_engine.cards import create_deck, shuffle_deck
-
     if deck is None:
         deck = shuffle_deck(create_deck(), seed)
 
@@ -381,6 +381,28 @@ class GameRepository:
         )
         self.db.commit()
 
+    def add_moves(
+        self,
+        moves: list[tuple[str, int, int, int, str, str, str | None, str | None, str | None]],
+    ) -> None:
+        """Add many move records in one transaction.
+
+        Args:
+            moves: Tuples in add_move argument order: (game_id, move_number,
+                turn, player, phase, move_description, state_json,
+                mcts_stats_json, llm_thinking_json).
+        """
+        with self.db.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO game_moves (
+                    game_id, move_number, turn, player, phase,
+                    move_description, state_json, mcts_stats_json, llm_thinking_json
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                moves,
+            )
+
     def get_moves(self, game_id: str) -> list[MoveRecord]:
         """Get all moves for a game."""
         rows = self.db.execute(
@@ -483,6 +505,22 @@ class EloRepository:
         self.db.commit()
         return self.get_latest_rating(player_id, rating_pool)
 
+    def add_ratings(self, ratings: list[tuple[str, float, str, int]]) -> None:
+        """Add many rating records in one transaction.
+
+        Args:
+            ratings: (player_id, rating, rating_pool, games_played) tuples,
+                inserted in order.
+        """
+        with self.db.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO elo_ratings (player_id, rating, rating_pool, games_played)
+                VALUES (?, ?, ?, ?)
+                """,
+                ratings,
+            )
+
     def get_rating_history(
         self,
         player_id: str,
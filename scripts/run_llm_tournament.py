@@ -371,6 +371,14 @@ def main() -> None:
     except ImportError:
         pass
 
+    # Use libuv's faster event loop when available
+    if sys.platform != "win32":
+        try:
+            import uvloop  # type: ignore[import-not-found]
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
     # Execute appropriate mode
     if args.leaderboard:
         show_leaderboard(args)
@@ -11,6 +11,9 @@ Examples:
     # Use 8 workers and 500 MCTS iterations
     python scripts/train_with_mcts.py --games 100 --workers 8 --iterations 500
 
+    # Send results back 16 games at a time (less parent-side overhead)
+    python scripts/train_with_mcts.py --games 10000 --batch-size 16
+
     # Specify output directory
     python scripts/train_with_mcts.py --games 100 --output training_data
 """
@@ -18,14 +21,21 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import logging
 import sys
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from training.parallel_runner import BatchProgress
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+logger = logging.getLogger("mcts")
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -77,15 +87,21 @@ def parse_args() -> argparse.Namespace:
         default=0,
         help="Starting random seed (default: 0)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Games per worker task before reporting back (default: 1)",
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
-        help="Suppress progress output",
+        help="Suppress startup banner and progress output",
     )
     return parser.parse_args()
 
 
-def print_progress(game_data: dict, progress) -> None:
+def print_progress(game_data: dict[str, Any], progress: BatchProgress) -> None:
     """Print progress update."""
     winner_str = "draw" if game_data["winner"] is None else f"P{game_data['winner']}"
     elapsed = progress.elapsed_seconds
@@ -109,47 +125,61 @@ def print_progress(game_data: dict, progress) -> None:
 def main() -> int:
     args = parse_args()
 
+    # Worker processes forward their log records here (see ParallelGameRunner)
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format="%(message)s",
+    )
+
     # Import here to avoid slow import on --help
-    from training.data_collector import DataCollector
+    from training.data_collector import DataCollector, RunningStatistics
     from training.parallel_runner import ParallelGameRunner
 
-    print(f"Starting MCTS training data collection")
-    print(f"  Games: {args.games}")
-    print(f"  Workers: {args.workers or 'auto'}")
-    print(f"  MCTS iterations: {args.iterations}")
-    print(f"  MCTS player: {args.mcts_player}")
-    print(f"  Opponent: {args.opponent}")
-    print(f"  Output: {args.output}/")
-    print()
+    logger.info("Starting MCTS training data collection")
+    logger.info("  Games: %d", args.games)
+    logger.info("  Workers: %s", args.workers or "auto")
+    logger.info("  MCTS iterations: %d", args.iterations)
+    logger.info("  MCTS player: %d", args.mcts_player)
+    logger.info("  Opponent: %s", args.opponent)
+    logger.info("  Batch size: %d", args.batch_size)
+    logger.info("  Output: %s/\n", args.output)
 
     runner = ParallelGameRunner(num_workers=args.workers)
     collector = DataCollector(Path(args.output))
 
-    callback = None if args.quiet else print_progress
+    # Convert and summarize each game as it arrives, so no second pass
+    # over the results is needed once the run finishes
+    histories = []
+    running_stats = RunningStatistics()
+
+    def on_game(game_data: dict[str, Any], progress: BatchProgress) -> None:
+        history = collector.collect_from_game_data(game_data)
+        histories.append(history)
+        running_stats.add(history)
+        if not args.quiet:
+            print_progress(game_data, progress)
 
     start_time = time.perf_counter()
 
     # Run games with MCTS statistics collection
-    game_data_list = runner.run_games_with_mcts_stats(
+    runner.run_games_with_mcts_stats(
         mcts_player=args.mcts_player,
         opponent_strategy_name=args.opponent,
         num_games=args.games,
         mcts_iterations=args.iterations,
-        callback=callback,
+        callback=on_game,
         start_seed=args.seed,
+        batch_size=args.batch_size,
     )
 
     if not args.quiet:
         print()  # Newline after progress
 
     elapsed = time.perf_counter() - start_time
-    print(f"\nCompleted {len(game_data_list)} games in {elapsed:.1f}s")
-
-    # Convert to GameHistory objects
-    histories = [collector.collect_from_game_data(gd) for gd in game_data_list]
+    print(f"\nCompleted {len(histories)} games in {elapsed:.1f}s")
 
     # Print statistics
-    stats = collector.get_statistics(histories)
+    stats = running_stats.to_dict()
     print(f"\nResults:")
     print(f"  MCTS wins: {stats['mcts_wins']}/{stats['num_games']} ({stats['mcts_win_rate']*100:.1f}%)")
     print(f"  Total MCTS moves collected: {stats['total_mcts_moves']}")
@@ -7,15 +7,23 @@ Usage:
     python scripts/view_game.py random    # View a random game
 """
 
+import io
+import os
 import sys
 import random
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from cuttle_engine.state import create_initial_state, GamePhase
 from cuttle_engine.move_generator import generate_legal_moves
 from cuttle_engine.executor import execute_move, IllegalMoveError
 from strategies.random_strategy import RandomStrategy
 
+# Call a game a draw once this many consecutive moves change neither
+# player's points nor the deck size, rather than playing on to the cap
+STALL_LIMIT = 30
 
-def view_game(seed, detailed=True):
+
+def view_game(seed: int, detailed: bool = True) -> None:
     """Run and display a single game."""
     state = create_initial_state(seed=seed)
     strategy = RandomStrategy(seed=seed * 2)
@@ -32,7 +40,19 @@ def view_game(seed, detailed=True):
         print()
 
     turn = 0
+    last_progress = None
+    stalled = 0
     while not state.is_game_over and turn < 500:
+        progress = (state.players[0].point_total, state.players[1].point_total, len(state.deck))
+        if progress != last_progress:
+            last_progress = progress
+            stalled = 0
+        else:
+            stalled += 1
+            if stalled >= STALL_LIMIT:
+                print(f"STALLED - no progress in {STALL_LIMIT} moves, calling it a draw")
+                break
+
         # Determine acting player
         if state.phase == GamePhase.COUNTER:
             acting = state.counter_state.waiting_for_player
@@ -100,7 +120,18 @@ def view_game(seed, detailed=True):
     print()
 
 
-def main():
+def render_game(seed: int, detailed: bool = False) -> str:
+    """Run a game and return its printed output as a string.
+
+    Used by worker processes so the parent can print games in seed order.
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        view_game(seed, detailed=detailed)
+    return buffer.getvalue()
+
+
+def main() -> None:
     if len(sys.argv) < 2:
         print(__doc__)
         sys.exit(1)
@@ -116,8 +147,15 @@ def main():
     elif "-" in arg and arg[0].isdigit():
         # Range: e.g., "100-105"
         start, end = map(int, arg.split("-"))
-        for seed in range(start, end + 1):
-            view_game(seed, detailed=False)
+        seeds = range(start, end + 1)
+        if not seeds:
+            # Reversed range (e.g. "105-100"): nothing to play
+            return
+        # Games are independent, so play them across cores
+        workers = min(len(seeds), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for output in pool.map(render_game, seeds):
+                print(output, end="")
     else:
         # Single seed
         seed = int(arg)
@@ -6,7 +6,9 @@ from simulation.runner import (
     GameRunner,
     MoveRecord,
     save_game_log,
+    load_game_log,
     run_batch,
+    run_batch_parallel,
 )
 from simulation.tournament import (
     MatchResult,
@@ -31,7 +33,9 @@ __all__ = [
     "GameRunner",
     "MoveRecord",
     "save_game_log",
+    "load_game_log",
     "run_batch",
+    "run_batch_parallel",
     # tournament
     "MatchResult",
     "TournamentResult",
@@ -3,23 +3,29 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
+import os
 import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, cast
 
 from cuttle_engine.executor import execute_move
-from cuttle_engine.move_generator import generate_legal_moves
-from cuttle_engine.state import GamePhase, create_initial_state
+from cuttle_engine.move_generator import get_legal_moves
+from cuttle_engine.state import PHASE_NAMES, create_initial_state
+from core import serialization
 from core.cost_tracker import BudgetExceededError, CostTracker
 from core.elo_manager import EloManager
 from core.game_logger import PersistentGameLogger
 from core.player_identity import PlayerIdentity
 from db.database import Database, TournamentRepository
+from strategies.base import SupportsAsyncSelect, SupportsThinking
 
 if TYPE_CHECKING:
     from cuttle_engine.moves import Move
@@ -28,6 +34,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Matches between full checkpoint snapshots; journal appends fill the gaps
+CHECKPOINT_COMPACT_MATCHES = 10
+
 
 @dataclass
 class StrategySpec:
@@ -42,7 +51,7 @@ class TournamentConfig:
     """Configuration for an LLM tournament."""
     strategies: list[StrategySpec]
     games_per_match: int = 10
-    parallel_games: int = 4
+    parallel_games: int = 4  # Concurrent games (each builds its own strategies)
     budget_usd: float | None = None
     rate_limit_rpm: int = 60  # Requests per minute
     max_turns_per_game: int = 500
@@ -85,6 +94,10 @@ class TournamentConfig:
             log_moves=data.get("log_moves", True),
         )
 
+    def schedule(self) -> list[list[tuple[str, str]]]:
+        """Round-robin schedule as rounds of disjoint (name_a, name_b) pairs."""
+        return _round_robin_rounds([s.name for s in self.strategies])
+
 
 @dataclass
 class MatchResult:
@@ -114,21 +127,35 @@ class TournamentResult:
 
 
 class RateLimiter:
-    """Simple rate limiter for API calls."""
+    """Token-bucket rate limiter for API calls.
+
+    Up to ``requests_per_minute`` tokens accumulate, so parallel games can
+    burst to the provider limit; tokens refill at ``requests_per_minute / 60``
+    per second.
+    """
 
     def __init__(self, requests_per_minute: int):
         self._rpm = requests_per_minute
-        self._interval = 60.0 / requests_per_minute
-        self._last_request = 0.0
+        self._rate = requests_per_minute / 60.0
+        self._capacity = float(requests_per_minute)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
         self._lock = asyncio.Lock()
 
     async def acquire(self) -> None:
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self._last_request
-            if elapsed < self._interval:
-                await asyncio.sleep(self._interval - elapsed)
-            self._last_request = time.time()
+        while True:
+            # Only the bookkeeping is locked; waiters sleep outside it
+            async with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._last_refill) * self._rate
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            await asyncio.sleep(wait)
 
 
 class LLMTournamentRunner:
@@ -172,68 +199,38 @@ class LLMTournamentRunner:
         self._rate_limiter = RateLimiter(config.rate_limit_rpm)
 
         # State
+        self._specs: dict[str, StrategySpec] = {}
         self._strategies: dict[str, Strategy] = {}
         self._identities: dict[str, PlayerIdentity] = {}
         self._matches: list[MatchResult] = []
         self._cancelled = False
+        self._game_slots = asyncio.Semaphore(max(1, config.parallel_games))
         self._completed_games: set[tuple[str, str, int]] = set()  # (a, b, game_num)
+        self._schedule: list[list[tuple[str, str]]] | None = None
+
+        # Checkpoint progress (what the snapshot and journal already hold)
+        self._snapshot_matches = 0
+        self._journaled_matches = 0
+        self._journaled_games: set[tuple[str, str, int]] = set()
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+
+        # select_move executors, created per run()
+        self._llm_pool: ThreadPoolExecutor | None = None
+        self._cpu_pool: ThreadPoolExecutor | None = None
+        self._mcts_pool: ProcessPoolExecutor | None = None
 
     def _create_strategy(self, spec: StrategySpec) -> Strategy:
         """Create a strategy instance from a specification."""
         factory = spec.factory.lower()
 
-        if factory == "random":
-            from strategies.random_strategy import RandomStrategy
-            return RandomStrategy(seed=spec.params.get("seed"))
-
-        elif factory == "heuristic":
-            from strategies.heuristic import HeuristicStrategy
-            return HeuristicStrategy(seed=spec.params.get("seed"))
-
-        elif factory == "mcts":
-            from strategies.mcts import MCTSStrategy
-            return MCTSStrategy(
-                iterations=spec.params.get("iterations", 1000),
-                exploration_constant=spec.params.get("exploration", 1.414),
-                num_workers=spec.params.get("num_workers", 1),
-            )
-
-        elif factory == "ismcts":
-            from strategies.ismcts import ISMCTSStrategy
-            return ISMCTSStrategy(
-                iterations=spec.params.get("iterations", 1000),
-                exploration_constant=spec.params.get("exploration", 0.7),
-            )
-
-        elif factory.startswith("llm-anthropic"):
-            from strategies.llm import create_llm_strategy
-            return create_llm_strategy(
-                provider="anthropic",
-                model=spec.params.get("model", "haiku"),
-                temperature=spec.params.get("temperature", 0.3),
-                cost_tracker=self._cost_tracker,
-            )
-
-        elif factory.startswith("llm-openrouter"):
-            from strategies.llm import create_llm_strategy
-            return create_llm_strategy(
-                provider="openrouter",
-                model=spec.params.get("model", "qwen3-235b"),
-                temperature=spec.params.get("temperature", 0.3),
-                cost_tracker=self._cost_tracker,
-            )
-
-        elif factory.startswith("llm-ollama"):
-            from strategies.llm import create_llm_strategy
-            return create_llm_strategy(
-                provider="ollama",
-                model=spec.params.get("model", "llama3.3"),
-                temperature=spec.params.get("temperature", 0.3),
-            )
-
-        else:
+        # LLM factories match on provider prefix (e.g. "llm-anthropic-haiku")
+        key = "-".join(factory.split("-")[:2]) if factory.startswith("llm-") else factory
+        builder = _STRATEGY_BUILDERS.get(key)
+        if builder is None:
             raise ValueError(f"Unknown strategy factory: {factory}")
 
+        return builder(spec.params, self._cost_tracker)
+
     async def run(self) -> TournamentResult:
         """Run the tournament.
 
@@ -242,13 +239,16 @@ class LLMTournamentRunner:
         """
         start_time = time.perf_counter()
 
-        # Create or update tournament record
+        # Create or update tournament record. The schedule is stored with the
+        # config so a resumed run plays the same rounds in the same order.
+        if self._schedule is None:
+            self._schedule = self.config.schedule()
         tournament = self._tournament_repo.get(self.tournament_id)
         if tournament is None:
             self._tournament_repo.create(
                 tournament_id=self.tournament_id,
                 name=f"Tournament {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-                config=self.config.to_dict(),
+                config={**self.config.to_dict(), "schedule": self._schedule},
                 budget_usd=self.config.budget_usd,
             )
         self._tournament_repo.update_status(self.tournament_id, "running")
@@ -258,33 +258,75 @@ class LLMTournamentRunner:
         for spec in self.config.strategies:
             strategy = self._create_strategy(spec)
             identity = PlayerIdentity.from_strategy(strategy)
+            self._specs[spec.name] = spec
             self._strategies[spec.name] = strategy
             self._identities[spec.name] = identity
             logger.info(f"  {spec.name}: {identity.display_name}")
 
-        # Run round-robin matches
+        # Run round-robin matches. Matches within a round share no strategy,
+        # so they run concurrently; games across all of them share the
+        # tournament-wide parallel_games limit.
         strategy_names = list(self._strategies.keys())
         total_matches = len(strategy_names) * (len(strategy_names) - 1) // 2
+        self._game_slots = asyncio.Semaphore(max(1, self.config.parallel_games))
+        self._llm_pool = ThreadPoolExecutor(
+            max_workers=max(1, self.config.parallel_games) * 2, thread_name_prefix="llm"
+        )
+        self._cpu_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="strategy"
+        )
+        # Worker processes are costly to start, so only when MCTS players need them
+        self._mcts_pool = (
+            ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+            if any(_runs_in_mcts_pool(s) for s in self._strategies.values())
+            else None
+        )
 
         logger.info(f"Running {total_matches} matches, {self.config.games_per_match} games each...")
 
         try:
-            for i, name_a in enumerate(strategy_names):
-                for name_b in strategy_names[i + 1:]:
-                    if self._cancelled:
-                        break
+            for round_pairs in self._schedule:
+                if self._cancelled:
+                    break
+
+                # Skip matches finished before a resume
+                finished = {(m.strategy_a, m.strategy_b) for m in self._matches}
+                round_pairs = [pair for pair in round_pairs if pair not in finished]
+                if not round_pairs:
+                    continue
+
+                # return_exceptions keeps sibling matches from running on
+                # unsupervised if one fails outside its games
+                outcomes = await asyncio.gather(
+                    *(self._play_match(name_a, name_b) for name_a, name_b in round_pairs),
+                    return_exceptions=True,
+                )
 
-                    match_result = await self._run_match(name_a, name_b)
-                    self._matches.append(match_result)
+                # Record in schedule order so ELO updates are deterministic
+                error: BaseException | None = None
+                for (name_a, name_b), outcome in zip(round_pairs, outcomes):
+                    if isinstance(outcome, BaseException):
+                        error = error or outcome
+                        continue
 
+                    games, match_error = outcome
+                    match_result = self._record_match(name_a, name_b, games)
+                    if match_error is not None:
+                        error = error or match_error
+                        continue
+
+                    self._matches.append(match_result)
                     logger.info(
                         f"Match complete: {name_a} vs {name_b} - "
                         f"{match_result.wins_a}-{match_result.wins_b} "
                         f"(${match_result.cost_usd:.4f})"
                     )
 
-                    # Save checkpoint
-                    self._save_checkpoint()
+                # Save checkpoint
+                await self._save_checkpoint()
+
+                if error is not None:
+                    raise error
 
         except BudgetExceededError as e:
             logger.warning(f"Budget exceeded: {e}")
@@ -294,6 +336,12 @@ class LLMTournamentRunner:
             logger.error(f"Tournament error: {e}")
             self._cancelled = True
 
+        finally:
+            self._llm_pool.shutdown(wait=False, cancel_futures=True)
+            self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+            if self._mcts_pool is not None:
+                self._mcts_pool.shutdown(wait=False, cancel_futures=True)
+
         # Calculate final ELO ratings
         elo_ratings = {}
         for name in strategy_names:
@@ -322,10 +370,57 @@ class LLMTournamentRunner:
             cancelled_reason="Budget exceeded" if self._cancelled else None,
         )
 
-    async def _run_match(self, name_a: str, name_b: str) -> MatchResult:
-        """Run a match between two strategies."""
-        strategy_a = self._strategies[name_a]
-        strategy_b = self._strategies[name_b]
+    async def _play_match(
+        self, name_a: str, name_b: str
+    ) -> tuple[list[tuple[int, dict[str, Any], bool]], BaseException | None]:
+        """Play the outstanding games of a match.
+
+        Games run concurrently, bounded by ``config.parallel_games`` so their
+        LLM round-trips overlap. On the first failure, games still in flight
+        are cancelled.
+
+        Returns:
+            Tuple of (finished games as (game_num, result, swap_perspective)
+            in game order, first error raised or None).
+        """
+        # Skip games already completed (for resume)
+        game_nums = [
+            game_num
+            for game_num in range(self.config.games_per_match)
+            if (name_a, name_b, game_num) not in self._completed_games
+        ]
+
+        tasks = [
+            asyncio.create_task(self._run_match_game(name_a, name_b, game_num))
+            for game_num in game_nums
+        ]
+
+        if tasks:
+            _, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        games: list[tuple[int, dict[str, Any], bool]] = []
+        error: BaseException | None = None
+        for game_num, task in zip(game_nums, tasks):
+            if task.cancelled():
+                continue
+            if task.exception() is not None:
+                error = error or task.exception()
+                continue
+            result, swap_perspective = task.result()
+            games.append((game_num, result, swap_perspective))
+
+        return games, error
+
+    def _record_match(
+        self,
+        name_a: str,
+        name_b: str,
+        games: list[tuple[int, dict[str, Any], bool]],
+    ) -> MatchResult:
+        """Tally finished games, update ELO in game order, and mark them done."""
         identity_a = self._identities[name_a]
         identity_b = self._identities[name_b]
 
@@ -335,34 +430,12 @@ class LLMTournamentRunner:
         total_turns = 0
         match_cost = 0.0
 
-        # Run games (could be parallelized in future)
-        for game_num in range(self.config.games_per_match):
-            # Check if already completed (for resume)
-            game_key = (name_a, name_b, game_num)
-            if game_key in self._completed_games:
-                continue
-
-            # Alternate starting player
-            if self.config.alternate_start and game_num % 2 == 1:
-                p0_strategy, p1_strategy = strategy_b, strategy_a
-                p0_identity, p1_identity = identity_b, identity_a
-                swap_perspective = True
-            else:
-                p0_strategy, p1_strategy = strategy_a, strategy_b
-                p0_identity, p1_identity = identity_a, identity_b
-                swap_perspective = False
-
-            # Apply rate limiting before game
-            await self._rate_limiter.acquire()
-
-            # Run the game
-            seed = hash((self.tournament_id, name_a, name_b, game_num)) % (2**31)
-            result = await self._run_single_game(
-                p0_strategy, p1_strategy,
-                p0_identity, p1_identity,
-                seed=seed,
-            )
+        pools = self._elo_manager.determine_rating_pools(
+            identity_a.provider, identity_b.provider
+        )
+        elo_games: list[tuple[str, str, int | None, list[str] | None]] = []
 
+        for game_num, result, swap_perspective in games:
             # Record result
             winner = result["winner"]
             if swap_perspective:
@@ -383,19 +456,17 @@ class LLMTournamentRunner:
             total_turns += result["turns"]
             match_cost += result.get("cost_usd", 0)
 
-            # Update ELO
+            # Queue ELO update
             game_winner = winner
             if swap_perspective and winner is not None:
                 game_winner = 1 - winner
 
-            pools = self._elo_manager.determine_rating_pools(
-                identity_a.provider, identity_b.provider
-            )
-            self._elo_manager.update_ratings_from_game(
-                identity_a.id, identity_b.id, game_winner, pools
-            )
+            elo_games.append((identity_a.id, identity_b.id, game_winner, pools))
 
-            self._completed_games.add(game_key)
+            self._completed_games.add((name_a, name_b, game_num))
+
+        # Apply the match's ELO updates in game order with one commit
+        self._elo_manager.update_ratings_from_games_batch(elo_games)
 
         total_games = wins_a + wins_b + draws
 
@@ -410,15 +481,66 @@ class LLMTournamentRunner:
             cost_usd=match_cost,
         )
 
+    async def _run_match_game(
+        self, name_a: str, name_b: str, game_num: int
+    ) -> tuple[dict[str, Any], bool]:
+        """Run one game of a match once a parallel-games slot is free.
+
+        Returns:
+            Tuple of (game result, whether strategy B played as player 0).
+        """
+        async with self._game_slots:
+            # Strategies keep per-game state (known cards, last_thinking, RNG
+            # streams), so every game gets its own instances: concurrent games
+            # can't share them, and a game plays the same whatever
+            # parallel_games is or which games ran before it
+            strategy_a = self._create_strategy(self._specs[name_a])
+            strategy_b = self._create_strategy(self._specs[name_b])
+            identity_a = self._identities[name_a]
+            identity_b = self._identities[name_b]
+            params_a = self._specs[name_a].params
+            params_b = self._specs[name_b].params
+
+            # Alternate starting player
+            if self.config.alternate_start and game_num % 2 == 1:
+                p0_strategy, p1_strategy = strategy_b, strategy_a
+                p0_identity, p1_identity = identity_b, identity_a
+                params = (params_b, params_a)
+                swap_perspective = True
+            else:
+                p0_strategy, p1_strategy = strategy_a, strategy_b
+                p0_identity, p1_identity = identity_a, identity_b
+                params = (params_a, params_b)
+                swap_perspective = False
+
+            # Apply rate limiting before game
+            await self._rate_limiter.acquire()
+
+            # Run the game
+            seed = _game_seed(self.tournament_id, name_a, name_b, game_num)
+            result = await self._run_single_game(
+                p0_strategy, p1_strategy,
+                p0_identity, p1_identity,
+                params,
+                seed=seed,
+            )
+
+        return result, swap_perspective
+
     async def _run_single_game(
         self,
         strategy0: Strategy,
         strategy1: Strategy,
         identity0: PlayerIdentity,
         identity1: PlayerIdentity,
+        params: tuple[dict[str, Any], dict[str, Any]],
         seed: int | None = None,
     ) -> dict[str, Any]:
-        """Run a single game."""
+        """Run a single game.
+
+        ``params`` holds each player's StrategySpec params, from which MCTS
+        players are rebuilt inside the process pool.
+        """
         game_id = str(uuid.uuid4())
         game_cost = 0.0
 
@@ -439,40 +561,58 @@ class LLMTournamentRunner:
         strategy1.on_game_start(state, 1)
 
         strategies = (strategy0, strategy1)
+
+        # Classify once per game rather than probing attributes every move
+        reports_thinking = tuple(isinstance(s, SupportsThinking) for s in strategies)
+        selects_async = tuple(isinstance(s, SupportsAsyncSelect) for s in strategies)
+        in_mcts_pool = tuple(_runs_in_mcts_pool(s) for s in strategies)
         move_count = 0
 
         # Game loop
         while not state.is_game_over and state.turn_number <= self.config.max_turns_per_game:
             # Determine who needs to act
-            if state.phase == GamePhase.COUNTER:
-                acting_player = state.counter_state.waiting_for_player
-            elif state.phase == GamePhase.DISCARD_FOUR:
-                acting_player = state.four_state.player
-            elif state.phase == GamePhase.RESOLVE_SEVEN:
-                acting_player = state.seven_state.player
-            else:
-                acting_player = state.current_player
+            acting_player = state.acting_player
 
             # Get legal moves
-            legal_moves = generate_legal_moves(state)
+            legal_moves = get_legal_moves(state)
             if not legal_moves:
                 break
 
             # Select move
             strategy = strategies[acting_player]
 
-            # Run in executor if it's an LLM strategy (to not block)
-            loop = asyncio.get_event_loop()
-            move = await loop.run_in_executor(
-                None, strategy.select_move, state, legal_moves
-            )
+            # Async strategies await their provider here, so concurrent games'
+            # requests share its client instead of a thread each. Everything
+            # else runs off the event loop: sync LLM calls wait on network IO,
+            # the rest is CPU work, and neither should queue behind the other.
+            # Plain MCTS searches go to processes so parallel games use all cores.
+            loop = asyncio.get_running_loop()
+            if selects_async[acting_player]:
+                move = await cast(SupportsAsyncSelect, strategy).aselect_move(
+                    state, legal_moves
+                )
+            elif in_mcts_pool[acting_player]:
+                move = await loop.run_in_executor(
+                    self._mcts_pool, _mcts_select_move,
+                    params[acting_player], state, legal_moves,
+                )
+            else:
+                pool = self._llm_pool if reports_thinking[acting_player] else self._cpu_pool
+                move = await loop.run_in_executor(
+                    pool, strategy.select_move, state, legal_moves
+                )
 
             # Get MCTS stats or LLM thinking
             mcts_stats = None
             llm_thinking = None
 
-            if hasattr(strategy, 'last_thinking') and strategy.last_thinking:
-                thinking = strategy.last_thinking
+            # reports_thinking holds the per-game isinstance check; cast
+            # carries its narrowing to the type checker
+            thinking = (
+                cast(SupportsThinking, strategy).last_thinking
+                if reports_thinking[acting_player] else None
+            )
+            if thinking:
                 llm_thinking = {
                     "response": thinking.response[:500],  # Truncate for storage
                     "model": thinking.model,
@@ -496,7 +636,7 @@ class LLMTournamentRunner:
                     game_id=game_id,
                     turn=state.turn_number,
                     player=acting_player,
-                    phase=state.phase.name,
+                    phase=PHASE_NAMES[state.phase],
                     move=move,
                     state=new_state,
                     mcts_stats=mcts_stats,
@@ -509,15 +649,19 @@ class LLMTournamentRunner:
 
             state = new_state
 
-        # End game
+        # End game; the logger serializes and writes its moves on the IO thread
         if self.config.log_moves:
-            self._game_logger.end_game(
-                game_id=game_id,
-                winner=state.winner,
-                win_reason=state.win_reason.name if state.win_reason else None,
-                score_p0=state.players[0].point_total,
-                score_p1=state.players[1].point_total,
-                turns=state.turn_number,
+            await asyncio.get_running_loop().run_in_executor(
+                self._io_executor,
+                functools.partial(
+                    self._game_logger.end_game,
+                    game_id=game_id,
+                    winner=state.winner,
+                    win_reason=state.win_reason.name if state.win_reason else None,
+                    score_p0=state.players[0].point_total,
+                    score_p1=state.players[1].point_total,
+                    turns=state.turn_number,
+                ),
             )
 
         # Notify strategies
@@ -535,31 +679,67 @@ class LLMTournamentRunner:
             "cost_usd": game_cost,
         }
 
-    def _save_checkpoint(self) -> None:
-        """Save tournament checkpoint for resume."""
-        checkpoint = {
-            "tournament_id": self.tournament_id,
-            "completed_games": list(self._completed_games),
-            "matches": [
-                {
-                    "strategy_a": m.strategy_a,
-                    "strategy_b": m.strategy_b,
-                    "wins_a": m.wins_a,
-                    "wins_b": m.wins_b,
-                    "draws": m.draws,
-                    "total_games": m.total_games,
-                    "avg_turns": m.avg_turns,
-                    "cost_usd": m.cost_usd,
-                }
-                for m in self._matches
-            ],
-        }
+    def _checkpoint_paths(self) -> tuple[Path, Path]:
+        """Return (snapshot, journal) checkpoint paths."""
+        base = Path(f"checkpoints/{self.tournament_id}")
+        return base.with_suffix(".json"), base.with_suffix(".jsonl")
 
-        checkpoint_path = Path(f"checkpoints/{self.tournament_id}.json")
-        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+    def _serialize_checkpoint(self) -> tuple[bool, bytes]:
+        """Serialize checkpoint changes since the last call.
 
-        with open(checkpoint_path, "w") as f:
-            json.dump(checkpoint, f, indent=2)
+        Returns the full snapshot every ``CHECKPOINT_COMPACT_MATCHES`` matches,
+        otherwise just the new journal lines.
+
+        Returns:
+            Tuple of (is_snapshot, payload).
+        """
+        if len(self._matches) - self._snapshot_matches >= CHECKPOINT_COMPACT_MATCHES:
+            checkpoint = {
+                "tournament_id": self.tournament_id,
+                "completed_games": list(self._completed_games),
+                "matches": [_match_to_dict(m) for m in self._matches],
+            }
+            payload = serialization.dumps(checkpoint)
+
+            self._snapshot_matches = len(self._matches)
+            self._journaled_matches = len(self._matches)
+            self._journaled_games = set(self._completed_games)
+            return True, payload
+
+        lines = [
+            serialization.dumps({"game": list(g)})
+            for g in self._completed_games - self._journaled_games
+        ]
+        # Index lets replay skip matches already in the snapshot
+        lines.extend(
+            serialization.dumps({"index": i, "match": _match_to_dict(m)})
+            for i, m in enumerate(self._matches[self._journaled_matches:], self._journaled_matches)
+        )
+
+        self._journaled_matches = len(self._matches)
+        self._journaled_games = set(self._completed_games)
+        return False, b"".join(line + b"\n" for line in lines)
+
+    async def _save_checkpoint(self) -> None:
+        """Save tournament checkpoint for resume.
+
+        State is serialized on the event loop; the file IO runs on a
+        dedicated single-thread executor, which also keeps writes in order.
+        """
+        is_snapshot, payload = self._serialize_checkpoint()
+        if not is_snapshot and not payload:
+            return
+
+        snapshot_path, journal_path = self._checkpoint_paths()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._io_executor,
+            _write_checkpoint,
+            snapshot_path,
+            journal_path,
+            is_snapshot,
+            payload,
+        )
 
     @classmethod
     def resume(
@@ -582,15 +762,19 @@ class LLMTournamentRunner:
         if tournament is None:
             raise ValueError(f"Tournament not found: {tournament_id}")
 
-        config = TournamentConfig.from_dict(json.loads(tournament.config_json))
+        config_data = json.loads(tournament.config_json)
+        config = TournamentConfig.from_dict(config_data)
 
         runner = cls(config, db, tournament_id)
+        if "schedule" in config_data:
+            runner._schedule = [
+                [(a, b) for a, b in round_pairs] for round_pairs in config_data["schedule"]
+            ]
 
-        # Load checkpoint
-        checkpoint_path = Path(f"checkpoints/{tournament_id}.json")
-        if checkpoint_path.exists():
-            with open(checkpoint_path, "r") as f:
-                checkpoint = json.load(f)
+        # Load checkpoint: latest snapshot, then replay the journal tail
+        snapshot_path, journal_path = runner._checkpoint_paths()
+        if snapshot_path.exists():
+            checkpoint = serialization.loads(snapshot_path.read_bytes())
 
             runner._completed_games = set(
                 tuple(g) for g in checkpoint.get("completed_games", [])
@@ -599,8 +783,214 @@ class LLMTournamentRunner:
                 MatchResult(**m) for m in checkpoint.get("matches", [])
             ]
 
+        if journal_path.exists():
+            with open(journal_path, "rb") as f:
+                for line in f:
+                    try:
+                        entry = serialization.loads(line)
+                    except ValueError:
+                        break  # Torn final write
+                    if "game" in entry:
+                        runner._completed_games.add(tuple(entry["game"]))
+                    elif entry["index"] >= len(runner._matches):
+                        runner._matches.append(MatchResult(**entry["match"]))
+
+        runner._snapshot_matches = len(runner._matches)
+        runner._journaled_matches = len(runner._matches)
+        runner._journaled_games = set(runner._completed_games)
+
         return runner
 
     def cancel(self) -> None:
         """Cancel the tournament."""
         self._cancelled = True
+
+
+def _game_seed(tournament_id: str, name_a: str, name_b: str, game_num: int) -> int:
+    """Derive a game's seed from its place in the tournament.
+
+    Unlike hash(), this is stable across processes and PYTHONHASHSEED, so a
+    resumed tournament replays the same deals.
+    """
+    key = f"{tournament_id}|{name_a}|{name_b}|{game_num}".encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little") & 0x7FFFFFFF
+
+
+def _build_random(params: dict[str, Any], cost_tracker: CostTracker) -> Strategy:
+    from strategies.random_strategy import RandomStrategy
+    return RandomStrategy(seed=params.get("seed"))
+
+
+def _build_heuristic(params: dict[str, Any], cost_tracker: CostTracker) -> Strategy:
+    from strategies.heuristic import HeuristicStrategy
+    return HeuristicStrategy(seed=params.get("seed"))
+
+
+def _mcts_options(params: dict[str, Any]) -> dict[str, Any]:
+    """MCTSStrategy keyword arguments for an "mcts" spec's params."""
+    return {
+        "iterations": params.get("iterations", 1000),
+        "exploration_constant": params.get("exploration", 1.414),
+        "max_simulation_depth": params.get("max_simulation_depth", 200),
+        "num_workers": params.get("num_workers", 1),
+    }
+
+
+def _build_mcts(params: dict[str, Any], cost_tracker: CostTracker) -> Strategy:
+    from strategies.mcts import MCTSStrategy
+    return MCTSStrategy(**_mcts_options(params))
+
+
+def _build_ismcts(params: dict[str, Any], cost_tracker: CostTracker) -> Strategy:
+    from strategies.ismcts import ISMCTSStrategy
+    return ISMCTSStrategy(
+        iterations=params.get("iterations", 1000),
+        exploration_constant=params.get("exploration", 0.7),
+    )
+
+
+def _build_llm_anthropic(params: dict[str, Any], cost_tracker: CostTracker) -> Strategy:
+    from strategies.llm import create_llm_strategy
+    return create_llm_strategy(
+        provider="anthropic",
+        model=params.get("model", "haiku"),
+        temperature=params.get("temperature", 0.3),
+        cost_tracker=cost_tracker,
+    )
+
+
+def _build_llm_openrouter(params: dict[str, Any], cost_tracker: CostTracker) -> Strategy:
+    from strategies.llm import create_llm_strategy
+    return create_llm_strategy(
+        provider="openrouter",
+        model=params.get("model", "qwen3-235b"),
+        temperature=params.get("temperature", 0.3),
+        cost_tracker=cost_tracker,
+    )
+
+
+def _build_llm_ollama(params: dict[str, Any], cost_tracker: CostTracker) -> Strategy:
+    from strategies.llm import create_llm_strategy
+    return create_llm_strategy(
+        provider="ollama",
+        model=params.get("model", "llama3.3"),
+        temperature=params.get("temperature", 0.3),
+    )
+
+
+# Strategy factory name -> builder. Imports stay inside the builders so
+# optional LLM SDKs load only when a tournament uses them.
+_STRATEGY_BUILDERS: dict[str, Callable[[dict[str, Any], CostTracker], Strategy]] = {
+    "random": _build_random,
+    "heuristic": _build_heuristic,
+    "mcts": _build_mcts,
+    "ismcts": _build_ismcts,
+    "llm-anthropic": _build_llm_anthropic,
+    "llm-openrouter": _build_llm_openrouter,
+    "llm-ollama": _build_llm_ollama,
+}
+
+
+# MCTS strategies rebuilt inside each pool process, keyed by their options
+_worker_mcts: dict[tuple[tuple[str, Any], ...], Strategy] = {}
+
+
+def _runs_in_mcts_pool(strategy: Strategy) -> bool:
+    """Whether a strategy's moves can be searched in the MCTS process pool.
+
+    Only unseeded, serial MCTSStrategy qualifies: it keeps no game state
+    between moves, so a worker-side copy picks the same kind of move.
+    Seeded instances must keep their own RNG stream, and num_workers > 1
+    already runs its own process pool.
+    """
+    from strategies.mcts import MCTSStrategy
+
+    return (
+        type(strategy) is MCTSStrategy
+        and strategy._num_workers == 1
+        and strategy._seed is None
+    )
+
+
+def _mcts_select_move(
+    params: dict[str, Any], state: GameState, legal_moves: list[Move]
+) -> Move:
+    """Select a move with MCTS in a worker process.
+
+    The strategy is rebuilt from its spec's params, exactly as _build_mcts
+    built the caller's copy.
+    """
+    from strategies.mcts import MCTSStrategy
+
+    options = _mcts_options(params)
+    key = tuple(sorted(options.items()))
+    strategy = _worker_mcts.get(key)
+    if strategy is None:
+        strategy = MCTSStrategy(**options)
+        _worker_mcts[key] = strategy
+    return strategy.select_move(state, legal_moves)
+
+
+def _write_checkpoint(
+    snapshot_path: Path, journal_path: Path, is_snapshot: bool, payload: bytes
+) -> None:
+    """Write checkpoint data (blocking; run off the event loop)."""
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    if is_snapshot:
+        tmp_path = snapshot_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(payload)
+        tmp_path.replace(snapshot_path)
+        journal_path.unlink(missing_ok=True)
+    else:
+        with open(journal_path, "ab") as f:
+            f.write(payload)
+
+
+def _match_to_dict(m: MatchResult) -> dict[str, Any]:
+    """Serialize a match result for the checkpoint."""
+    return {
+        "strategy_a": m.strategy_a,
+        "strategy_b": m.strategy_b,
+        "wins_a": m.wins_a,
+        "wins_b": m.wins_b,
+        "draws": m.draws,
+        "total_games": m.total_games,
+        "avg_turns": m.avg_turns,
+        "cost_usd": m.cost_usd,
+    }
+
+
+def _round_robin_rounds(names: list[str]) -> list[list[tuple[str, str]]]:
+    """Schedule a round-robin with the circle method.
+
+    Each round is a set of disjoint pairs, so its matches can run at the
+    same time. Every pair appears exactly once, ordered as in ``names``
+    (so seeds and resume keys match the plain nested-loop order).
+
+    Args:
+        names: Strategy names.
+
+    Returns:
+        List of rounds, each a list of (name_a, name_b) pairs.
+    """
+    order = {name: i for i, name in enumerate(names)}
+    slots: list[str | None] = list(names)
+    if len(slots) % 2 == 1:
+        slots.append(None)  # Bye
+
+    rounds = []
+    n = len(slots)
+    for _ in range(n - 1):
+        pairs = []
+        for i in range(n // 2):
+            a, b = slots[i], slots[n - 1 - i]
+            if a is None or b is None:
+                continue
+            if order[a] > order[b]:
+                a, b = b, a
+            pairs.append((a, b))
+        rounds.append(pairs)
+        # Keep the first slot fixed and rotate the rest
+        slots = [slots[0], slots[-1]] + slots[1:-1]
+
+    return rounds
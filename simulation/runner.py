@@ -2,20 +2,27 @@
 
 from __future__ import annotations
 
-import json
+import os
+import sys
+import time
 import uuid
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from core import serialization
+from cuttle_engine.cards import card_strings
 from cuttle_engine.executor import execute_move
-from cuttle_engine.move_generator import generate_legal_moves
-from cuttle_engine.state import GamePhase, create_initial_state
+from cuttle_engine.move_generator import get_legal_moves
+from cuttle_engine.moves import MoveType
+from cuttle_engine.state import PHASE_NAMES, create_initial_state
 
 if TYPE_CHECKING:
     from cuttle_engine.moves import Move
-    from cuttle_engine.state import GameState
+    from cuttle_engine.state import GameState, PlayerState
     from strategies.base import Strategy
 
 
@@ -41,6 +48,7 @@ class MoveRecord:
     turn: int
     player: int
     move: str
+    move_type: MoveType
     state_after: dict
 
 
@@ -79,6 +87,12 @@ class GameRunner:
         self.max_turns = max_turns
         self.log_moves = log_moves
 
+        # Last logged dict per player; the executor keeps the PlayerState of
+        # the player a move doesn't touch, so most turns reuse one of them.
+        self._player_dicts: list[tuple[PlayerState | None, dict[str, Any]]] = [
+            (None, {}), (None, {})
+        ]
+
     def run_game(self, seed: int | None = None) -> tuple[GameResult, GameLog | None]:
         """Run a single game.
 
@@ -88,13 +102,12 @@ class GameRunner:
         Returns:
             Tuple of (result, log). Log is None if log_moves is False.
         """
-        import time
-
         start_time = time.perf_counter()
         game_id = str(uuid.uuid4())
 
         # Initialize game
         state = create_initial_state(seed=seed)
+        self._player_dicts = [(None, {}), (None, {})]
 
         # Notify strategies
         for i, strategy in enumerate(self.strategies):
@@ -116,17 +129,10 @@ class GameRunner:
         # Game loop
         while not state.is_game_over and state.turn_number <= self.max_turns:
             # Determine who needs to act
-            if state.phase == GamePhase.COUNTER:
-                acting_player = state.counter_state.waiting_for_player
-            elif state.phase == GamePhase.DISCARD_FOUR:
-                acting_player = state.four_state.player
-            elif state.phase == GamePhase.RESOLVE_SEVEN:
-                acting_player = state.seven_state.player
-            else:
-                acting_player = state.current_player
+            acting_player = state.acting_player
 
             # Get legal moves
-            legal_moves = generate_legal_moves(state)
+            legal_moves = get_legal_moves(state)
 
             if not legal_moves:
                 # Shouldn't happen in a valid game
@@ -147,6 +153,7 @@ class GameRunner:
                         turn=state.turn_number,
                         player=acting_player,
                         move=str(move),
+                        move_type=move.move_type,
                         state_after=self._state_to_dict(new_state),
                     )
                 )
@@ -185,32 +192,44 @@ class GameRunner:
         return result, game_log
 
     def _state_to_dict(self, state: GameState) -> dict:
-        """Convert game state to a dictionary for logging."""
+        """Convert game state to a dictionary for logging.
+
+        Player entries are shared with earlier records while that player's
+        state is unchanged, so treat logged dicts as read-only.
+        """
         return {
             "turn": state.turn_number,
             "current_player": state.current_player,
-            "phase": state.phase.name,
+            "phase": PHASE_NAMES[state.phase],
             "deck_size": len(state.deck),
             "scrap_size": len(state.scrap),
-            "players": [
-                {
-                    "hand": [str(c) for c in p.hand],
-                    "points": [str(c) for c in p.points_field],
-                    "permanents": [str(c) for c in p.permanents],
-                    "jacks": [(str(j), str(s)) for j, s in p.jacks],
-                    "point_total": p.point_total,
-                }
-                for p in state.players
-            ],
+            "players": [self._player_to_dict(i, p) for i, p in enumerate(state.players)],
         }
 
+    def _player_to_dict(self, index: int, player: PlayerState) -> dict[str, Any]:
+        """Convert a player's state to a dictionary, reusing the last one if unchanged."""
+        cached_player, cached_dict = self._player_dicts[index]
+        if cached_player is player:
+            return cached_dict
+
+        player_dict = {
+            "hand": card_strings(player.hand),
+            "points": card_strings(player.points_field),
+            "permanents": card_strings(player.permanents),
+            "jacks": [(str(j), str(s)) for j, s in player.jacks],
+            "point_total": player.point_total,
+        }
+        self._player_dicts[index] = (player, player_dict)
+        return player_dict
+
 
-def save_game_log(log: GameLog, base_dir: str = "logs/games") -> Path:
+def save_game_log(log: GameLog, base_dir: str = "logs/games", indent: bool = False) -> Path:
     """Save a game log to disk.
 
     Args:
         log: Game log to save.
         base_dir: Base directory for logs.
+        indent: Pretty-print the JSON (larger, slower; for debugging).
 
     Returns:
         Path to the saved file.
@@ -220,24 +239,30 @@ def save_game_log(log: GameLog, base_dir: str = "logs/games") -> Path:
     dir_path = Path(base_dir) / date_str
     dir_path.mkdir(parents=True, exist_ok=True)
 
-    # Save as JSON
+    # Save as JSON, storing each move's state as a delta from the previous one
     file_path = dir_path / f"game_{log.game_id}.json"
 
+    moves = []
+    prev_state = log.initial_state
+    for m in log.moves:
+        moves.append(
+            {
+                "turn": m.turn,
+                "player": m.player,
+                "move": m.move,
+                "move_type": m.move_type.name,
+                "state_delta": diff_state_dicts(prev_state, m.state_after),
+            }
+        )
+        prev_state = m.state_after
+
     data = {
         "game_id": log.game_id,
         "timestamp": log.timestamp,
         "seed": log.seed,
         "player_strategies": log.player_strategies,
         "initial_state": log.initial_state,
-        "moves": [
-            {
-                "turn": m.turn,
-                "player": m.player,
-                "move": m.move,
-                "state_after": m.state_after,
-            }
-            for m in log.moves
-        ],
+        "moves": moves,
         "result": {
             "winner": log.result.winner,
             "win_reason": log.result.win_reason,
@@ -250,12 +275,72 @@ def save_game_log(log: GameLog, base_dir: str = "logs/games") -> Path:
         else None,
     }
 
-    with open(file_path, "w") as f:
-        json.dump(data, f, indent=2)
+    file_path.write_bytes(serialization.dumps(data, indent=indent))
 
     return file_path
 
 
+def load_game_log(path: str | Path) -> dict[str, Any]:
+    """Load a saved game log, expanding state deltas.
+
+    Every move in the returned dict has a full ``state_after``, whether the
+    file stores deltas or (older logs) full states, and its ``move_type`` as
+    a MoveType when the file records one.
+
+    Args:
+        path: Path to a file written by save_game_log.
+
+    Returns:
+        Game log dict.
+    """
+    data: dict[str, Any] = serialization.loads(Path(path).read_bytes())
+
+    prev_state = data.get("initial_state") or {}
+    for m in data.get("moves", []):
+        if "state_delta" in m:
+            m["state_after"] = apply_state_delta(prev_state, m.pop("state_delta"))
+        if "move_type" in m:
+            m["move_type"] = MoveType[m["move_type"]]
+        prev_state = m["state_after"]
+
+    return data
+
+
+def diff_state_dicts(prev: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Compute the changes between two logged state dicts.
+
+    Top-level keys whose values differ are included as-is, except
+    ``players``, which maps a player index (as a string) to just that
+    player's changed fields.
+    """
+    delta: dict[str, Any] = {}
+    for key, value in new.items():
+        if key == "players":
+            players = {}
+            for i, (prev_p, new_p) in enumerate(zip(prev.get("players", ()), value)):
+                if new_p is prev_p:
+                    continue
+                changed = {k: v for k, v in new_p.items() if prev_p.get(k) != v}
+                if changed:
+                    players[str(i)] = changed
+            if players:
+                delta["players"] = players
+        elif prev.get(key) != value:
+            delta[key] = value
+    return delta
+
+
+def apply_state_delta(prev: dict[str, Any], delta: dict[str, Any]) -> dict[str, Any]:
+    """Rebuild a full logged state dict from its predecessor and a delta."""
+    state = {**prev, **delta}
+    players_delta = delta.get("players")
+    if players_delta is not None:
+        state["players"] = [
+            {**p, **players_delta.get(str(i), {})} for i, p in enumerate(prev["players"])
+        ]
+    return state
+
+
 def run_batch(
     strategy0: Strategy,
     strategy1: Strategy,
@@ -283,3 +368,86 @@ def run_batch(
         results.append(result)
 
     return results
+
+
+def run_batch_parallel(
+    strategy0_factory: Callable[[], Strategy],
+    strategy1_factory: Callable[[], Strategy],
+    num_games: int,
+    start_seed: int = 0,
+    log_moves: bool = False,
+    num_workers: int | None = None,
+) -> list[GameResult]:
+    """Run multiple games across processes.
+
+    Seeds are split into one contiguous chunk per worker. Each worker builds
+    its own strategies from the factories and plays its chunk in order, like
+    run_batch, so results are reproducible for a given worker count (with
+    one worker they match run_batch on freshly built strategies).
+
+    Args:
+        strategy0_factory: Picklable callable returning player 0's strategy
+            (e.g. functools.partial(HeuristicStrategy, seed=1)).
+        strategy1_factory: Picklable callable returning player 1's strategy.
+        num_games: Number of games to run.
+        start_seed: Starting seed (incremented for each game).
+        log_moves: Whether to log moves (slower).
+        num_workers: Worker processes (default: CPU count).
+
+    Returns:
+        List of game results, in seed order.
+    """
+    num_workers = max(1, min(num_workers or os.cpu_count() or 1, num_games))
+    if num_workers == 1:
+        return _run_batch_chunk(
+            strategy0_factory, strategy1_factory, num_games, start_seed, log_moves
+        )
+
+    chunk_size, extra = divmod(num_games, num_workers)
+
+    chunks = []
+    seed = start_seed
+    for i in range(num_workers):
+        count = chunk_size + (1 if i < extra else 0)
+        chunks.append((seed, count))
+        seed += count
+
+    with worker_pool(num_workers) as pool:
+        futures = [
+            pool.submit(
+                _run_batch_chunk,
+                strategy0_factory, strategy1_factory, count, chunk_start, log_moves,
+            )
+            for chunk_start, count in chunks
+        ]
+        return [result for future in futures for result in future.result()]
+
+
+def _run_batch_chunk(
+    strategy0_factory: Callable[[], Strategy],
+    strategy1_factory: Callable[[], Strategy],
+    num_games: int,
+    start_seed: int,
+    log_moves: bool,
+) -> list[GameResult]:
+    """Play one worker's share of run_batch_parallel."""
+    return run_batch(
+        strategy0_factory(), strategy1_factory(), num_games, start_seed, log_moves
+    )
+
+
+def free_threaded() -> bool:
+    """Whether this interpreter is running without the GIL (3.13t builds)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def worker_pool(max_workers: int) -> Executor:
+    """Create a pool for CPU-bound game work.
+
+    Threads when free_threaded(), since they run in parallel there and skip
+    pickling; processes otherwise (including PyPy, whose JIT stays per-process).
+    """
+    if free_threaded():
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="games")
+    return ProcessPoolExecutor(max_workers=max_workers)
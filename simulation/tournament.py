@@ -6,19 +6,57 @@ analysis including win rates, confidence intervals, and ELO ratings.
 
 from __future__ import annotations
 
+import copy
 import math
+import os
 import time
 from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from functools import partial
+from typing import TYPE_CHECKING, TypeVar
 
-from simulation.runner import GameRunner, GameResult
+from cuttle_engine.moves import MoveType
+from simulation.runner import GameRunner, GameResult, worker_pool
+
+try:
+    import numpy as np
+    from numba import njit  # type: ignore[import-not-found]
+
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover - depends on environment
+    _HAS_NUMBA = False
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
     from strategies.base import Strategy
 
+    # _elo_iteration works on plain lists or (under Numba) NumPy arrays
+    _Ratings = list[float] | npt.NDArray[np.float64]
+    _Indices = Sequence[int] | npt.NDArray[np.int32]
+    _Scores = Sequence[float] | npt.NDArray[np.float64]
+
+
+# Two-sided z-scores for the supported confidence levels
+_Z_SCORES = {0.90: 1.645, 0.95: 1.96, 0.99: 2.576}
+
+
+def _z_score(confidence: float) -> float:
+    """Look up the z-score for a confidence level."""
+    z = _Z_SCORES.get(confidence)
+    if z is None:
+        raise ValueError(
+            f"Unsupported confidence level {confidence}; "
+            f"expected one of {sorted(_Z_SCORES)}"
+        )
+    return z
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatchResult:
     """Result of a match (series of games) between two strategies.
 
@@ -31,6 +69,7 @@ class MatchResult:
         total_games: Total games played.
         avg_game_length: Average number of moves per game.
         avg_turns: Average turns per game.
+        std_game_length: Sample standard deviation of moves per game.
     """
 
     strategy_a: str
@@ -41,6 +80,7 @@ class MatchResult:
     total_games: int
     avg_game_length: float
     avg_turns: float
+    std_game_length: float = 0.0
 
     @property
     def win_rate_a(self) -> float:
@@ -57,20 +97,40 @@ class MatchResult:
         return self.wins_b / self.total_games
 
     def confidence_interval(self, confidence: float = 0.95) -> tuple[float, float]:
-        """Wilson score confidence interval for strategy A's win rate."""
+        """Wilson score confidence interval for strategy A's win rate.
+
+        Raises:
+            ValueError: If confidence is not 0.90, 0.95 or 0.99.
+        """
+        z = _z_score(confidence)
         if self.total_games == 0:
             return (0.0, 1.0)
 
-        z = 1.96 if confidence == 0.95 else 1.645 if confidence == 0.90 else 2.576
         p_hat = self.win_rate_a
         n = self.total_games
+        z_sq = z * z
 
-        denominator = 1 + z * z / n
-        center = (p_hat + z * z / (2 * n)) / denominator
-        margin = z * math.sqrt(p_hat * (1 - p_hat) / n + z * z / (4 * n * n)) / denominator
+        denominator = 1 + z_sq / n
+        center = (p_hat + z_sq / (2 * n)) / denominator
+        margin = z * math.sqrt(p_hat * (1 - p_hat) / n + z_sq / (4 * n * n)) / denominator
 
         return (max(0.0, center - margin), min(1.0, center + margin))
 
+    def game_length_interval(self, confidence: float = 0.95) -> tuple[float, float]:
+        """Confidence interval for the mean number of moves per game.
+
+        Uses the normal approximation, which is reasonable from ~30 games.
+
+        Raises:
+            ValueError: If confidence is not 0.90, 0.95 or 0.99.
+        """
+        z = _z_score(confidence)
+        if self.total_games < 2:
+            return (self.avg_game_length, self.avg_game_length)
+
+        margin = z * self.std_game_length / math.sqrt(self.total_games)
+        return (self.avg_game_length - margin, self.avg_game_length + margin)
+
     def __str__(self) -> str:
         ci = self.confidence_interval()
         return (
@@ -80,12 +140,12 @@ class MatchResult:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TournamentResult:
     """Results of a complete tournament.
 
     Attributes:
-        strategies: List of strategy names.
+        strategies: Strategy names, in entry order.
         matches: All match results.
         elo_ratings: ELO ratings for each strategy.
         win_matrix: Win counts (win_matrix[a][b] = wins for a vs b).
@@ -93,20 +153,26 @@ class TournamentResult:
         duration_seconds: Total tournament duration.
     """
 
-    strategies: list[str]
+    strategies: tuple[str, ...]
     matches: list[MatchResult]
     elo_ratings: dict[str, float]
-    win_matrix: dict[str, dict[str, int]]
+    win_matrix: defaultdict[str, defaultdict[str, int]]
     total_games: int
     duration_seconds: float
+    _match_index: dict[frozenset[str], MatchResult] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Later duplicates of a pairing don't replace the first, as in a scan
+        index: dict[frozenset[str], MatchResult] = {}
+        for match in self.matches:
+            index.setdefault(frozenset((match.strategy_a, match.strategy_b)), match)
+        object.__setattr__(self, "_match_index", index)
 
     def get_match(self, strategy_a: str, strategy_b: str) -> MatchResult | None:
         """Get the match result between two strategies."""
-        for match in self.matches:
-            if (match.strategy_a == strategy_a and match.strategy_b == strategy_b) or \
-               (match.strategy_a == strategy_b and match.strategy_b == strategy_a):
-                return match
-        return None
+        return self._match_index.get(frozenset((strategy_a, strategy_b)))
 
     def standings(self) -> list[tuple[str, float, int, int]]:
         """Get tournament standings.
@@ -114,15 +180,19 @@ class TournamentResult:
         Returns:
             List of (strategy, elo, wins, losses) sorted by ELO.
         """
-        standings = []
-        for strategy in self.strategies:
-            wins = sum(self.win_matrix[strategy].values())
-            losses = sum(
-                self.win_matrix[other][strategy]
-                for other in self.strategies
-                if other != strategy
-            )
-            standings.append((strategy, self.elo_ratings[strategy], wins, losses))
+        # One pass over the matrix for every strategy's wins and losses
+        wins: defaultdict[str, int] = defaultdict(int)
+        losses: defaultdict[str, int] = defaultdict(int)
+        for winner, row in self.win_matrix.items():
+            for loser, count in row.items():
+                wins[winner] += count
+                if loser != winner:
+                    losses[loser] += count
+
+        standings = [
+            (strategy, self.elo_ratings[strategy], wins[strategy], losses[strategy])
+            for strategy in self.strategies
+        ]
 
         return sorted(standings, key=lambda x: x[1], reverse=True)
 
@@ -145,13 +215,13 @@ class TournamentResult:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MoveTypeDistribution:
     """Distribution of move types for a strategy."""
 
     strategy: str
     total_moves: int
-    distribution: dict[str, int] = field(default_factory=dict)
+    distribution: defaultdict[str, int] = field(default_factory=partial(defaultdict, int))
 
     def percentage(self, move_type: str) -> float:
         """Get percentage of moves that were this type."""
@@ -160,12 +230,78 @@ class MoveTypeDistribution:
         return self.distribution.get(move_type, 0) / self.total_moves
 
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _pool_map(
+    fn: Callable[[_T], _R], items: list[_T], num_workers: int, chunksize: int = 1
+) -> list[_R]:
+    """Map fn over items in a worker_pool, returning results in order.
+
+    Process pools pickle each chunk of items; thread pools (free-threaded
+    builds) get a deep copy of each chunk instead, so either way workers
+    never share strategy state with each other or the caller.
+    """
+    with worker_pool(num_workers) as pool:
+        if isinstance(pool, ProcessPoolExecutor):
+            return list(pool.map(fn, items, chunksize=chunksize))
+        chunks = [
+            copy.deepcopy(items[i:i + chunksize]) for i in range(0, len(items), chunksize)
+        ]
+        return [
+            result
+            for chunk_results in pool.map(partial(_map_chunk, fn), chunks)
+            for result in chunk_results
+        ]
+
+
+def _map_chunk(fn: Callable[[_T], _R], chunk: list[_T]) -> list[_R]:
+    """Apply fn to each item of one _pool_map chunk."""
+    return [fn(item) for item in chunk]
+
+
+def _play_one_game(
+    runner_ab: GameRunner,
+    runner_ba: GameRunner,
+    seed: int,
+    swap: bool,
+) -> tuple[int | None, int, int]:
+    """Play one game of a match.
+
+    Args:
+        runner_ab: Runner with strategy A as player 0.
+        runner_ba: Runner with strategy B as player 0.
+        seed: Game seed.
+        swap: Whether strategy B starts (uses runner_ba).
+
+    Returns:
+        (winner, move_count, turns), with winner 0 for strategy A, 1 for
+        strategy B and None for a draw, whoever started.
+    """
+    result, _ = (runner_ba if swap else runner_ab).run_game(seed=seed)
+
+    winner = result.winner
+    if swap and winner is not None:
+        # Flip winner perspective
+        winner = 1 - winner
+    return winner, result.move_count, result.turns
+
+
+def _play_one_game_star(
+    args: tuple[GameRunner, GameRunner, int, bool],
+) -> tuple[int | None, int, int]:
+    """Unpack a _play_one_game argument tuple (for ProcessPoolExecutor.map)."""
+    return _play_one_game(*args)
+
+
 def run_match(
     strategy_a: Strategy,
     strategy_b: Strategy,
     num_games: int,
     start_seed: int = 0,
     alternate_start: bool = True,
+    num_workers: int | None = 1,
 ) -> MatchResult:
     """Run a match (series of games) between two strategies.
 
@@ -175,42 +311,55 @@ def run_match(
         num_games: Number of games to play.
         start_seed: Starting random seed.
         alternate_start: Whether to alternate who starts each game.
+        num_workers: Processes to spread games over (None for CPU count).
+            Keep at 1 when matches are already run in parallel. Workers
+            play on copies of the strategies, so results match a serial run
+            only for strategies that reset their state (e.g. RNG) each game.
 
     Returns:
         MatchResult with statistics.
     """
+    # run_game resets all per-game runner state, so one runner per seat
+    # order serves the whole match
+    runner_ab = GameRunner(strategy_a, strategy_b, log_moves=False)
+    runner_ba = GameRunner(strategy_b, strategy_a, log_moves=False)
+    games = [
+        (runner_ab, runner_ba, start_seed + i, alternate_start and i % 2 == 1)
+        for i in range(num_games)
+    ]
+
+    num_workers = max(1, min(num_workers or os.cpu_count() or 1, num_games))
+    if num_workers == 1:
+        outcomes = [_play_one_game_star(game) for game in games]
+    else:
+        # Each chunk is copied as one unit, so its games share strategy copies
+        chunksize = max(1, num_games // (4 * num_workers))
+        outcomes = _pool_map(_play_one_game_star, games, num_workers, chunksize)
+
     wins_a = 0
     wins_b = 0
     draws = 0
     total_moves = 0
+    total_moves_sq = 0
     total_turns = 0
 
-    for i in range(num_games):
-        seed = start_seed + i
-
-        # Alternate starting player
-        if alternate_start and i % 2 == 1:
-            runner = GameRunner(strategy_b, strategy_a, log_moves=False)
-            result, _ = runner.run_game(seed=seed)
-            # Flip winner perspective
-            if result.winner == 0:
-                wins_b += 1
-            elif result.winner == 1:
-                wins_a += 1
-            else:
-                draws += 1
+    for winner, move_count, turns in outcomes:
+        if winner == 0:
+            wins_a += 1
+        elif winner == 1:
+            wins_b += 1
         else:
-            runner = GameRunner(strategy_a, strategy_b, log_moves=False)
-            result, _ = runner.run_game(seed=seed)
-            if result.winner == 0:
-                wins_a += 1
-            elif result.winner == 1:
-                wins_b += 1
-            else:
-                draws += 1
-
-        total_moves += result.move_count
-        total_turns += result.turns
+            draws += 1
+        total_moves += move_count
+        total_moves_sq += move_count * move_count
+        total_turns += turns
+
+    # Move counts are ints, so these sums are exact and the variance needs
+    # neither a second pass nor Welford's correction for rounding
+    std_game_length = 0.0
+    if num_games > 1:
+        numerator = num_games * total_moves_sq - total_moves * total_moves
+        std_game_length = math.sqrt(numerator / (num_games * (num_games - 1)))
 
     return MatchResult(
         strategy_a=strategy_a.name,
@@ -221,9 +370,62 @@ def run_match(
         total_games=num_games,
         avg_game_length=total_moves / num_games if num_games > 0 else 0,
         avg_turns=total_turns / num_games if num_games > 0 else 0,
+        std_game_length=std_game_length,
     )
 
 
+_LN10_OVER_400 = math.log(10) / 400
+
+
+def _elo_iteration(
+    ratings: _Ratings,
+    idx_a: _Indices,
+    idx_b: _Indices,
+    scores_a: _Scores,
+    scores_b: _Scores,
+    totals: _Indices,
+    k_factor: float,
+    num_matches: int,
+) -> float:
+    """Apply one ELO pass over all matches in place.
+
+    Works on plain lists or NumPy arrays (see _elo_iteration_jit).
+    Matches with no games are marked by a zero total.
+
+    Returns:
+        Largest absolute rating change in this pass.
+    """
+    old_ratings = ratings.copy()
+
+    for m in range(len(idx_a)):
+        total = totals[m]
+        if total == 0:
+            continue
+        a = idx_a[m]
+        b = idx_b[m]
+        ra = ratings[a]
+        rb = ratings[b]
+
+        # Expected scores (10 ** ((rb - ra) / 400), via exp)
+        ea = 1 / (1 + math.exp((rb - ra) * _LN10_OVER_400))
+        eb = 1 - ea
+
+        # Update ratings
+        ratings[a] += k_factor * total * (scores_a[m] - ea) / num_matches
+        ratings[b] += k_factor * total * (scores_b[m] - eb) / num_matches
+
+    max_change = 0.0
+    for i in range(len(ratings)):
+        change = abs(ratings[i] - old_ratings[i])
+        if change > max_change:
+            max_change = change
+    return max_change
+
+
+# The same pass compiled for NumPy arrays, when Numba is installed
+_elo_iteration_jit = njit(cache=True)(_elo_iteration) if _HAS_NUMBA else None
+
+
 def calculate_elo_ratings(
     matches: list[MatchResult],
     initial_elo: float = 1500.0,
@@ -241,50 +443,90 @@ def calculate_elo_ratings(
     Returns:
         Dict mapping strategy name to ELO rating.
     """
-    # Collect all strategies
-    strategies = set()
+    # Collect all strategies and give each an index
+    index: dict[str, int] = {}
     for match in matches:
-        strategies.add(match.strategy_a)
-        strategies.add(match.strategy_b)
+        index.setdefault(match.strategy_a, len(index))
+        index.setdefault(match.strategy_b, len(index))
+
+    if not index:
+        return {}
+
+    idx_a = [index[m.strategy_a] for m in matches]
+    idx_b = [index[m.strategy_b] for m in matches]
+    totals = [m.total_games for m in matches]
+
+    # Actual scores (normalized)
+    scores_a = [
+        (m.wins_a + 0.5 * m.draws) / m.total_games if m.total_games else 0.0
+        for m in matches
+    ]
+    scores_b = [
+        (m.wins_b + 0.5 * m.draws) / m.total_games if m.total_games else 0.0
+        for m in matches
+    ]
 
     # Initialize ratings
-    ratings = {s: initial_elo for s in strategies}
+    ratings: _Ratings = [initial_elo] * len(index)
+    step: Callable[[], float]
+
+    if _elo_iteration_jit is not None:
+        rating_array = np.array(ratings, dtype=np.float64)
+        step = partial(
+            _elo_iteration_jit,
+            rating_array,
+            np.array(idx_a, dtype=np.int32),
+            np.array(idx_b, dtype=np.int32),
+            np.array(scores_a, dtype=np.float64),
+            np.array(scores_b, dtype=np.float64),
+            np.array(totals, dtype=np.int32),
+            k_factor,
+            len(matches),
+        )
+        ratings = rating_array
+    else:
+        step = partial(
+            _elo_iteration,
+            ratings, idx_a, idx_b, scores_a, scores_b, totals, k_factor, len(matches),
+        )
 
     # Iterate to convergence (or max iterations)
     for _ in range(100):
-        old_ratings = ratings.copy()
-
-        for match in matches:
-            a, b = match.strategy_a, match.strategy_b
-            ra, rb = ratings[a], ratings[b]
-
-            # Expected scores
-            ea = 1 / (1 + 10 ** ((rb - ra) / 400))
-            eb = 1 - ea
-
-            # Actual scores (normalized)
-            total = match.total_games
-            if total == 0:
-                continue
-            sa = (match.wins_a + 0.5 * match.draws) / total
-            sb = (match.wins_b + 0.5 * match.draws) / total
-
-            # Update ratings
-            ratings[a] += k_factor * total * (sa - ea) / len(matches)
-            ratings[b] += k_factor * total * (sb - eb) / len(matches)
-
-        # Check convergence
-        max_change = max(abs(ratings[s] - old_ratings[s]) for s in strategies)
-        if max_change < 0.1:
+        if step() < 0.1:
             break
 
-    return ratings
+    return {name: float(ratings[i]) for name, i in index.items()}
+
+
+def _run_match_task(
+    task: tuple[Strategy, Strategy, int, int],
+) -> MatchResult:
+    """Play one (strategy_a, strategy_b, num_games, start_seed) match task."""
+    return run_match(*task)
+
+
+def _run_matches(
+    tasks: list[tuple[Strategy, Strategy, int, int]],
+    num_workers: int | None,
+) -> list[MatchResult]:
+    """Run match tasks in order, optionally across workers.
+
+    With one worker the matches are played in-process, sharing the strategy
+    instances. With more, each task is copied, so every match starts from a
+    copy of the strategies' state at dispatch time.
+    """
+    num_workers = max(1, min(num_workers or os.cpu_count() or 1, len(tasks)))
+    if num_workers == 1:
+        return [_run_match_task(task) for task in tasks]
+
+    return _pool_map(_run_match_task, tasks, num_workers)
 
 
 def run_tournament(
     strategies: list[Strategy],
     games_per_match: int = 100,
     start_seed: int = 0,
+    num_workers: int | None = 1,
 ) -> TournamentResult:
     """Run a round-robin tournament between strategies.
 
@@ -294,40 +536,48 @@ def run_tournament(
         strategies: List of strategies to compete.
         games_per_match: Number of games per matchup.
         start_seed: Starting random seed.
+        num_workers: Processes to spread matches over (None for CPU count).
+            Strategies must be picklable when this is more than 1.
 
     Returns:
         TournamentResult with all statistics.
     """
     start_time = time.perf_counter()
 
-    matches = []
-    win_matrix = defaultdict(lambda: defaultdict(int))
-    seed_offset = 0
-
-    # Round robin
-    for i, strat_a in enumerate(strategies):
-        for strat_b in strategies[i + 1:]:
-            match = run_match(
-                strat_a, strat_b,
-                num_games=games_per_match,
-                start_seed=start_seed + seed_offset,
-            )
-            matches.append(match)
-            win_matrix[match.strategy_a][match.strategy_b] = match.wins_a
-            win_matrix[match.strategy_b][match.strategy_a] = match.wins_b
-            seed_offset += games_per_match
+    pairs = [
+        (strat_a, strat_b)
+        for i, strat_a in enumerate(strategies)
+        for strat_b in strategies[i + 1:]
+    ]
+    tasks = [
+        (strat_a, strat_b, games_per_match, start_seed + i * games_per_match)
+        for i, (strat_a, strat_b) in enumerate(pairs)
+    ]
+    matches = _run_matches(tasks, num_workers)
+
+    # Dense from the start: every pairing gets a slot, so filling it and
+    # reading it back never falls through to __missing__
+    names = [s.name for s in strategies]
+    win_matrix = defaultdict(
+        partial(defaultdict, int),
+        {a: defaultdict(int, {b: 0 for b in names if b != a}) for a in names},
+    )
+    total_games = 0
+    for match in matches:
+        win_matrix[match.strategy_a][match.strategy_b] = match.wins_a
+        win_matrix[match.strategy_b][match.strategy_a] = match.wins_b
+        total_games += match.total_games
 
     # Calculate ELO ratings
     elo_ratings = calculate_elo_ratings(matches)
 
     duration = time.perf_counter() - start_time
-    total_games = sum(m.total_games for m in matches)
 
     return TournamentResult(
-        strategies=[s.name for s in strategies],
+        strategies=tuple(names),
         matches=matches,
         elo_ratings=elo_ratings,
-        win_matrix=dict(win_matrix),
+        win_matrix=win_matrix,
         total_games=total_games,
         duration_seconds=duration,
     )
@@ -338,6 +588,7 @@ def run_gauntlet(
     opponents: list[Strategy],
     games_per_opponent: int = 100,
     start_seed: int = 0,
+    num_workers: int | None = 1,
 ) -> list[MatchResult]:
     """Run a gauntlet where one strategy plays against multiple opponents.
 
@@ -348,23 +599,32 @@ def run_gauntlet(
         opponents: List of opponent strategies.
         games_per_opponent: Games per matchup.
         start_seed: Starting seed.
+        num_workers: Processes to spread matches over (None for CPU count).
+            Strategies must be picklable when this is more than 1.
 
     Returns:
         List of MatchResult for each opponent.
     """
-    results = []
-    seed_offset = 0
-
-    for opponent in opponents:
-        match = run_match(
-            challenger, opponent,
-            num_games=games_per_opponent,
-            start_seed=start_seed + seed_offset,
-        )
-        results.append(match)
-        seed_offset += games_per_opponent
-
-    return results
+    tasks = [
+        (challenger, opponent, games_per_opponent, start_seed + i * games_per_opponent)
+        for i, opponent in enumerate(opponents)
+    ]
+    return _run_matches(tasks, num_workers)
+
+
+# Category names reported by analyze_move_distribution
+_MOVE_TYPE_CATEGORIES = {
+    MoveType.DRAW: "Draw",
+    MoveType.PLAY_POINTS: "PlayPoints",
+    MoveType.SCUTTLE: "Scuttle",
+    MoveType.PLAY_ONE_OFF: "OneOff",
+    MoveType.PLAY_PERMANENT: "Permanent",
+    MoveType.COUNTER: "Counter",
+    MoveType.DECLINE_COUNTER: "DeclineCounter",
+    MoveType.RESOLVE_SEVEN: "ResolveSeven",
+    MoveType.DISCARD: "Discard",
+    MoveType.PASS: "Pass",
+}
 
 
 def analyze_move_distribution(
@@ -384,50 +644,23 @@ def analyze_move_distribution(
     Returns:
         MoveTypeDistribution with move type counts.
     """
-    from cuttle_engine.moves import MoveType
-
     distribution = defaultdict(int)
     total_moves = 0
 
+    runner = GameRunner(strategy, opponent, log_moves=True)
     for i in range(num_games):
-        runner = GameRunner(strategy, opponent, log_moves=True)
         result, log = runner.run_game(seed=start_seed + i)
 
         if log:
             for move_record in log.moves:
                 if move_record.player == 0:  # Strategy is player 0
-                    # Categorize move
-                    move_str = move_record.move
-                    if "Draw" in move_str:
-                        move_type = "Draw"
-                    elif "points" in move_str.lower() and "Play" in move_str:
-                        move_type = "PlayPoints"
-                    elif "Scuttle" in move_str:
-                        move_type = "Scuttle"
-                    elif "one-off" in move_str.lower():
-                        move_type = "OneOff"
-                    elif "steal" in move_str.lower() or "permanent" in move_str.lower():
-                        move_type = "Permanent"
-                    elif "Counter" in move_str:
-                        move_type = "Counter"
-                    elif "Decline" in move_str:
-                        move_type = "DeclineCounter"
-                    elif "Pass" in move_str:
-                        move_type = "Pass"
-                    elif "Discard" in move_str:
-                        move_type = "Discard"
-                    elif "Seven:" in move_str:
-                        move_type = "ResolveSeven"
-                    else:
-                        move_type = "Other"
-
-                    distribution[move_type] += 1
+                    distribution[_MOVE_TYPE_CATEGORIES[move_record.move_type]] += 1
                     total_moves += 1
 
     return MoveTypeDistribution(
         strategy=strategy.name,
         total_moves=total_moves,
-        distribution=dict(distribution),
+        distribution=distribution,
     )
 
 
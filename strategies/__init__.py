@@ -1,6 +1,6 @@
 """Game strategies for Cuttle."""
 
-from strategies.base import Strategy
+from strategies.base import Strategy, SupportsAsyncSelect, SupportsThinking
 from strategies.heuristic import HeuristicStrategy
 from strategies.random_strategy import RandomStrategy
 from strategies.mcts import MCTSStrategy
@@ -8,6 +8,8 @@ from strategies.ismcts import ISMCTSStrategy
 
 __all__ = [
     "Strategy",
+    "SupportsAsyncSelect",
+    "SupportsThinking",
     "RandomStrategy",
     "HeuristicStrategy",
     "MCTSStrategy",
@@ -3,13 +3,32 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from cuttle_engine.moves import Move
     from cuttle_engine.state import GameState
 
 
+@runtime_checkable
+class SupportsThinking(Protocol):
+    """A strategy that reports the reasoning behind its last move (LLMs)."""
+
+    @property
+    def last_thinking(self) -> Any:
+        """Details of the last select_move call (model, tokens, cost), or None."""
+        ...
+
+
+@runtime_checkable
+class SupportsAsyncSelect(Protocol):
+    """A strategy whose move selection can be awaited (network-bound LLMs)."""
+
+    async def aselect_move(self, state: GameState, legal_moves: list[Move]) -> Move:
+        """Async select_move, for callers running an event loop."""
+        ...
+
+
 class Strategy(ABC):
     """Abstract base class for player strategies."""
 
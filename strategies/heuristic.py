@@ -18,7 +18,9 @@ This heuristic was tuned based on analysis of 1000+ MCTS games that achieved
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from cuttle_engine.cards import Rank
 from cuttle_engine.moves import (
@@ -27,6 +29,7 @@ from cuttle_engine.moves import (
     Discard,
     Draw,
     MoveType,
+    OneOffEffect,
     Pass,
     PlayOneOff,
     PlayPermanent,
@@ -37,6 +40,7 @@ from cuttle_engine.moves import (
 from strategies.base import Strategy
 
 if TYPE_CHECKING:
+    from cuttle_engine.cards import Card
     from cuttle_engine.moves import Move
     from cuttle_engine.state import GameState
 
@@ -65,6 +69,8 @@ class HeuristicStrategy(Strategy):
     def __init__(self, seed: int | None = None, version: str | None = None):
         self._rng = random.Random(seed)
         self._seed = seed
+        # Bound once, as in RandomStrategy: select_move runs every turn
+        self._randrange = self._rng.randrange
         # Allow overriding version for testing different variants
         self._version = version or self.VERSION
 
@@ -77,263 +83,363 @@ class HeuristicStrategy(Strategy):
         if not legal_moves:
             raise ValueError("No legal moves available")
 
-        player_idx = state.current_player
-        my_points = state.players[player_idx].point_total
-        opp_points = state.players[1 - player_idx].point_total
-        point_diff = my_points - opp_points
-
-        # Score each move with context
-        scored_moves = [
-            (self._score_move(state, move, player_idx, point_diff), move)
-            for move in legal_moves
-        ]
-
-        # Get best score
-        best_score = max(score for score, _ in scored_moves)
-
-        # Pick randomly among tied best moves
-        best_moves = [move for score, move in scored_moves if score == best_score]
-        return self._rng.choice(best_moves)
+        if len(legal_moves) == 1:
+            # Forced move: nothing to score
+            self._skip_tie_break()
+            return legal_moves[0]
+
+        # Score each move with context, keeping the tied best ones
+        context = _ScoreContext.for_player(state, state.current_player)
+        best_score = -(1 << 30)  # below any real score
+        best_moves: list[Move] = []
+        moves = legal_moves
+        if type(moves[0]) is Pass:
+            # Generated first once the deck is empty; it always scores 0
+            best_score = 0
+            best_moves = [moves[0]]
+            moves = moves[1:]
+        for move in moves:
+            score = _score(state, move, context)
+            if score > best_score:
+                best_score = score
+                best_moves = [move]
+            elif score == best_score:
+                best_moves.append(move)
+
+        # Pick randomly among tied best moves. Same draw as rng.choice(),
+        # made even for a single best move, so seeded games replay identically.
+        return best_moves[self._randrange(len(best_moves))]
+
+    def _skip_tie_break(self) -> None:
+        """Make the tie-break draw a scored move would, choosing nothing.
+
+        Keeps the RNG stream of a forced move the same as a scored one, so
+        seeded games replay identically.
+        """
+        self._randrange(1)
 
     def _score_move(
         self, state: GameState, move: Move, player_idx: int, point_diff: int
-    ) -> float:
+    ) -> int:
         """Score a move (higher is better).
 
         Scoring is based on MCTS-learned patterns from 1000+ games.
         """
+        return _score(state, move, _ScoreContext.for_player(state, player_idx, point_diff))
+
+    def _score_moves(
+        self,
+        state: GameState,
+        moves: list[Move],
+        player_idx: int,
+        point_diff: int | None = None,
+    ) -> list[int]:
+        """Score several moves from the same position (see _score_move).
+
+        point_diff defaults to the player's lead over the opponent.
+        """
+        context = _ScoreContext.for_player(state, player_idx, point_diff)
+        return [_score(state, move, context) for move in moves]
+
+
+@dataclass(slots=True)
+class _ScoreContext:
+    """Per-position values shared by every move scored in that position."""
+
+    player_idx: int
+    opp_idx: int
+    point_diff: int
+    my_points: int
+    opp_points: int
+    threshold: int
+    opp_threshold: int
+    is_behind: bool
+    is_behind_big: bool
+    # Best Three revive target in the scrap, filled in on first use
+    best_revive_score: int | None = None
+
+    @classmethod
+    def for_player(
+        cls, state: GameState, player_idx: int, point_diff: int | None = None
+    ) -> _ScoreContext:
+        opp_idx = 1 - player_idx
         my_points = state.players[player_idx].point_total
-        opp_points = state.players[1 - player_idx].point_total
-        threshold = state.point_threshold(player_idx)
-        is_behind = point_diff < -3
-        is_behind_big = point_diff < -8
-
-        match move:
-            case PlayPoints(card=card):
-                # Check if this wins the game
-                if my_points + card.point_value >= threshold:
-                    return 10000  # Winning move
-
-                # High cards (8-10) are extremely valuable as points
-                # MCTS plays 8 for points 93% of the time (vs 1% for Heuristic)
-                if card.point_value >= 8:
-                    return 800 + card.point_value * 10
-                elif card.point_value >= 5:
-                    return 400 + card.point_value * 10
-                else:
-                    # Low cards (2-4) - still play for points but lower priority
-                    # MCTS plays 2s for points 52% vs destroy 42%
-                    return 200 + card.point_value * 10
-
-            case Scuttle(card=card, target=target):
-                # MCTS scuttles only 1.6% of the time!
-                # Only scuttle if it's clearly winning or huge value
-                value_gained = target.point_value - card.point_value
-
-                # Check if scuttling wins (prevents opponent from winning)
-                opp_threshold = state.point_threshold(1 - player_idx)
-                if opp_points >= opp_threshold - target.point_value:
-                    return 5000  # Prevent opponent win
-
-                # Otherwise, scuttling is usually bad
-                # Only consider if we're losing big AND it's high value
-                if is_behind_big and value_gained >= 5:
-                    return 100 + value_gained * 10
-
-                # Generally avoid scuttling - it's a 1-for-1 trade
-                return 20 + value_gained
-
-            case PlayPermanent(card=card, target_card=target):
-                if card.rank == Rank.KING:
-                    # Kings are valuable - reduce threshold
-                    # MCTS plays Kings ~6% overall, higher when ahead
-                    return 600
-
-                elif card.rank == Rank.JACK and target:
-                    # Jacks to steal high-value points
-                    # MCTS: 79.5% win rate - one of the best plays!
-                    base = 400 + target.point_value * 25  # Increased from 300 + 20
-                    if is_behind_big:
-                        return base + 200  # Bonus when behind
-                    elif is_behind:
-                        return base + 100
-                    return base
-
-                elif card.rank == Rank.QUEEN:
-                    # Queens: 45% win rate - correlates with weaker positions
-                    # MCTS plays Queen when it has weak options
-                    return 100  # Reduced from 150
-
-                elif card.rank == Rank.EIGHT:
-                    # 8 as Glasses is almost never correct
-                    # MCTS: 5.1% Glasses vs 93.4% points
-                    # Only consider if we literally can't play it for points
-                    return 50
-
-            case PlayOneOff(card=card, effect=effect):
-                from cuttle_engine.moves import OneOffEffect
-
-                # Determine game phase for one-off decisions
-                is_opening = state.turn_number <= 3
-                is_midgame = 4 <= state.turn_number <= 8
-
-                if effect == OneOffEffect.ACE_SCRAP_ALL_POINTS:
-                    # MCTS uses Ace 94% when behind 8+, NEVER when even/ahead
-                    # Ace is a COMEBACK mechanic, not control
-                    if is_behind_big:
-                        # 94% of Ace plays are when behind 8+
-                        return 700 if is_opening else 500
-                    elif is_behind:
-                        # Only 5.7% when behind 3-7
-                        return 150
-                    # NEVER use Ace when even or ahead (0% in data)
-                    return -100  # Actively avoid
-
-                elif effect == OneOffEffect.TWO_DESTROY_PERMANENT:
-                    # MCTS uses 2 for points 52%, destroy only when necessary
-                    # Only destroy truly critical targets
-                    return 120
-
-                elif effect == OneOffEffect.THREE_REVIVE:
-                    # MCTS revives 36% when behind 8+, 28% even
-                    # Priority: Jack > 10 > King > 9 > 8 > 7
-                    # NEVER revive: 2, 3, Queen (0% in 500 games)
-                    best_revive_score = 0
-                    for c in state.scrap:
-                        if c.rank == Rank.JACK:
-                            best_revive_score = max(best_revive_score, 600)  # 27.7% of revives
-                        elif c.rank == Rank.TEN:
-                            best_revive_score = max(best_revive_score, 550)  # 23.4% of revives
-                        elif c.rank == Rank.KING:
-                            best_revive_score = max(best_revive_score, 500)  # 17% of revives
-                        elif c.point_value >= 8:  # 9, 8
-                            best_revive_score = max(best_revive_score, 400 + c.point_value * 10)
-                        elif c.point_value >= 7:
-                            best_revive_score = max(best_revive_score, 300)
-                        # Skip 2, 3, 4, 5, 6 for points and Queen - MCTS never revives these
-
-                    if best_revive_score > 0:
-                        if is_behind_big:
-                            return best_revive_score + 100  # Bonus when behind
-                        elif is_behind or point_diff == 0:
-                            return best_revive_score
-                        return best_revive_score - 100  # Lower priority when ahead
-                    return 50  # No good targets in scrap
-
-                elif effect == OneOffEffect.FOUR_DISCARD:
-                    # MCTS uses Four for points 60% of time!
-                    # 41% win rate suggests one-off is often weak
-                    if is_opening:
-                        return 350  # Reduced from 450
-                    elif is_midgame:
-                        return 150  # Reduced from 200
-                    return 100  # Low priority lategame
-
-                elif effect == OneOffEffect.FIVE_DRAW_TWO:
-                    # MCTS prefers 5 for points 65.6% of time
-                    if is_opening:
-                        return 300  # Reduced from 400
-                    elif is_midgame:
-                        return 200  # Reduced from 300
-                    return 150  # Play for points lategame
-
-                elif effect == OneOffEffect.SIX_SCRAP_ALL_PERMANENTS:
-                    # MCTS almost never uses Six (2 total in 300 games)
-                    # 6 points > scrapping permanents
-                    our_perms = len(state.players[player_idx].permanents)
-                    opp_perms = len(state.players[1 - player_idx].permanents)
-                    if opp_perms >= our_perms + 3:
-                        return 200  # Only if huge advantage
-                    return 30  # Almost always play for 6 points
-
-                elif effect == OneOffEffect.SEVEN_PLAY_FROM_DECK:
-                    # MCTS prefers 7 for points 68.8% of time
-                    if is_opening:
-                        return 350  # Reduced from 450
-                    elif is_midgame:
-                        return 250  # Reduced from 300
-                    return 150  # Play for points lategame
-
-                return 100
-
-            case Counter(card=card):
-                # MCTS only counters 19% of the time!
-                # Only counter Aces (36%) and Fives (50%)
-                if state.counter_state and state.counter_state.one_off_card:
-                    threat_rank = state.counter_state.one_off_card.rank
-                    if threat_rank == Rank.ACE:
-                        # Counter Ace 36% - scrap all points is dangerous
-                        return 400
-                    elif threat_rank == Rank.FIVE:
-                        # Counter Five 50% - don't let them draw two
-                        return 350
-                    elif threat_rank == Rank.FOUR:
-                        # Counter Four only 15%
-                        return 100
-                    elif threat_rank == Rank.TWO:
-                        # Counter Two only 14%
-                        return 80
-                    else:
-                        # Don't counter Six, Three, Seven, Nine
-                        return 50
-                return 100
-
-            case DeclineCounter():
-                # Declining is often correct - save your counter cards
-                if state.counter_state:
-                    threat_rank = state.counter_state.one_off_card.rank
-                    # Prefer declining for non-critical threats
-                    if threat_rank in (Rank.SIX, Rank.THREE, Rank.SEVEN):
-                        return 200  # Definitely decline
-                    elif threat_rank in (Rank.TWO, Rank.FOUR):
-                        return 150  # Probably decline
-                    elif threat_rank == Rank.FIVE:
-                        return 50  # Maybe decline
-                    elif threat_rank == Rank.ACE:
-                        return -50  # Don't want to decline vs Ace
-                return 100
-
-            case Draw():
-                # MCTS: 58% win rate - below average
-                # Draw is often a 'settle' option
-                return 250  # Reduced from 300
-
-            case Pass():
-                return 0
-
-            case Discard(card=card):
-                # Prefer discarding low-value cards
-                return 10 - card.point_value
-
-            case ResolveSeven(card=card, play_as=play_as, target_card=target):
-                # Seven resolution - prefer one-off effects
-                if play_as == MoveType.PLAY_ONE_OFF:
-                    # MCTS uses Seven one-off effects more
-                    from cuttle_engine.moves import OneOffEffect
-                    # Check what effect we're getting
-                    if card.rank == Rank.FIVE:
-                        return 400  # Draw two is great
-                    elif card.rank == Rank.ACE:
-                        if opp_points > my_points:
-                            return 350
-                        return 100
-                    return 250
-                elif play_as == MoveType.PLAY_POINTS:
-                    if my_points + card.point_value >= threshold:
-                        return 10000  # Win!
-                    return 200 + card.point_value * 10
-                elif play_as == MoveType.SCUTTLE:
-                    # Scuttling via Seven is still usually bad
-                    if target:
-                        value = target.point_value - card.point_value
-                        return 50 + value
-                    return 50
-                elif play_as == MoveType.PLAY_PERMANENT:
-                    if card.rank == Rank.KING:
-                        return 500
-                    elif card.rank == Rank.JACK and target:
-                        return 400 + target.point_value * 25  # Match Jack steal scoring
-                    return 100  # Match Queen scoring
-                return 100
-
-        return 0
+        opp_points = state.players[opp_idx].point_total
+        if point_diff is None:
+            point_diff = my_points - opp_points
+        return cls(
+            player_idx=player_idx,
+            opp_idx=opp_idx,
+            point_diff=point_diff,
+            my_points=my_points,
+            opp_points=opp_points,
+            threshold=state.point_threshold(player_idx),
+            opp_threshold=state.point_threshold(opp_idx),
+            is_behind=point_diff < -3,
+            is_behind_big=point_diff < -8,
+        )
+
+
+# PlayPoints score by point value (A-10).
+# High cards (8-10) are extremely valuable as points
+# MCTS plays 8 for points 93% of the time (vs 1% for Heuristic)
+# Low cards (2-4) - still play for points but lower priority
+# MCTS plays 2s for points 52% vs destroy 42%
+_POINTS_SCORE = [
+    (800 if value >= 8 else 400 if value >= 5 else 200) + value * 10
+    for value in range(11)
+]
+
+# Permanents other than Jacks.
+# Kings are valuable - reduce threshold (MCTS plays Kings ~6% overall)
+# Queens: 45% win rate - correlates with weaker positions
+# 8 as Glasses is almost never correct (MCTS: 5.1% Glasses vs 93.4% points)
+_PERMANENT_SCORE = {Rank.KING: 600, Rank.QUEEN: 100, Rank.EIGHT: 50}
+
+# Three revive targets: Jack > 10 > King > 9 > 8 > 7 (27.7%, 23.4%, 17% of
+# revives for the top three). MCTS never revives 2-6 or Queens.
+_REVIVE_SCORE = {
+    Rank.JACK: 600,
+    Rank.TEN: 550,
+    Rank.KING: 500,
+    Rank.NINE: 490,
+    Rank.EIGHT: 480,
+    Rank.SEVEN: 300,
+}
+
+# (opening, midgame, lategame) scores for one-offs MCTS mostly plays for points
+# Four: points 60% of the time, 41% win rate as a one-off
+# Five: points 65.6% of the time
+# Seven: points 68.8% of the time
+_ONE_OFF_PHASE_SCORE = {
+    OneOffEffect.FOUR_DISCARD: (350, 150, 100),
+    OneOffEffect.FIVE_DRAW_TWO: (300, 200, 150),
+    OneOffEffect.SEVEN_PLAY_FROM_DECK: (350, 250, 150),
+}
+
+# Counter by threatened one-off. MCTS only counters 19% of the time:
+# Aces 36%, Fives 50%, Fours 15%, Twos 14%; everything else rarely.
+_COUNTER_SCORE = {Rank.ACE: 400, Rank.FIVE: 350, Rank.FOUR: 100, Rank.TWO: 80}
+
+# Declining is often correct - save your counter cards
+_DECLINE_SCORE = {
+    Rank.SIX: 200,
+    Rank.THREE: 200,
+    Rank.SEVEN: 200,
+    Rank.TWO: 150,
+    Rank.FOUR: 150,
+    Rank.FIVE: 50,
+    Rank.ACE: -50,
+}
+
+
+# Playing points that reach the threshold beats everything else
+_WINNING_SCORE = 10000
+
+
+def _jack_steal_score(target: Card) -> int:
+    # Jacks to steal high-value points
+    # MCTS: 79.5% win rate - one of the best plays!
+    return 400 + target.point_value * 25
+
+
+def _score_play_points(state: GameState, move: PlayPoints, ctx: _ScoreContext) -> int:
+    value = move.card.point_value
+    # Check if this wins the game
+    if ctx.my_points + value >= ctx.threshold:
+        return _WINNING_SCORE
+    return _POINTS_SCORE[value]
+
+
+def _score_scuttle(state: GameState, move: Scuttle, ctx: _ScoreContext) -> int:
+    # MCTS scuttles only 1.6% of the time!
+    # Only scuttle if it's clearly winning or huge value
+    target_value = move.target.point_value
+    value_gained = target_value - move.card.point_value
+
+    # Check if scuttling wins (prevents opponent from winning)
+    if ctx.opp_points >= ctx.opp_threshold - target_value:
+        return 5000  # Prevent opponent win
+
+    # Otherwise, scuttling is usually bad
+    # Only consider if we're losing big AND it's high value
+    if ctx.is_behind_big and value_gained >= 5:
+        return 100 + value_gained * 10
+
+    # Generally avoid scuttling - it's a 1-for-1 trade
+    return 20 + value_gained
+
+
+def _score_play_permanent(state: GameState, move: PlayPermanent, ctx: _ScoreContext) -> int:
+    rank = move.card.rank
+    target = move.target_card
+    if rank == Rank.JACK and target:
+        base = _jack_steal_score(target)
+        if ctx.is_behind_big:
+            return base + 200  # Bonus when behind
+        elif ctx.is_behind:
+            return base + 100
+        return base
+    return _PERMANENT_SCORE.get(rank, 0)
+
+
+def _score_play_one_off(state: GameState, move: PlayOneOff, ctx: _ScoreContext) -> int:
+    return _ONE_OFF_SCORERS.get(move.effect, _score_other_one_off)(state, move, ctx)
+
+
+def _score_ace(state: GameState, move: PlayOneOff, ctx: _ScoreContext) -> int:
+    # MCTS uses Ace 94% when behind 8+, NEVER when even/ahead
+    # Ace is a COMEBACK mechanic, not control
+    if ctx.is_behind_big:
+        return 700 if state.turn_number <= 3 else 500
+    elif ctx.is_behind:
+        # Only 5.7% when behind 3-7
+        return 150
+    # NEVER use Ace when even or ahead (0% in data)
+    return -100  # Actively avoid
+
+
+def _score_two_destroy(state: GameState, move: PlayOneOff, ctx: _ScoreContext) -> int:
+    # MCTS uses 2 for points 52%, destroy only when necessary
+    return 120
+
+
+def _score_three_revive(state: GameState, move: PlayOneOff, ctx: _ScoreContext) -> int:
+    # MCTS revives 36% when behind 8+, 28% even
+    best_revive_score = ctx.best_revive_score
+    if best_revive_score is None:
+        best_revive_score = ctx.best_revive_score = max(
+            (_REVIVE_SCORE.get(c.rank, 0) for c in state.scrap), default=0
+        )
+    if best_revive_score > 0:
+        if ctx.is_behind_big:
+            return best_revive_score + 100  # Bonus when behind
+        elif ctx.is_behind or ctx.point_diff == 0:
+            return best_revive_score
+        return best_revive_score - 100  # Lower priority when ahead
+    return 50  # No good targets in scrap
+
+
+def _score_by_game_phase(state: GameState, move: PlayOneOff, ctx: _ScoreContext) -> int:
+    # Four, Five and Seven: see _ONE_OFF_PHASE_SCORE
+    opening, midgame, lategame = _ONE_OFF_PHASE_SCORE[move.effect]
+    turn = state.turn_number
+    if turn <= 3:
+        return opening
+    elif turn <= 8:
+        return midgame
+    return lategame
+
+
+def _score_six(state: GameState, move: PlayOneOff, ctx: _ScoreContext) -> int:
+    # MCTS almost never uses Six (2 total in 300 games)
+    # 6 points > scrapping permanents
+    our_perms = len(state.players[ctx.player_idx].permanents)
+    opp_perms = len(state.players[ctx.opp_idx].permanents)
+    if opp_perms >= our_perms + 3:
+        return 200  # Only if huge advantage
+    return 30  # Almost always play for 6 points
+
+
+def _score_other_one_off(state: GameState, move: PlayOneOff, ctx: _ScoreContext) -> int:
+    return 100
+
+
+# Move typed Any, as in _SCORERS, so a scorer may take a narrower type
+_ONE_OFF_SCORERS: dict[OneOffEffect, Callable[[GameState, Any, _ScoreContext], int]] = {
+    OneOffEffect.ACE_SCRAP_ALL_POINTS: _score_ace,
+    OneOffEffect.TWO_DESTROY_PERMANENT: _score_two_destroy,
+    OneOffEffect.THREE_REVIVE: _score_three_revive,
+    OneOffEffect.FOUR_DISCARD: _score_by_game_phase,
+    OneOffEffect.FIVE_DRAW_TWO: _score_by_game_phase,
+    OneOffEffect.SIX_SCRAP_ALL_PERMANENTS: _score_six,
+    OneOffEffect.SEVEN_PLAY_FROM_DECK: _score_by_game_phase,
+}
+
+
+def _score_counter(state: GameState, move: Counter, ctx: _ScoreContext) -> int:
+    counter_state = state.counter_state
+    if counter_state and counter_state.one_off_card:
+        # Don't counter Six, Three, Seven, Nine
+        return _COUNTER_SCORE.get(counter_state.one_off_card.rank, 50)
+    return 100
+
+
+def _score_decline_counter(state: GameState, move: DeclineCounter, ctx: _ScoreContext) -> int:
+    if state.counter_state:
+        return _DECLINE_SCORE.get(state.counter_state.one_off_card.rank, 100)
+    return 100
+
+
+def _score_draw(state: GameState, move: Draw, ctx: _ScoreContext) -> int:
+    # MCTS: 58% win rate - below average
+    # Draw is often a 'settle' option
+    return 250
+
+
+def _score_pass(state: GameState, move: Pass, ctx: _ScoreContext) -> int:
+    return 0
+
+
+def _score_discard(state: GameState, move: Discard, ctx: _ScoreContext) -> int:
+    # Prefer discarding low-value cards
+    return 10 - move.card.point_value
+
+
+def _score_resolve_seven(state: GameState, move: ResolveSeven, ctx: _ScoreContext) -> int:
+    card = move.card
+    play_as = move.play_as
+    target = move.target_card
+    # Seven resolution - prefer one-off effects
+    if play_as == MoveType.PLAY_ONE_OFF:
+        # MCTS uses Seven one-off effects more
+        if card.rank == Rank.FIVE:
+            return 400  # Draw two is great
+        elif card.rank == Rank.ACE:
+            if ctx.opp_points > ctx.my_points:
+                return 350
+            return 100
+        return 250
+    elif play_as == MoveType.PLAY_POINTS:
+        value = card.point_value
+        if ctx.my_points + value >= ctx.threshold:
+            return _WINNING_SCORE
+        return 200 + value * 10
+    elif play_as == MoveType.SCUTTLE:
+        # Scuttling via Seven is still usually bad
+        if target:
+            return 50 + target.point_value - card.point_value
+        return 50
+    elif play_as == MoveType.PLAY_PERMANENT:
+        if card.rank == Rank.KING:
+            return 500
+        elif card.rank == Rank.JACK and target:
+            return _jack_steal_score(target)
+        return _PERMANENT_SCORE[Rank.QUEEN]
+    return 100
+
+
+# Each scorer takes the move type it is registered under; a dict type can't
+# tie a value's argument type to its key, hence Any
+_SCORERS: dict[type, Callable[[GameState, Any, _ScoreContext], int]] = {
+    PlayPoints: _score_play_points,
+    Scuttle: _score_scuttle,
+    PlayPermanent: _score_play_permanent,
+    PlayOneOff: _score_play_one_off,
+    Counter: _score_counter,
+    DeclineCounter: _score_decline_counter,
+    Draw: _score_draw,
+    Pass: _score_pass,
+    Discard: _score_discard,
+    ResolveSeven: _score_resolve_seven,
+}
+
+
+def _score_zero(state: GameState, move: Move, ctx: _ScoreContext) -> int:
+    # Move types without a scorer
+    return 0
+
+
+def _score(state: GameState, move: Move, ctx: _ScoreContext) -> int:
+    """Score a move (higher is better), dispatching on its type."""
+    return _SCORERS.get(type(move), _score_zero)(state, move, ctx)
@@ -9,21 +9,26 @@ from __future__ import annotations
 import math
 import random
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from cuttle_engine.cards import Card, Rank, Suit, create_deck
-from cuttle_engine.executor import execute_move
+from cuttle_engine.executor import IllegalMoveError, execute_move
 from cuttle_engine.move_generator import generate_legal_moves
-from cuttle_engine.state import GamePhase, GameState, PlayerState
+from cuttle_engine.moves import PlayPermanent
+from cuttle_engine.state import GamePhase, GameState
 from strategies.base import Strategy
 from strategies.random_strategy import RandomStrategy
 
 if TYPE_CHECKING:
     from cuttle_engine.moves import Move
 
+# Every card in the game; determinization samples from those not yet seen
+_ALL_CARDS: frozenset[Card] = frozenset(create_deck())
 
-@dataclass
+
+@dataclass(slots=True)
 class ISMCTSNode:
     """A node in the ISMCTS tree.
 
@@ -64,9 +69,10 @@ class ISMCTSNode:
 
     def get_or_create_child(self, move: Move) -> ISMCTSNode:
         """Get existing child or create new one for the move."""
-        if move not in self.children:
-            self.children[move] = ISMCTSNode(move=move, parent=self)
-        return self.children[move]
+        child = self.children.get(move)
+        if child is None:
+            child = self.children[move] = ISMCTSNode(move=move, parent=self)
+        return child
 
     def update(self, result: float) -> None:
         """Update node statistics."""
@@ -93,6 +99,8 @@ class ISMCTSStrategy(Strategy):
         simulation_strategy: Strategy | None = None,
         seed: int | None = None,
         max_simulation_depth: int = 200,
+        determinization_batch_size: int = 1,
+        num_workers: int = 1,
     ):
         """Initialize ISMCTS.
 
@@ -102,14 +110,27 @@ class ISMCTSStrategy(Strategy):
             simulation_strategy: Strategy for rollouts.
             seed: Random seed.
             max_simulation_depth: Max moves per simulation.
+            determinization_batch_size: Iterations run on each sampled
+                determinization before resampling (1 = resample every iteration).
+            num_workers: Number of parallel workers (1 = serial, >1 = parallel).
+                         When parallel, each worker searches its own tree for
+                         iterations/num_workers iterations and root visit
+                         counts are summed.
         """
+        if determinization_batch_size < 1:
+            raise ValueError("determinization_batch_size must be at least 1")
         self._iterations = iterations
         self._exploration = exploration_constant
+        self._custom_simulation_strategy = simulation_strategy
         self._simulation_strategy = simulation_strategy or RandomStrategy(seed)
         self._rng = random.Random(seed)
         self._max_sim_depth = max_simulation_depth
+        self._det_batch_size = determinization_batch_size
+        self._num_workers = num_workers
+        self._seed = seed
         self._player_index: int | None = None
         self._known_cards: set[Card] = set()  # Cards we know locations of
+        self._last_hand: tuple[Card, ...] = ()  # Our hand as last added to _known_cards
 
     @property
     def name(self) -> str:
@@ -120,31 +141,26 @@ class ISMCTSStrategy(Strategy):
         self._player_index = player_index
         self._known_cards = set()
         # We know our own starting hand
-        self._known_cards.update(state.players[player_index].hand)
+        self._last_hand = state.players[player_index].hand
+        self._known_cards.update(self._last_hand)
 
     def on_move_made(self, state: GameState, move: Move, player: int) -> None:
         """Update our knowledge based on observed moves."""
-        # Track cards that become visible through play
-        from cuttle_engine.moves import (
-            PlayPoints, Scuttle, PlayOneOff, PlayPermanent,
-            Counter, Discard, ResolveSeven
-        )
-
-        match move:
-            case PlayPoints(card=card) | Scuttle(card=card) | PlayOneOff(card=card):
-                self._known_cards.add(card)
-            case PlayPermanent(card=card, target_card=target):
-                self._known_cards.add(card)
-                if target:
-                    self._known_cards.add(target)
-            case Counter(card=card) | Discard(card=card):
-                self._known_cards.add(card)
-            case ResolveSeven(card=card):
-                self._known_cards.add(card)
-
-        # Update our known hand
+        # Track cards that become visible through play: every move that
+        # plays a card has a card field, and a Jack also reveals its target
+        card = getattr(move, "card", None)
+        if card is not None:
+            self._known_cards.add(card)
+            if type(move) is PlayPermanent and move.target_card:
+                self._known_cards.add(move.target_card)
+
+        # Update our known hand. The executor carries an untouched hand tuple
+        # over as-is, so an identity check skips re-adding cards we know.
         if self._player_index is not None:
-            self._known_cards.update(state.players[self._player_index].hand)
+            hand = state.players[self._player_index].hand
+            if hand is not self._last_hand:
+                self._last_hand = hand
+                self._known_cards.update(hand)
 
     def select_move(self, state: GameState, legal_moves: list[Move]) -> Move:
         """Select a move using ISMCTS.
@@ -162,6 +178,10 @@ class ISMCTSStrategy(Strategy):
         if len(legal_moves) == 1:
             return legal_moves[0]
 
+        # Use parallel execution if num_workers > 1
+        if self._num_workers > 1:
+            return self._select_move_parallel(state, legal_moves)
+
         # Determine our perspective
         acting_player = self._get_acting_player(state)
 
@@ -169,12 +189,7 @@ class ISMCTSStrategy(Strategy):
         root = ISMCTSNode()
 
         # Run ISMCTS iterations
-        for _ in range(self._iterations):
-            # Determinize: sample a possible state
-            det_state = self._determinize(state, acting_player)
-
-            # Run one MCTS iteration on this determinization
-            self._run_iteration(root, det_state, acting_player)
+        self._search(root, state, acting_player)
 
         # Select move with highest visit count
         best_move = max(
@@ -184,6 +199,50 @@ class ISMCTSStrategy(Strategy):
 
         return best_move
 
+    def _select_move_parallel(self, state: GameState, legal_moves: list[Move]) -> Move:
+        """Run ISMCTS in parallel using root parallelization.
+
+        Each worker samples its own determinizations into an independent
+        tree; the move with the most root visits across all trees wins.
+        """
+        iterations_per_worker = max(1, self._iterations // self._num_workers)
+
+        with ProcessPoolExecutor(max_workers=self._num_workers) as pool:
+            futures = [
+                pool.submit(
+                    _run_ismcts_worker,
+                    state,
+                    self._worker_strategy(
+                        iterations_per_worker,
+                        (self._seed + i) if self._seed is not None else None,
+                    ),
+                )
+                for i in range(self._num_workers)
+            ]
+            results = [f.result() for f in futures]
+
+        # Sum visit counts per move; ties go to the earliest legal move
+        totals = {move: 0 for move in legal_moves}
+        for result in results:
+            for move, visits in result.items():
+                if move in totals:
+                    totals[move] += visits
+        return max(legal_moves, key=totals.__getitem__)
+
+    def _worker_strategy(self, iterations: int, seed: int | None) -> ISMCTSStrategy:
+        """Serial copy of this strategy, with our card knowledge, for one worker."""
+        worker = ISMCTSStrategy(
+            iterations=iterations,
+            exploration_constant=self._exploration,
+            simulation_strategy=self._custom_simulation_strategy,
+            seed=seed,
+            max_simulation_depth=self._max_sim_depth,
+            determinization_batch_size=self._det_batch_size,
+        )
+        worker._player_index = self._player_index
+        worker._known_cards = set(self._known_cards)
+        return worker
+
     def _get_acting_player(self, state: GameState) -> int:
         """Get the player who needs to act."""
         if state.phase == GamePhase.COUNTER:
@@ -194,6 +253,22 @@ class ISMCTSStrategy(Strategy):
             return state.seven_state.player
         return state.current_player
 
+    def _search(self, root: ISMCTSNode, state: GameState, perspective_player: int) -> None:
+        """Run all iterations for one move from root.
+
+        Each sampled determinization is reused for up to
+        determinization_batch_size iterations before a new one is drawn.
+        """
+        batch_size = self._det_batch_size
+        det_state = state
+        for i in range(self._iterations):
+            if i % batch_size == 0:
+                # Determinize: sample a possible state
+                det_state = self._determinize(state, perspective_player)
+
+            # Run one MCTS iteration on this determinization
+            self._run_iteration(root, det_state, perspective_player)
+
     def _determinize(self, state: GameState, perspective_player: int) -> GameState:
         """Create a determinized state by sampling unknown cards.
 
@@ -242,44 +317,26 @@ class ISMCTSStrategy(Strategy):
         known_locations.update(self._known_cards)
 
         # All unknown cards could be in opponent's hand or deck
-        all_cards = set(create_deck())
-        unknown_cards = list(all_cards - known_locations)
+        unknown_cards = list(_ALL_CARDS.difference(known_locations))
         self._rng.shuffle(unknown_cards)
 
         # Assign unknown cards
         opp_hand_size = len(state.players[opponent].hand)
+        if not unknown_cards and opp_hand_size == 0 and not state.deck:
+            # Nothing hidden left to sample: the real state is the only one
+            return state
         sampled_opp_hand = tuple(unknown_cards[:opp_hand_size])
         sampled_deck = tuple(unknown_cards[opp_hand_size:])
 
-        # Create new player states
-        opp_state = state.players[opponent]
-        new_opp_state = PlayerState(
-            hand=sampled_opp_hand,
-            points_field=opp_state.points_field,
-            permanents=opp_state.permanents,
-            jacks=opp_state.jacks,
-        )
-
+        # Only the opponent's hand and the deck change; everything else is
+        # shared with the real state
+        new_opp_state = state.players[opponent].with_hand(sampled_opp_hand)
         if opponent == 0:
             new_players = (new_opp_state, state.players[1])
         else:
             new_players = (state.players[0], new_opp_state)
 
-        # Create determinized state
-        return GameState(
-            players=new_players,
-            deck=sampled_deck,
-            scrap=state.scrap,
-            current_player=state.current_player,
-            phase=state.phase,
-            turn_number=state.turn_number,
-            consecutive_passes=state.consecutive_passes,
-            counter_state=state.counter_state,
-            seven_state=state.seven_state,
-            four_state=state.four_state,
-            winner=state.winner,
-            win_reason=state.win_reason,
-        )
+        return state.with_updates(players=new_players, deck=sampled_deck)
 
     def _run_iteration(
         self, root: ISMCTSNode, state: GameState, perspective_player: int
@@ -294,6 +351,9 @@ class ISMCTSStrategy(Strategy):
         node = root
         current_state = state
         path: list[tuple[ISMCTSNode, int | None]] = [(root, None)]
+        exploration = self._exploration
+        log = math.log
+        sqrt = math.sqrt
 
         # Selection & Expansion
         while not current_state.is_game_over:
@@ -303,31 +363,43 @@ class ISMCTSStrategy(Strategy):
 
             acting_player = self._get_acting_player(current_state)
 
-            # Mark available children
+            # One pass over the legal moves: mark each child available, collect
+            # unvisited ones for expansion, and track the best UCB1 score among
+            # the rest in case every child has already been visited.
+            # (ucb1_ismcts inlined; scored children never have zero visits.)
+            unvisited = []
+            best: tuple[Move, ISMCTSNode] | None = None
+            best_score = -math.inf
+            children = node.children
             for move in legal_moves:
-                child = node.get_or_create_child(move)
+                # get_or_create_child, inlined
+                child = children.get(move)
+                if child is None:
+                    child = children[move] = ISMCTSNode(move=move, parent=node)
                 child.availability_count += 1
-
-            # Find unvisited moves
-            unvisited = [m for m in legal_moves if node.children[m].visits == 0]
+                visits = child.visits
+                if visits == 0:
+                    unvisited.append((move, child))
+                elif not unvisited:
+                    score = child.wins / visits + exploration * sqrt(
+                        log(child.availability_count) / visits
+                    )
+                    if score > best_score:
+                        best_score = score
+                        best = (move, child)
 
             if unvisited:
                 # Expand: pick random unvisited move
-                move = self._rng.choice(unvisited)
-                child = node.children[move]
+                move, child = self._rng.choice(unvisited)
                 current_state = execute_move(current_state, move)
                 path.append((child, acting_player))
                 node = child
                 break
             else:
-                # Select: UCB1 among available children
-                available_children = [
-                    (m, node.children[m]) for m in legal_moves
-                ]
-                move, child = max(
-                    available_children,
-                    key=lambda x: x[1].ucb1_ismcts(self._exploration)
-                )
+                # Select: highest UCB1 among available children; every
+                # child is visited here, so the loop scored at least one
+                assert best is not None
+                move, child = best
                 current_state = execute_move(current_state, move)
                 path.append((child, acting_player))
                 node = child
@@ -359,23 +431,22 @@ class ISMCTSStrategy(Strategy):
         Returns:
             Win value (1.0 = win, 0.0 = loss, 0.5 = draw).
         """
-        from cuttle_engine.executor import IllegalMoveError
-
         current_state = state
-        depth = 0
+        select_move = self._simulation_strategy.select_move
 
-        while not current_state.is_game_over and depth < self._max_sim_depth:
+        for _ in range(self._max_sim_depth):
+            if current_state.is_game_over:
+                break
             moves = generate_legal_moves(current_state)
             if not moves:
                 break
 
-            move = self._simulation_strategy.select_move(current_state, moves)
+            move = select_move(current_state, moves)
             try:
                 current_state = execute_move(current_state, move)
             except IllegalMoveError:
                 # Move generator bug - abort with neutral result
                 break
-            depth += 1
 
         if not current_state.is_game_over:
             # Use point-based heuristic
@@ -409,9 +480,7 @@ class ISMCTSStrategy(Strategy):
         acting_player = self._get_acting_player(state)
         root = ISMCTSNode()
 
-        for _ in range(self._iterations):
-            det_state = self._determinize(state, acting_player)
-            self._run_iteration(root, det_state, acting_player)
+        self._search(root, state, acting_player)
 
         stats = {}
         for move, child in root.children.items():
@@ -424,3 +493,13 @@ class ISMCTSStrategy(Strategy):
             }
 
         return stats
+
+
+def _run_ismcts_worker(state: GameState, strategy: ISMCTSStrategy) -> dict[Move, int]:
+    """Search from state with a serial ISMCTSStrategy and return root visit counts.
+
+    Module-level so it can be pickled and executed in a separate process.
+    """
+    root = ISMCTSNode()
+    strategy._search(root, state, strategy._get_acting_player(state))
+    return {move: child.visits for move, child in root.children.items()}
@@ -7,6 +7,7 @@ Supports multiple providers:
 """
 
 from strategies.llm.base import LLMProvider, LLMResponse, ProviderConfig
+from strategies.llm.cache import LLMCache
 from strategies.llm.anthropic_provider import AnthropicProvider
 from strategies.llm.openrouter_provider import OpenRouterProvider
 from strategies.llm.ollama_provider import OllamaProvider
@@ -21,6 +22,7 @@ __all__ = [
     "LLMProvider",
     "LLMResponse",
     "ProviderConfig",
+    "LLMCache",
     # Providers
     "AnthropicProvider",
     "OpenRouterProvider",
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
 from typing import Any
 
@@ -27,25 +28,27 @@ class AnthropicProvider(LLMProvider):
         """
         self._config = config or ProviderConfig()
         self._client = None
+        self._client_lock = threading.Lock()
 
     def _get_client(self):
-        """Lazy-load the Anthropic client."""
-        if self._client is None:
-            api_key = self._config.api_key or os.environ.get("ANTHROPIC_API_KEY")
-            if not api_key:
-                raise RuntimeError(
-                    "ANTHROPIC_API_KEY environment variable not set. "
-                    "Set it in your environment or pass it in ProviderConfig."
-                )
-
-            try:
-                import anthropic
-                self._client = anthropic.Anthropic(api_key=api_key)
-            except ImportError:
-                raise RuntimeError(
-                    "anthropic package not installed. Run: pip install anthropic"
-                )
-        return self._client
+        """Lazy-load the Anthropic client (thread-safe, see complete_batch)."""
+        with self._client_lock:
+            if self._client is None:
+                api_key = self._config.api_key or os.environ.get("ANTHROPIC_API_KEY")
+                if not api_key:
+                    raise RuntimeError(
+                        "ANTHROPIC_API_KEY environment variable not set. "
+                        "Set it in your environment or pass it in ProviderConfig."
+                    )
+
+                try:
+                    import anthropic
+                    self._client = anthropic.Anthropic(api_key=api_key)
+                except ImportError:
+                    raise RuntimeError(
+                        "anthropic package not installed. Run: pip install anthropic"
+                    )
+            return self._client
 
     @property
     def name(self) -> str:
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
@@ -50,6 +52,59 @@ class LLMProvider(ABC):
         """
         ...
 
+    async def acomplete(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float = 0.3,
+        max_tokens: int = 1024,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Async version of complete.
+
+        The default runs complete in a worker thread; providers with a
+        native async client override this.
+        """
+        return await asyncio.to_thread(
+            self.complete, prompt, model, temperature, max_tokens, **kwargs
+        )
+
+    def complete_batch(
+        self,
+        prompts: list[str],
+        model: str,
+        temperature: float = 0.3,
+        max_tokens: int = 1024,
+        max_concurrent: int = 8,
+        **kwargs: Any,
+    ) -> list[LLMResponse]:
+        """Send several completion requests concurrently.
+
+        Requests run on a thread pool and share the provider's HTTP client,
+        so its connections are reused rather than set up per request.
+        Providers must therefore create their client thread-safely. If
+        requests fail, the first failure in prompt order is raised.
+
+        Args:
+            prompts: The prompts to send.
+            model: Model name.
+            temperature: Sampling temperature.
+            max_tokens: Maximum tokens in each response.
+            max_concurrent: Maximum requests in flight at once.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            One LLMResponse per prompt, in prompt order.
+        """
+        def complete_one(prompt: str) -> LLMResponse:
+            return self.complete(prompt, model, temperature, max_tokens, **kwargs)
+
+        if len(prompts) <= 1 or max_concurrent <= 1:
+            return [complete_one(prompt) for prompt in prompts]
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrent, len(prompts))) as pool:
+            return list(pool.map(complete_one, prompts))
+
     @abstractmethod
     def estimate_cost(
         self,
@@ -0,0 +1,126 @@
+"""On-disk cache of LLM responses for deterministic replays."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from strategies.llm.base import LLMResponse
+
+DEFAULT_CACHE_PATH = Path("~/.cuttle/llm_cache.db")
+
+
+class LLMCache:
+    """SQLite-backed cache of LLM responses keyed on the request.
+
+    Only sampling-free requests (temperature 0) are cached by default, since
+    a cached answer is a replay of an earlier one; pass any_temperature=True
+    to cache every request. The cache persists across runs and is safe to
+    share between threads (each thread gets its own connection).
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        ttl: float | None = None,
+        any_temperature: bool = False,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file (created if missing).
+            ttl: Seconds before an entry expires (None = never).
+            any_temperature: Also cache requests with temperature > 0.
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.any_temperature = any_temperature
+        self._local = threading.local()
+        conn = self._get_connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " response_json TEXT NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        conn.commit()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        conn: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30.0)
+            conn.execute("PRAGMA journal_mode = WAL")
+            self._local.connection = conn
+        return conn
+
+    def should_cache(self, temperature: float) -> bool:
+        """Whether requests at this temperature are cached."""
+        return self.any_temperature or temperature == 0
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """Cache key for a request: SHA-256 of its parameters."""
+        request = {
+            "provider": provider,
+            "model": model,
+            "prompt": prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Return the cached response for key, or None if missing or expired.
+
+        Cached responses report zero latency and carry no raw_response.
+        """
+        row = self._get_connection().execute(
+            "SELECT response_json, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        response_json, created_at = row
+        if self.ttl is not None and time.time() - created_at > self.ttl:
+            return None
+        data = json.loads(response_json)
+        return LLMResponse(
+            content=data["content"],
+            input_tokens=data["input_tokens"],
+            output_tokens=data["output_tokens"],
+            model=data["model"],
+            latency_ms=0.0,
+        )
+
+    def set(self, key: str, response: LLMResponse) -> None:
+        """Store response under key, replacing any earlier entry."""
+        response_json = json.dumps({
+            "content": response.content,
+            "input_tokens": response.input_tokens,
+            "output_tokens": response.output_tokens,
+            "model": response.model,
+        })
+        conn = self._get_connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, response_json, created_at)"
+            " VALUES (?, ?, ?)",
+            (key, response_json, time.time()),
+        )
+        conn.commit()
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        conn = self._get_connection()
+        conn.execute("DELETE FROM responses")
+        conn.commit()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
 from typing import Any
 
@@ -36,28 +37,30 @@ class OllamaProvider(LLMProvider):
         """
         self._config = config or ProviderConfig()
         self._client = None
+        self._client_lock = threading.Lock()
 
     def _get_client(self):
-        """Lazy-load the HTTP client."""
-        if self._client is None:
-            try:
-                import httpx
-            except ImportError:
-                raise RuntimeError(
-                    "httpx package not installed. Run: pip install httpx"
+        """Lazy-load the HTTP client (thread-safe, see complete_batch)."""
+        with self._client_lock:
+            if self._client is None:
+                try:
+                    import httpx
+                except ImportError:
+                    raise RuntimeError(
+                        "httpx package not installed. Run: pip install httpx"
+                    )
+
+                host = (
+                    self._config.base_url
+                    or os.environ.get("OLLAMA_HOST")
+                    or self.DEFAULT_HOST
                 )
 
-            host = (
-                self._config.base_url
-                or os.environ.get("OLLAMA_HOST")
-                or self.DEFAULT_HOST
-            )
-
-            self._client = httpx.Client(
-                base_url=host,
-                timeout=self._config.timeout or 120.0,  # Local models can be slower
-            )
-        return self._client
+                self._client = httpx.Client(
+                    base_url=host,
+                    timeout=self._config.timeout or 120.0,  # Local models can be slower
+                )
+            return self._client
 
     @property
     def name(self) -> str:
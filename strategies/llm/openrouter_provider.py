@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import os
+import threading
 import time
-from typing import Any
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
 from strategies.llm.base import LLMProvider, LLMResponse, ProviderConfig
 from core.pricing import get_cost
 
+if TYPE_CHECKING:
+    import httpx
+
 
 class OpenRouterProvider(LLMProvider):
     """LLM provider for OpenRouter API.
@@ -59,40 +66,81 @@ class OpenRouterProvider(LLMProvider):
             config: Optional provider configuration.
         """
         self._config = config or ProviderConfig()
-        self._client = None
-
-    def _get_client(self):
-        """Lazy-load the HTTP client."""
-        if self._client is None:
-            api_key = self._config.api_key or os.environ.get("OPENROUTER_API_KEY")
-            if not api_key:
-                raise RuntimeError(
-                    "OPENROUTER_API_KEY environment variable not set. "
-                    "Set it in your environment or pass it in ProviderConfig."
-                )
-
-            try:
-                import httpx
-            except ImportError:
-                raise RuntimeError(
-                    "httpx package not installed. Run: pip install httpx"
-                )
-
-            # Use longer default timeout for OpenRouter
-            timeout = self._config.timeout
-            if timeout == 60.0:  # Default from ProviderConfig
-                timeout = self.DEFAULT_TIMEOUT
-
-            self._client = httpx.Client(
-                base_url=self._config.base_url or self.BASE_URL,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "HTTP-Referer": "https://github.com/cuttle-simulation",
-                    "X-Title": "Cuttle Simulation",
-                },
-                timeout=timeout,
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _client_settings(self) -> dict[str, Any]:
+        """Connection settings shared by the sync and async clients."""
+        api_key = self._config.api_key or os.environ.get("OPENROUTER_API_KEY")
+        if not api_key:
+            raise RuntimeError(
+                "OPENROUTER_API_KEY environment variable not set. "
+                "Set it in your environment or pass it in ProviderConfig."
+            )
+
+        # Use longer default timeout for OpenRouter
+        timeout = self._config.timeout
+        if timeout == 60.0:  # Default from ProviderConfig
+            timeout = self.DEFAULT_TIMEOUT
+
+        return {
+            "base_url": self._config.base_url or self.BASE_URL,
+            "headers": {
+                "Authorization": f"Bearer {api_key}",
+                "HTTP-Referer": "https://github.com/cuttle-simulation",
+                "X-Title": "Cuttle Simulation",
+            },
+            "timeout": timeout,
+        }
+
+    def _get_client(self) -> httpx.Client:
+        """Lazy-load the HTTP client (thread-safe, see complete_batch)."""
+        with self._client_lock:
+            if self._client is None:
+                settings = self._client_settings()
+                self._client = _import_httpx().Client(**settings)
+            return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Lazy-load the async HTTP client for the running event loop.
+
+        Uses HTTP/2 when the h2 package is installed (httpx[http2]), so
+        concurrent requests share one connection instead of each opening
+        their own. The client's pooled connections belong to the loop that
+        opened them, so a client left over from an earlier loop (e.g. a
+        previous asyncio.run) is dropped and a new one built.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is not None and self._async_client_loop is not loop:
+            # Its loop is gone or different; the connections can't be closed
+            # from here, only abandoned
+            self._async_client = None
+        if self._async_client is None:
+            settings = self._client_settings()
+            httpx_module = _import_httpx()
+            self._async_client = httpx_module.AsyncClient(
+                **settings,
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx_module.Limits(max_connections=100, max_keepalive_connections=20),
             )
-        return self._client
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client and its connection pool, if open."""
+        client = self._async_client
+        self._async_client = None
+        self._async_client_loop = None
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> OpenRouterProvider:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     @property
     def name(self) -> str:
@@ -127,40 +175,53 @@ class OpenRouterProvider(LLMProvider):
 
         client = self._get_client()
 
-        # Use extended timeout for slow reasoning models
-        request_timeout = None
-        if resolved_model in self.SLOW_MODELS:
-            request_timeout = self.SLOW_MODEL_TIMEOUT
-
         start_time = time.perf_counter()
 
         response = client.post(
             "/chat/completions",
-            json={
-                "model": resolved_model,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": temperature,
-                "max_tokens": max_tokens,
-            },
-            timeout=request_timeout,  # Override timeout for slow models
+            json=_request_body(resolved_model, prompt, temperature, max_tokens),
+            timeout=self._request_timeout(resolved_model),
         )
         response.raise_for_status()
         data = response.json()
 
         latency_ms = (time.perf_counter() - start_time) * 1000
+        return _parse_response(data, resolved_model, latency_ms)
+
+    async def acomplete(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float = 0.3,
+        max_tokens: int = 1024,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Send a completion request to OpenRouter without blocking the event loop.
+
+        Same arguments and result as complete.
+        """
+        resolved_model = self.AVAILABLE_MODELS.get(model.lower(), model)
+
+        client = self._get_async_client()
 
-        # Extract content and usage
-        content = data["choices"][0]["message"]["content"].strip()
-        usage = data.get("usage", {})
-
-        return LLMResponse(
-            content=content,
-            input_tokens=usage.get("prompt_tokens", 0),
-            output_tokens=usage.get("completion_tokens", 0),
-            model=resolved_model,
-            latency_ms=latency_ms,
-            raw_response=data,
+        start_time = time.perf_counter()
+
+        response = await client.post(
+            "/chat/completions",
+            json=_request_body(resolved_model, prompt, temperature, max_tokens),
+            timeout=self._request_timeout(resolved_model),
         )
+        response.raise_for_status()
+        data = response.json()
+
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        return _parse_response(data, resolved_model, latency_ms)
+
+    def _request_timeout(self, resolved_model: str) -> float | None:
+        """Per-request timeout override (extended for slow reasoning models)."""
+        if resolved_model in self.SLOW_MODELS:
+            return self.SLOW_MODEL_TIMEOUT
+        return None
 
     def estimate_cost(
         self,
@@ -178,6 +239,45 @@ class OpenRouterProvider(LLMProvider):
         return api_key is not None
 
 
+def _import_httpx() -> ModuleType:
+    """Import httpx, which the llm extra installs."""
+    try:
+        import httpx
+    except ImportError:
+        raise RuntimeError(
+            "httpx package not installed. Run: pip install httpx"
+        )
+    return httpx
+
+
+def _request_body(
+    resolved_model: str, prompt: str, temperature: float, max_tokens: int
+) -> dict[str, Any]:
+    """JSON body of a chat completion request."""
+    return {
+        "model": resolved_model,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+
+
+def _parse_response(data: dict[str, Any], resolved_model: str, latency_ms: float) -> LLMResponse:
+    """Build an LLMResponse from a chat completion response body."""
+    # Extract content and usage
+    content = data["choices"][0]["message"]["content"].strip()
+    usage = data.get("usage", {})
+
+    return LLMResponse(
+        content=content,
+        input_tokens=usage.get("prompt_tokens", 0),
+        output_tokens=usage.get("completion_tokens", 0),
+        model=resolved_model,
+        latency_ms=latency_ms,
+        raw_response=data,
+    )
+
+
 # Convenience aliases for common models
 # Fast models (recommended for interactive play)
 QWEN2_72B = "qwen/qwen-2.5-72b-instruct"
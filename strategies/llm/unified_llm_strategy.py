@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from cuttle_engine.moves import Move
     from cuttle_engine.state import GameState
     from core.cost_tracker import CostTracker
+    from strategies.llm.cache import LLMCache
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,7 @@ class UnifiedLLMStrategy(Strategy):
         temperature: float = 0.3,
         max_tokens: int = 1024,
         cost_tracker: "CostTracker | None" = None,
+        cache: "LLMCache | None" = None,
     ):
         """Initialize the unified LLM strategy.
 
@@ -57,6 +59,8 @@ class UnifiedLLMStrategy(Strategy):
             temperature: Sampling temperature (0-1).
             max_tokens: Maximum tokens in response.
             cost_tracker: Optional cost tracker for budget enforcement.
+            cache: Optional response cache; identical prompts are answered
+                from it instead of calling the provider (see LLMCache).
         """
         self._provider = provider
         self._provider_name = provider.name
@@ -64,6 +68,9 @@ class UnifiedLLMStrategy(Strategy):
         self._temperature = temperature
         self._max_tokens = max_tokens
         self._cost_tracker = cost_tracker
+        self._cache = cache
+        self._cache_hits = 0
+        self._cache_misses = 0
         self._player_index: int | None = None
         self._last_thinking: LLMThinking | None = None
 
@@ -76,6 +83,11 @@ class UnifiedLLMStrategy(Strategy):
         """Get the last thinking/reasoning from the LLM."""
         return self._last_thinking
 
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Response cache hits and misses for this strategy."""
+        return {"hits": self._cache_hits, "misses": self._cache_misses}
+
     def on_game_start(self, state: "GameState", player_index: int) -> None:
         """Remember which player we are."""
         self._player_index = player_index
@@ -87,6 +99,74 @@ class UnifiedLLMStrategy(Strategy):
         legal_moves: list["Move"],
     ) -> "Move":
         """Select a move using the LLM provider."""
+        forced = self._forced_move(legal_moves)
+        if forced is not None:
+            return forced
+
+        prompt = self._build_prompt(state, legal_moves)
+        cache_key, cached = self._cache_lookup(prompt)
+        if cached is not None:
+            return self._apply_response(prompt, legal_moves, cached, from_cache=True)
+        try:
+            logger.info(f"LLM API call: provider={self._provider_name}, model={self._model}")
+
+            response = self._provider.complete(
+                prompt=prompt,
+                model=self._model,
+                temperature=self._temperature,
+                max_tokens=self._max_tokens,
+            )
+        except Exception as e:
+            return self._fall_back(prompt, legal_moves, None, e)
+        return self._apply_response(prompt, legal_moves, response, cache_key=cache_key)
+
+    async def aselect_move(
+        self,
+        state: "GameState",
+        legal_moves: list["Move"],
+    ) -> "Move":
+        """Async select_move: awaits the provider, so calls from many games overlap."""
+        forced = self._forced_move(legal_moves)
+        if forced is not None:
+            return forced
+
+        prompt = self._build_prompt(state, legal_moves)
+        cache_key, cached = self._cache_lookup(prompt)
+        if cached is not None:
+            return self._apply_response(prompt, legal_moves, cached, from_cache=True)
+        try:
+            logger.info(f"LLM API call: provider={self._provider_name}, model={self._model}")
+
+            response = await self._provider.acomplete(
+                prompt=prompt,
+                model=self._model,
+                temperature=self._temperature,
+                max_tokens=self._max_tokens,
+            )
+        except Exception as e:
+            return self._fall_back(prompt, legal_moves, None, e)
+        return self._apply_response(prompt, legal_moves, response, cache_key=cache_key)
+
+    def _cache_lookup(self, prompt: str) -> tuple[str | None, LLMResponse | None]:
+        """Look prompt up in the response cache.
+
+        Returns the cache key (None when this request isn't cached) and the
+        cached response, if any.
+        """
+        if self._cache is None or not self._cache.should_cache(self._temperature):
+            return None, None
+        key = self._cache.make_key(
+            self._provider_name, self._model, prompt, self._temperature, self._max_tokens
+        )
+        cached = self._cache.get(key)
+        if cached is None:
+            self._cache_misses += 1
+        else:
+            self._cache_hits += 1
+        return key, cached
+
+    def _forced_move(self, legal_moves: list["Move"]) -> "Move | None":
+        """Return the move without asking the LLM if there is no real choice."""
         if not legal_moves:
             raise ValueError("No legal moves available")
 
@@ -105,28 +185,31 @@ class UnifiedLLMStrategy(Strategy):
                 cost_usd=0,
             )
             return legal_moves[0]
+        return None
 
-        # Build the prompt
-        prompt = self._build_prompt(state, legal_moves)
-        response_text = ""
-        error_msg = None
-        response: LLMResponse | None = None
+    def _apply_response(
+        self,
+        prompt: str,
+        legal_moves: list["Move"],
+        response: LLMResponse,
+        cache_key: str | None = None,
+        from_cache: bool = False,
+    ) -> "Move":
+        """Record cost and thinking for a provider response and pick its move.
 
+        A response replayed from the cache cost nothing, so it is not charged
+        to the cost tracker; a fresh one is stored under cache_key if given,
+        once it has produced a move.
+        """
         try:
-            logger.info(f"LLM API call: provider={self._provider_name}, model={self._model}")
-
-            response = self._provider.complete(
-                prompt=prompt,
-                model=self._model,
-                temperature=self._temperature,
-                max_tokens=self._max_tokens,
-            )
-
             response_text = response.content
-            logger.info(f"LLM response received in {response.latency_ms:.0f}ms")
+            if from_cache:
+                logger.info("LLM response served from cache")
+            else:
+                logger.info(f"LLM response received in {response.latency_ms:.0f}ms")
 
             # Track cost if tracker provided
-            if self._cost_tracker:
+            if self._cost_tracker and not from_cache:
                 self._cost_tracker.record_cost(
                     provider=self._provider_name,
                     model=response.model,
@@ -138,7 +221,7 @@ class UnifiedLLMStrategy(Strategy):
             move_index = self._parse_move_index(response_text, len(legal_moves))
 
             # Calculate cost
-            cost_usd = self._provider.estimate_cost(
+            cost_usd = 0.0 if from_cache else self._provider.estimate_cost(
                 self._model, response.input_tokens, response.output_tokens
             )
 
@@ -155,32 +238,58 @@ class UnifiedLLMStrategy(Strategy):
                 cost_usd=cost_usd,
             )
 
-            return legal_moves[move_index]
+            move = legal_moves[move_index]
 
         except Exception as e:
-            error_msg = str(e)
-            logger.error(f"LLM error: {e}, falling back to first legal move")
+            return self._fall_back(prompt, legal_moves, response, e)
 
-            # Get token counts from response if available
-            input_tokens = response.input_tokens if response else 0
-            output_tokens = response.output_tokens if response else 0
-            latency_ms = response.latency_ms if response else 0
+        if cache_key is not None and not from_cache:
+            self._cache_store(cache_key, response)
+        return move
 
-            self._last_thinking = LLMThinking(
-                prompt=prompt,
-                response=response_text or "(no response)",
-                model=self._model,
-                provider=self._provider_name,
-                chosen_move_index=0,
-                chosen_move_description=str(legal_moves[0]),
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                latency_ms=latency_ms,
-                cost_usd=0,
-                error=error_msg,
-            )
+    def _cache_store(self, key: str, response: LLMResponse) -> None:
+        """Store a response in the cache.
 
-            return legal_moves[0]
+        The response is already paid for and played, so a failed write
+        (locked database, full disk) is logged rather than raised.
+        """
+        if self._cache is None:
+            return
+        try:
+            self._cache.set(key, response)
+        except Exception as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def _fall_back(
+        self,
+        prompt: str,
+        legal_moves: list["Move"],
+        response: LLMResponse | None,
+        error: Exception,
+    ) -> "Move":
+        """Record a failed LLM call and play the first legal move."""
+        logger.error(f"LLM error: {error}, falling back to first legal move")
+
+        # Get token counts from response if available
+        input_tokens = response.input_tokens if response else 0
+        output_tokens = response.output_tokens if response else 0
+        latency_ms = response.latency_ms if response else 0
+
+        self._last_thinking = LLMThinking(
+            prompt=prompt,
+            response=(response.content if response else "") or "(no response)",
+            model=self._model,
+            provider=self._provider_name,
+            chosen_move_index=0,
+            chosen_move_description=str(legal_moves[0]),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            latency_ms=latency_ms,
+            cost_usd=0,
+            error=str(error),
+        )
+
+        return legal_moves[0]
 
     def _build_prompt(
         self,
@@ -261,6 +370,7 @@ def create_llm_strategy(
     model: str,
     temperature: float = 0.3,
     cost_tracker: "CostTracker | None" = None,
+    cache: "LLMCache | None" = None,
     **provider_kwargs: Any,
 ) -> UnifiedLLMStrategy:
     """Factory function to create an LLM strategy.
@@ -270,6 +380,7 @@ def create_llm_strategy(
         model: Model name or alias.
         temperature: Sampling temperature.
         cost_tracker: Optional cost tracker.
+        cache: Optional response cache.
         **provider_kwargs: Additional provider configuration.
 
     Returns:
@@ -296,4 +407,5 @@ def create_llm_strategy(
         model=model,
         temperature=temperature,
         cost_tracker=cost_tracker,
+        cache=cache,
     )
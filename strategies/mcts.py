@@ -9,8 +9,8 @@ from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from cuttle_engine.executor import execute_move
-from cuttle_engine.move_generator import generate_legal_moves
+from cuttle_engine.executor import IllegalMoveError, execute_move
+from cuttle_engine.move_generator import generate_legal_moves, get_legal_moves
 from cuttle_engine.state import GamePhase
 from strategies.base import Strategy
 from strategies.heuristic import HeuristicStrategy
@@ -20,6 +20,16 @@ if TYPE_CHECKING:
     from cuttle_engine.moves import Move
     from cuttle_engine.state import GameState
 
+# Rollouts stop early once this many consecutive moves change neither
+# player's points nor the deck size; the position is scored as at max depth
+_STALL_LIMIT = 30
+
+
+def _progress_key(state: GameState) -> tuple[int, int, int]:
+    """What a rollout must change to count as making progress."""
+    players = state.players
+    return (players[0].point_total, players[1].point_total, len(state.deck))
+
 
 class EpsilonGreedyStrategy(Strategy):
     """Hybrid strategy: mostly heuristic with some random exploration.
@@ -79,7 +89,7 @@ class MCTSNode:
 
     def __post_init__(self):
         if self.untried_moves is None:
-            moves = generate_legal_moves(self.state)
+            moves = get_legal_moves(self.state)
             # Order moves by heuristic score (best first) for better expansion order
             heuristic = HeuristicStrategy()
             # Calculate context for heuristic scoring
@@ -88,10 +98,8 @@ class MCTSNode:
             opp_points = self.state.players[1 - player_idx].point_total
             point_diff = my_points - opp_points
             # Use negative index as tiebreaker to maintain stable sort
-            scored = [
-                (heuristic._score_move(self.state, m, player_idx, point_diff), -i, m)
-                for i, m in enumerate(moves)
-            ]
+            scores = heuristic._score_moves(self.state, moves, player_idx, point_diff)
+            scored = [(score, -i, m) for i, (score, m) in enumerate(zip(scores, moves))]
             scored.sort(reverse=True)  # Highest score first
             self.untried_moves = [m for _, _, m in scored]
 
@@ -363,10 +371,10 @@ class MCTSStrategy(Strategy):
         Returns:
             1.0 if perspective_player wins, 0.0 if loses, 0.5 for draw, None if max depth reached.
         """
-        from cuttle_engine.executor import IllegalMoveError
-
         current_state = state
         depth = 0
+        last_progress = _progress_key(state)
+        stalled = 0
 
         while not current_state.is_game_over and depth < self._max_sim_depth:
             moves = generate_legal_moves(current_state)
@@ -381,8 +389,17 @@ class MCTSStrategy(Strategy):
                 break
             depth += 1
 
+            progress = _progress_key(current_state)
+            if progress != last_progress:
+                last_progress = progress
+                stalled = 0
+            else:
+                stalled += 1
+                if stalled >= _STALL_LIMIT:
+                    break
+
         if not current_state.is_game_over:
-            # Reached max depth - use heuristic (point difference)
+            # Reached max depth or stalled - use heuristic (point difference)
             if perspective_player is None:
                 return 0.5
             my_points = current_state.players[perspective_player].point_total
@@ -570,10 +587,10 @@ def _run_mcts_worker(
         return s.current_player
 
     def simulate(s: GameState, perspective_player: int | None) -> float | None:
-        from cuttle_engine.executor import IllegalMoveError
-
         current_state = s
         depth = 0
+        last_progress = _progress_key(s)
+        stalled = 0
 
         while not current_state.is_game_over and depth < max_sim_depth:
             moves = generate_legal_moves(current_state)
@@ -586,6 +603,15 @@ def _run_mcts_worker(
                 break
             depth += 1
 
+            progress = _progress_key(current_state)
+            if progress != last_progress:
+                last_progress = progress
+                stalled = 0
+            else:
+                stalled += 1
+                if stalled >= _STALL_LIMIT:
+                    break
+
         if not current_state.is_game_over:
             if perspective_player is None:
                 return 0.5
@@ -26,6 +26,8 @@ class RandomStrategy(Strategy):
         """
         self._rng = random.Random(seed)
         self._seed = seed
+        # Bound once: rollouts call select_move in their innermost loop
+        self._randrange = self._rng.randrange
 
     @property
     def name(self) -> str:
@@ -35,9 +37,12 @@ class RandomStrategy(Strategy):
         """Select a random legal move."""
         if not legal_moves:
             raise ValueError("No legal moves available")
-        return self._rng.choice(legal_moves)
+        # randrange(n) makes the same draw as rng.choice(), so seeded games
+        # replay the stream earlier versions recorded.
+        return legal_moves[self._randrange(len(legal_moves))]
 
     def reset_seed(self, seed: int | None = None) -> None:
         """Reset the random number generator with a new seed."""
         self._seed = seed
         self._rng = random.Random(seed)
+        self._randrange = self._rng.randrange
@@ -2,7 +2,15 @@
 
 import pytest
 
-from cuttle_engine.cards import Card, CardType, Rank, Suit, create_deck, shuffle_deck
+from cuttle_engine.cards import (
+    Card,
+    CardType,
+    Rank,
+    Suit,
+    card_strings,
+    create_deck,
+    shuffle_deck,
+)
 
 
 class TestSuit:
@@ -49,6 +57,17 @@ class TestCard:
         card = Card(Rank.ACE, Suit.SPADES)
         assert str(card) == "A♠"
 
+    def test_card_string_is_cached(self):
+        """String form is computed once per interned card."""
+        card = Card(Rank.TEN, Suit.HEARTS)
+        assert str(card) == "10♥"
+        assert str(card) is str(Card(Rank.TEN, Suit.HEARTS))
+
+    def test_card_strings(self):
+        cards = [Card(Rank.ACE, Suit.SPADES), Card(Rank.TEN, Suit.HEARTS)]
+        assert card_strings(cards) == [str(c) for c in cards]
+        assert card_strings(()) == []
+
     def test_card_repr(self):
         card = Card(Rank.ACE, Suit.SPADES)
         assert repr(card) == "Card(ACE, SPADES)"
@@ -158,6 +177,13 @@ class TestDeck:
         deck = create_deck()
         assert len(deck) == 52
 
+    def test_deck_uses_interned_cards(self):
+        """Each new deck is a fresh list of the same interned cards."""
+        deck1 = create_deck()
+        deck2 = create_deck()
+        assert deck1 is not deck2
+        assert all(a is b for a, b in zip(deck1, deck2))
+
     def test_deck_contains_all_cards(self):
         deck = create_deck()
         for suit in Suit:
@@ -501,3 +501,20 @@ class TestNineEffect:
 
         assert queen not in new_state.players[1].permanents
         assert queen in new_state.players[1].hand
+
+
+class TestDispatch:
+    def test_move_subclass_runs_base_executor(self):
+        class TracedDraw(Draw):
+            pass
+
+        state = create_initial_state(seed=42)
+        assert execute_move(state, TracedDraw()) == execute_move(state, Draw())
+
+    def test_unknown_move_type_fails(self):
+        class NotAMove:
+            pass
+
+        state = create_initial_state(seed=42)
+        with pytest.raises(IllegalMoveError, match="Unknown move type"):
+            execute_move(state, NotAMove())
@@ -3,7 +3,7 @@
 import pytest
 
 from cuttle_engine.cards import Card, Rank, Suit
-from cuttle_engine.move_generator import generate_legal_moves
+from cuttle_engine.move_generator import generate_legal_moves, get_legal_moves
 from cuttle_engine.moves import (
     Counter,
     DeclineCounter,
@@ -369,3 +369,23 @@ class TestGameOverMoves:
         )
         moves = generate_legal_moves(state)
         assert len(moves) == 0
+
+
+class TestGetLegalMoves:
+    """Tests for the memoized get_legal_moves."""
+
+    def test_matches_generate_legal_moves(self):
+        state = create_initial_state(seed=7)
+        assert get_legal_moves(state) == generate_legal_moves(state)
+
+    def test_reuses_result_for_same_state(self):
+        state = create_initial_state(seed=7)
+        first = get_legal_moves(state)
+        first.clear()  # Callers get their own list
+        assert get_legal_moves(state) == generate_legal_moves(state)
+
+    def test_new_state_is_not_served_stale_moves(self):
+        state = create_initial_state(seed=7)
+        get_legal_moves(state)
+        other = create_initial_state(seed=8)
+        assert get_legal_moves(other) == generate_legal_moves(other)
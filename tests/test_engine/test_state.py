@@ -71,6 +71,21 @@ class TestPlayerState:
         assert ace in new_player.hand
         assert len(player.hand) == 0  # Original unchanged
 
+    def test_with_updates(self):
+        ace = Card(Rank.ACE, Suit.CLUBS)
+        king = Card(Rank.KING, Suit.SPADES)
+        player = PlayerState(hand=(ace, king), points_field=(), permanents=())
+        new_player = player.with_updates(hand=(ace,), permanents=(king,))
+        assert new_player == player.with_hand((ace,)).with_permanents((king,))
+        assert player.hand == (ace, king)  # Original unchanged
+
+    def test_with_updates_rejects_unknown_field(self):
+        player = PlayerState(hand=(), points_field=(), permanents=())
+        with pytest.raises(TypeError, match="point_field"):
+            player.with_updates(point_field=())
+        with pytest.raises(TypeError, match="_point_total"):
+            player.with_updates(_point_total=5)  # Derived cache, not a field
+
 
 class TestGameState:
     def test_initial_state(self):
@@ -96,6 +111,51 @@ class TestGameState:
         state2 = state.with_current_player(1)
         assert state2.opponent == 0
 
+    def test_with_updates_matches_chained_updates(self):
+        state = create_initial_state(seed=42)
+        updated = state.with_updates(
+            deck=state.deck[1:], current_player=1, counter_state=None, turn_number=2
+        )
+        chained = (
+            state.with_deck(state.deck[1:])
+            .with_current_player(1)
+            .with_counter_state(None)
+            .with_turn_number(2)
+        )
+        assert updated == chained
+        assert state.current_player == 0  # Original unchanged
+
+    def test_with_updates_rejects_unknown_field(self):
+        state = create_initial_state(seed=42)
+        with pytest.raises(TypeError, match="curent_player"):
+            state.with_updates(curent_player=1)
+        with pytest.raises(TypeError, match="curent_player"):
+            # Reported even alongside valid changes
+            state.with_updates(deck=(), curent_player=1)
+
+    def test_acting_player(self):
+        state = create_initial_state(seed=42)
+        assert state.acting_player == 0
+
+        card = Card(Rank.ACE, Suit.SPADES)
+        countering = state.with_updates(
+            phase=GamePhase.COUNTER,
+            counter_state=CounterState(one_off_card=card, one_off_player=0),
+        )
+        assert countering.acting_player == 1
+
+        discarding = state.with_updates(
+            phase=GamePhase.DISCARD_FOUR, four_state=FourState(player=1)
+        )
+        assert discarding.acting_player == 1
+
+        resolving = state.with_updates(
+            current_player=1,
+            phase=GamePhase.RESOLVE_SEVEN,
+            seven_state=SevenState(revealed_cards=(card,), player=0),
+        )
+        assert resolving.acting_player == 0
+
     def test_point_threshold_no_kings(self):
         state = create_initial_state(seed=42)
         assert state.point_threshold(0) == 21
@@ -0,0 +1,78 @@
+"""Tests for saving and loading game logs."""
+
+import json
+
+import pytest
+
+from simulation.runner import (
+    GameRunner,
+    apply_state_delta,
+    diff_state_dicts,
+    load_game_log,
+    save_game_log,
+)
+from strategies.random_strategy import RandomStrategy
+
+
+def _as_json(value):
+    """Normalize tuples to lists, as a JSON round trip does."""
+    return json.loads(json.dumps(value))
+
+
+class TestGameLogRoundTrip:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_save_and_load_restores_every_record(self, tmp_path, seed):
+        runner = GameRunner(RandomStrategy(seed=seed), RandomStrategy(seed=seed + 1000))
+        _, log = runner.run_game(seed=seed)
+
+        loaded = load_game_log(save_game_log(log, base_dir=str(tmp_path)))
+
+        assert loaded["game_id"] == log.game_id
+        assert loaded["seed"] == seed
+        assert loaded["initial_state"] == _as_json(log.initial_state)
+        assert len(loaded["moves"]) == len(log.moves)
+        for record, loaded_move in zip(log.moves, loaded["moves"]):
+            assert loaded_move["turn"] == record.turn
+            assert loaded_move["player"] == record.player
+            assert loaded_move["move"] == record.move
+            assert loaded_move["move_type"] is record.move_type
+            assert loaded_move["state_after"] == _as_json(record.state_after)
+        assert loaded["result"]["move_count"] == log.result.move_count
+
+    def test_saved_moves_store_deltas(self, tmp_path):
+        _, log = GameRunner(RandomStrategy(seed=1), RandomStrategy(seed=2)).run_game(seed=3)
+        path = save_game_log(log, base_dir=str(tmp_path))
+
+        raw = json.loads(path.read_text())
+        assert all("state_after" not in m and "state_delta" in m for m in raw["moves"])
+
+    def test_loads_full_state_logs(self, tmp_path):
+        # Older logs stored each move's full state and no move type
+        state = {"turn": 1, "players": [{"hand": ["A♣"]}, {"hand": []}]}
+        path = tmp_path / "old.json"
+        path.write_text(json.dumps({
+            "initial_state": state,
+            "moves": [{"turn": 1, "player": 0, "move": "Draw", "state_after": state}],
+        }))
+
+        loaded = load_game_log(path)
+        assert loaded["moves"][0]["state_after"] == state
+        assert "move_type" not in loaded["moves"][0]
+
+
+class TestStateDelta:
+    def test_apply_inverts_diff(self):
+        prev = {
+            "turn": 1,
+            "deck_size": 40,
+            "players": [{"hand": ["A♣"], "point_total": 0}, {"hand": [], "point_total": 0}],
+        }
+        new = {
+            "turn": 2,
+            "deck_size": 40,
+            "players": [{"hand": [], "point_total": 1}, prev["players"][1]],
+        }
+
+        delta = diff_state_dicts(prev, new)
+        assert delta == {"turn": 2, "players": {"0": {"hand": [], "point_total": 1}}}
+        assert apply_state_delta(prev, delta) == new
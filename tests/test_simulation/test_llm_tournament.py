@@ -0,0 +1,227 @@
+"""Tests for the LLM tournament runner."""
+
+import asyncio
+
+import pytest
+
+from cuttle_engine.move_generator import get_legal_moves
+from cuttle_engine.state import create_initial_state
+from db.database import Database
+from simulation import llm_tournament
+from simulation.llm_tournament import (
+    LLMTournamentRunner,
+    StrategySpec,
+    TournamentConfig,
+    _build_mcts,
+    _mcts_select_move,
+)
+from strategies.llm.base import LLMProvider, LLMResponse
+from strategies.llm.unified_llm_strategy import UnifiedLLMStrategy
+
+TOURNAMENT_ID = "checkpoint-test"
+
+
+def _config():
+    # Five players: five rounds of two matches each (one player sits out)
+    return TournamentConfig(
+        strategies=[
+            StrategySpec(name=f"random-{i}", factory="random", params={"seed": i})
+            for i in range(5)
+        ],
+        games_per_match=2,
+        parallel_games=2,
+        rate_limit_rpm=10_000,
+        log_moves=False,
+    )
+
+
+def _stop_after_rounds(runner, rounds):
+    """Cancel the runner once it has checkpointed ``rounds`` rounds."""
+    save_checkpoint = runner._save_checkpoint
+    saved = 0
+
+    async def save_and_maybe_stop():
+        nonlocal saved
+        await save_checkpoint()
+        saved += 1
+        if saved == rounds:
+            runner.cancel()
+
+    runner._save_checkpoint = save_and_maybe_stop
+
+
+@pytest.fixture
+def compact_every_three(monkeypatch):
+    # Round 1 journals, round 2 snapshots, round 3 journals again
+    monkeypatch.setattr(llm_tournament, "CHECKPOINT_COMPACT_MATCHES", 3)
+
+
+def _uninterrupted(tmp_path, monkeypatch):
+    workdir = tmp_path / "uninterrupted"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+    runner = LLMTournamentRunner(_config(), Database(workdir / "t.db"), TOURNAMENT_ID)
+    result = asyncio.run(runner.run())
+    return runner, result
+
+
+class TestCheckpointResume:
+    def test_resume_matches_uninterrupted_run(self, tmp_path, monkeypatch, compact_every_three):
+        expected_runner, expected = _uninterrupted(tmp_path, monkeypatch)
+        assert expected.completed
+
+        workdir = tmp_path / "interrupted"
+        workdir.mkdir()
+        monkeypatch.chdir(workdir)
+        db = Database(workdir / "t.db")
+
+        runner = LLMTournamentRunner(_config(), db, TOURNAMENT_ID)
+        _stop_after_rounds(runner, 3)
+        partial = asyncio.run(runner.run())
+        assert not partial.completed
+        assert len(partial.matches) == 6
+
+        # Snapshot holds rounds 1-2, the journal round 3
+        snapshot_path, journal_path = runner._checkpoint_paths()
+        assert snapshot_path.exists()
+        assert journal_path.exists()
+
+        resumed_runner = LLMTournamentRunner.resume(TOURNAMENT_ID, db)
+        assert resumed_runner._matches == partial.matches
+        assert resumed_runner._completed_games == runner._completed_games
+
+        resumed = asyncio.run(resumed_runner.run())
+        assert resumed.completed
+        assert resumed.matches == expected.matches
+        assert resumed.total_games == expected.total_games
+        assert resumed_runner._completed_games == expected_runner._completed_games
+        assert resumed.elo_ratings == expected.elo_ratings
+
+    def test_truncated_journal_line_is_skipped(self, tmp_path, monkeypatch, compact_every_three):
+        monkeypatch.chdir(tmp_path)
+        db = Database(tmp_path / "t.db")
+
+        runner = LLMTournamentRunner(_config(), db, TOURNAMENT_ID)
+        _stop_after_rounds(runner, 1)
+        partial = asyncio.run(runner.run())
+        assert len(partial.matches) == 2
+
+        # Tear the final write: the second match's line loses its tail
+        snapshot_path, journal_path = runner._checkpoint_paths()
+        assert not snapshot_path.exists()
+        journal = journal_path.read_bytes()
+        last_line_start = journal.rindex(b"\n", 0, len(journal) - 1) + 1
+        journal_path.write_bytes(journal[: last_line_start + 20])
+
+        resumed_runner = LLMTournamentRunner.resume(TOURNAMENT_ID, db)
+        assert resumed_runner._matches == partial.matches[:1]
+        assert resumed_runner._completed_games == runner._completed_games
+
+
+class TestParallelGames:
+    def test_results_independent_of_parallel_games(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        def play(parallel_games):
+            config = _config()
+            config.parallel_games = parallel_games
+            db = Database(tmp_path / f"parallel-{parallel_games}.db")
+            return asyncio.run(LLMTournamentRunner(config, db, TOURNAMENT_ID).run())
+
+        serial = play(1)
+        assert serial.completed
+        assert play(3).matches == serial.matches
+
+
+class _CountingProvider(LLMProvider):
+    """Provider that counts calls on its sync and async paths."""
+
+    def __init__(self):
+        self.calls = 0
+        self.async_calls = 0
+
+    @property
+    def name(self):
+        return "test"
+
+    def complete(self, prompt, model, temperature=0.3, max_tokens=1024, **kwargs):
+        self.calls += 1
+        return LLMResponse(
+            content="MOVE: 0", input_tokens=10, output_tokens=2, model=model, latency_ms=1.0
+        )
+
+    async def acomplete(self, prompt, model, temperature=0.3, max_tokens=1024, **kwargs):
+        self.async_calls += 1
+        return self.complete(prompt, model, temperature, max_tokens)
+
+    def estimate_cost(self, model, input_tokens, output_tokens):
+        return 0.0
+
+    @property
+    def available_models(self):
+        return ["test-model"]
+
+
+class TestAsyncStrategies:
+    def test_async_strategy_awaited_on_loop(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        provider = _CountingProvider()
+
+        def build(params, cost_tracker):
+            return UnifiedLLMStrategy(provider, "test-model", cost_tracker=cost_tracker)
+
+        monkeypatch.setitem(llm_tournament._STRATEGY_BUILDERS, "fake-llm", build)
+        config = TournamentConfig(
+            strategies=[
+                StrategySpec(name="llm", factory="fake-llm"),
+                StrategySpec(name="random", factory="random", params={"seed": 0}),
+            ],
+            games_per_match=2,
+            rate_limit_rpm=10_000,
+            log_moves=False,
+        )
+        result = asyncio.run(LLMTournamentRunner(config, Database(tmp_path / "t.db")).run())
+
+        assert result.completed
+        assert provider.async_calls > 0
+        assert provider.calls == provider.async_calls
+
+
+class TestMCTSPool:
+    PARAMS = {"iterations": 8, "exploration": 0.9, "max_simulation_depth": 12}
+
+    def test_worker_rebuilds_strategy_from_spec_params(self, monkeypatch):
+        monkeypatch.setattr(llm_tournament, "_worker_mcts", {})
+        state = create_initial_state(seed=5)
+        legal_moves = get_legal_moves(state)
+
+        assert _mcts_select_move(self.PARAMS, state, legal_moves) in legal_moves
+
+        (worker,) = llm_tournament._worker_mcts.values()
+        built = _build_mcts(self.PARAMS, cost_tracker=None)
+        for attr in ("_iterations", "_exploration", "_max_sim_depth", "_num_workers"):
+            assert getattr(worker, attr) == getattr(built, attr)
+
+    def test_tournament_with_mcts_player(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        config = TournamentConfig(
+            strategies=[
+                StrategySpec(name="mcts", factory="mcts", params=self.PARAMS),
+                StrategySpec(name="random", factory="random", params={"seed": 0}),
+            ],
+            games_per_match=2,
+            rate_limit_rpm=10_000,
+            log_moves=False,
+        )
+        runner = LLMTournamentRunner(config, Database(tmp_path / "t.db"))
+        result = asyncio.run(runner.run())
+        assert result.completed
+        assert result.total_games == 2
+        assert runner._mcts_pool is not None
+
+    def test_no_pool_without_mcts_players(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        runner = LLMTournamentRunner(_config(), Database(tmp_path / "t.db"))
+        result = asyncio.run(runner.run())
+        assert result.completed
+        assert runner._mcts_pool is None
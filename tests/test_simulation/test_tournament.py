@@ -0,0 +1,142 @@
+"""Tests for the tournament runners."""
+
+import statistics
+
+import pytest
+
+from simulation import tournament
+from simulation.tournament import MatchResult, run_gauntlet, run_match, run_tournament
+from strategies.random_strategy import RandomStrategy
+
+
+class GameSeededRandom(RandomStrategy):
+    """Random strategy reseeded at every game start.
+
+    Each game's moves then depend only on the game, not on which games the
+    same instance played before, so a match's result cannot depend on how
+    its games are split between workers.
+    """
+
+    @property
+    def name(self):
+        return f"GameSeededRandom-{self._base_seed}"
+
+    def __init__(self, seed):
+        super().__init__(seed)
+        self._base_seed = seed
+
+    def on_game_start(self, state, player_index):
+        self.reset_seed(self._base_seed * 2 + player_index)
+
+
+class TestRunMatch:
+    @pytest.mark.parametrize("num_workers", [2, 3])
+    def test_workers_match_serial(self, num_workers):
+        def play(workers):
+            return run_match(
+                GameSeededRandom(1), GameSeededRandom(2),
+                num_games=12, start_seed=40, num_workers=workers,
+            )
+
+        assert play(num_workers) == play(1)
+
+    def test_std_game_length_matches_stdev(self, monkeypatch):
+        lengths = []
+        play_one_game = tournament._play_one_game
+
+        def recording_play(*args):
+            outcome = play_one_game(*args)
+            lengths.append(outcome[1])
+            return outcome
+
+        monkeypatch.setattr(tournament, "_play_one_game", recording_play)
+        result = run_match(GameSeededRandom(1), GameSeededRandom(2), num_games=12, start_seed=40)
+
+        assert len(lengths) == 12
+        assert len(set(lengths)) > 1
+        assert result.avg_game_length == pytest.approx(statistics.mean(lengths))
+        assert result.std_game_length == pytest.approx(statistics.stdev(lengths))
+
+
+def _match_result(total_games, avg_game_length=40.0, std_game_length=0.0):
+    return MatchResult(
+        strategy_a="A", strategy_b="B", wins_a=total_games, wins_b=0, draws=0,
+        total_games=total_games, avg_game_length=avg_game_length, avg_turns=20.0,
+        std_game_length=std_game_length,
+    )
+
+
+class TestMatchResult:
+    @pytest.mark.parametrize("total_games", [0, 1])
+    def test_game_length_interval_needs_two_games(self, total_games):
+        result = _match_result(total_games)
+        assert result.game_length_interval() == (40.0, 40.0)
+
+    def test_game_length_interval(self):
+        low, high = _match_result(25, std_game_length=10.0).game_length_interval(0.95)
+        assert low == pytest.approx(40.0 - 1.96 * 2)
+        assert high == pytest.approx(40.0 + 1.96 * 2)
+
+    @pytest.mark.parametrize("confidence", [0.8, 0.5, 0.951])
+    def test_unsupported_confidence_rejected(self, confidence):
+        result = _match_result(25, std_game_length=10.0)
+        with pytest.raises(ValueError, match="Unsupported confidence level"):
+            result.confidence_interval(confidence)
+        with pytest.raises(ValueError, match="Unsupported confidence level"):
+            result.game_length_interval(confidence)
+
+
+class TestRunTournament:
+    def test_workers_match_serial(self):
+        def play(workers):
+            return run_tournament(
+                [GameSeededRandom(seed) for seed in range(4)],
+                games_per_match=4, start_seed=7, num_workers=workers,
+            )
+
+        serial = play(1)
+        parallel = play(3)
+        assert parallel.matches == serial.matches
+        assert parallel.elo_ratings == serial.elo_ratings
+        assert parallel.win_matrix == serial.win_matrix
+
+    def test_gauntlet_workers_match_serial(self):
+        def play(workers):
+            return run_gauntlet(
+                GameSeededRandom(0), [GameSeededRandom(seed) for seed in range(1, 4)],
+                games_per_opponent=4, num_workers=workers,
+            )
+
+        assert play(2) == play(1)
+
+
+class TestEloIteration:
+    # (idx_a, idx_b, scores_a, scores_b, totals); the last match has no games
+    MATCHES = (
+        [0, 0, 1, 2, 1],
+        [1, 2, 2, 3, 3],
+        [0.75, 0.4, 0.5, 0.9, 0.0],
+        [0.25, 0.6, 0.5, 0.1, 0.0],
+        [20, 10, 8, 30, 0],
+    )
+
+    def test_jit_matches_pure_python(self):
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("numba")
+
+        idx_a, idx_b, scores_a, scores_b, totals = self.MATCHES
+        ratings = [1500.0] * 4
+        rating_array = np.array(ratings, dtype=np.float64)
+        arrays = (
+            np.array(idx_a, dtype=np.int32),
+            np.array(idx_b, dtype=np.int32),
+            np.array(scores_a, dtype=np.float64),
+            np.array(scores_b, dtype=np.float64),
+            np.array(totals, dtype=np.int32),
+        )
+
+        for _ in range(5):
+            expected = tournament._elo_iteration(ratings, *self.MATCHES, 32.0, len(totals))
+            change = tournament._elo_iteration_jit(rating_array, *arrays, 32.0, len(totals))
+            assert change == pytest.approx(expected)
+            assert list(rating_array) == pytest.approx(ratings)
@@ -0,0 +1,56 @@
+"""Tests for the ISMCTS strategy."""
+
+import pickle
+
+from cuttle_engine.executor import execute_move
+from cuttle_engine.move_generator import get_legal_moves
+from cuttle_engine.state import create_initial_state
+from strategies.ismcts import ISMCTSStrategy
+
+
+def _midgame(strategy, seed=11, moves=6):
+    """Play a few first-legal-moves, keeping strategy informed as player 0."""
+    state = create_initial_state(seed=seed)
+    strategy.on_game_start(state, 0)
+    for _ in range(moves):
+        move = get_legal_moves(state)[0]
+        player = state.acting_player
+        state = execute_move(state, move)
+        strategy.on_move_made(state, move, player)
+    return state
+
+
+class TestParallelSearch:
+    def test_parallel_select_returns_legal_move(self):
+        strategy = ISMCTSStrategy(iterations=40, seed=3, num_workers=2)
+        state = _midgame(strategy)
+        legal_moves = get_legal_moves(state)
+        assert len(legal_moves) > 1
+
+        move = strategy.select_move(state, legal_moves)
+        assert move in legal_moves
+
+    def test_parallel_select_is_reproducible_with_seed(self):
+        def select():
+            strategy = ISMCTSStrategy(iterations=40, seed=3, num_workers=2)
+            state = _midgame(strategy)
+            return strategy.select_move(state, get_legal_moves(state))
+
+        assert select() == select()
+
+    def test_worker_carries_card_knowledge(self):
+        strategy = ISMCTSStrategy(iterations=40, seed=3, num_workers=2)
+        _midgame(strategy)
+        assert strategy._known_cards
+
+        worker = strategy._worker_strategy(20, seed=4)
+        assert worker._num_workers == 1
+        assert worker._iterations == 20
+        assert worker._player_index == 0
+        assert worker._known_cards == strategy._known_cards
+        assert worker._known_cards is not strategy._known_cards
+
+        # Workers reach their process by pickle
+        unpickled = pickle.loads(pickle.dumps(worker))
+        assert unpickled._known_cards == strategy._known_cards
+        assert unpickled._player_index == 0
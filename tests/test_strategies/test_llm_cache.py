@@ -0,0 +1,201 @@
+"""Tests for the LLM response cache."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from cuttle_engine.move_generator import get_legal_moves
+from cuttle_engine.state import create_initial_state
+from strategies.llm.base import LLMProvider, LLMResponse
+from strategies.llm.cache import LLMCache
+from strategies.llm.unified_llm_strategy import UnifiedLLMStrategy
+
+
+def _response(content="MOVE: 0"):
+    return LLMResponse(
+        content=content, input_tokens=100, output_tokens=20, model="test-model", latency_ms=250.0
+    )
+
+
+class _CountingProvider(LLMProvider):
+    """Provider that always gives the same answer and counts its calls."""
+
+    def __init__(self, content="MOVE: 0"):
+        self.content = content
+        self.calls = 0
+
+    @property
+    def name(self):
+        return "test"
+
+    def complete(self, prompt, model, temperature=0.3, max_tokens=1024, **kwargs):
+        self.calls += 1
+        return _response(self.content)
+
+    def estimate_cost(self, model, input_tokens, output_tokens):
+        return 0.01
+
+    @property
+    def available_models(self):
+        return ["test-model"]
+
+
+class _UnpricedProvider(_CountingProvider):
+    def estimate_cost(self, model, input_tokens, output_tokens):
+        raise KeyError(model)
+
+
+class _ReadOnlyCache(LLMCache):
+    def set(self, key, response):
+        raise sqlite3.OperationalError("attempt to write a readonly database")
+
+
+class _RecordingCostTracker:
+    def __init__(self):
+        self.records = []
+
+    def record_cost(self, **kwargs):
+        self.records.append(kwargs)
+        return 0.01
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMCache(tmp_path / "cache.db")
+
+
+class TestLLMCache:
+    def test_round_trip(self, cache):
+        key = LLMCache.make_key("test", "test-model", "prompt", 0.0, 1024)
+        assert cache.get(key) is None
+
+        cache.set(key, _response("cached"))
+        cached = cache.get(key)
+        assert cached.content == "cached"
+        assert cached.input_tokens == 100
+        assert cached.output_tokens == 20
+        assert cached.latency_ms == 0.0
+
+    def test_only_temperature_zero_cached_by_default(self, tmp_path, cache):
+        assert cache.should_cache(0.0)
+        assert not cache.should_cache(0.3)
+
+        any_temperature = LLMCache(tmp_path / "any.db", any_temperature=True)
+        assert any_temperature.should_cache(0.0)
+        assert any_temperature.should_cache(0.3)
+
+    def test_ttl_expiry(self, tmp_path, monkeypatch):
+        from strategies.llm import cache as cache_module
+
+        now = 1_000_000.0
+        monkeypatch.setattr(cache_module.time, "time", lambda: now)
+        cache = LLMCache(tmp_path / "cache.db", ttl=60)
+        cache.set("key", _response())
+
+        now += 60
+        assert cache.get("key") is not None
+        now += 1
+        assert cache.get("key") is None
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            ("other", "test-model", "prompt", 0.0, 1024),
+            ("test", "other-model", "prompt", 0.0, 1024),
+            ("test", "test-model", "other prompt", 0.0, 1024),
+            ("test", "test-model", "prompt", 0.5, 1024),
+            ("test", "test-model", "prompt", 0.0, 512),
+        ],
+    )
+    def test_key_depends_on_every_parameter(self, changed):
+        base = LLMCache.make_key("test", "test-model", "prompt", 0.0, 1024)
+        assert LLMCache.make_key("test", "test-model", "prompt", 0.0, 1024) == base
+        assert LLMCache.make_key(*changed) != base
+
+    def test_connection_per_thread(self, cache):
+        cache.set("key", _response("shared"))
+        main_connection = cache._get_connection()
+        assert cache._get_connection() is main_connection
+
+        seen = {}
+
+        def worker():
+            seen["connection"] = cache._get_connection()
+            seen["content"] = cache.get("key").content
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert isinstance(seen["connection"], sqlite3.Connection)
+        assert seen["connection"] is not main_connection
+        assert seen["content"] == "shared"
+
+    def test_clear(self, cache):
+        cache.set("key", _response())
+        cache.clear()
+        assert cache.get("key") is None
+
+
+class TestStrategyCache:
+    def _select(self, strategy, seed=0):
+        state = create_initial_state(seed=seed)
+        strategy.on_game_start(state, state.acting_player)
+        legal_moves = get_legal_moves(state)
+        assert len(legal_moves) > 1
+        return strategy.select_move(state, legal_moves), legal_moves
+
+    def test_hit_is_not_charged(self, cache):
+        provider = _CountingProvider()
+        tracker = _RecordingCostTracker()
+        strategy = UnifiedLLMStrategy(
+            provider, "test-model", temperature=0.0, cost_tracker=tracker, cache=cache
+        )
+
+        first, legal_moves = self._select(strategy)
+        assert first == legal_moves[0]
+        assert provider.calls == 1
+        assert len(tracker.records) == 1
+        assert strategy.last_thinking.cost_usd == 0.01
+
+        second, _ = self._select(strategy)
+        assert second == first
+        assert provider.calls == 1
+        assert len(tracker.records) == 1
+        assert strategy.last_thinking.cost_usd == 0
+        assert strategy.cache_stats == {"hits": 1, "misses": 1}
+
+    def test_sampled_requests_bypass_cache(self, cache):
+        provider = _CountingProvider()
+        strategy = UnifiedLLMStrategy(provider, "test-model", temperature=0.3, cache=cache)
+
+        self._select(strategy)
+        self._select(strategy)
+        assert provider.calls == 2
+        assert strategy.cache_stats == {"hits": 0, "misses": 0}
+
+    def test_failed_cache_write_keeps_paid_response(self, tmp_path):
+        provider = _CountingProvider("MOVE: 1")
+        tracker = _RecordingCostTracker()
+        strategy = UnifiedLLMStrategy(
+            provider, "test-model", temperature=0.0, cost_tracker=tracker,
+            cache=_ReadOnlyCache(tmp_path / "cache.db"),
+        )
+
+        move, legal_moves = self._select(strategy)
+        assert move == legal_moves[1]
+        assert len(tracker.records) == 1
+        assert strategy.last_thinking.error is None
+
+    def test_fallback_response_not_cached(self, cache):
+        provider = _UnpricedProvider("MOVE: 1")
+        strategy = UnifiedLLMStrategy(provider, "test-model", temperature=0.0, cache=cache)
+
+        move, legal_moves = self._select(strategy)
+        assert move == legal_moves[0]
+        assert strategy.last_thinking.error is not None
+
+        self._select(strategy)
+        assert provider.calls == 2
+        assert strategy.cache_stats == {"hits": 0, "misses": 2}
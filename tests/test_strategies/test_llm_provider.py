@@ -0,0 +1,48 @@
+"""Tests for the shared LLM provider behaviour."""
+
+import time
+
+import pytest
+
+from strategies.llm.base import LLMProvider, LLMResponse
+
+
+class _EchoProvider(LLMProvider):
+    """Provider that answers with the prompt, later prompts finishing first."""
+
+    def __init__(self, num_prompts):
+        self.num_prompts = num_prompts
+
+    @property
+    def name(self):
+        return "echo"
+
+    def complete(self, prompt, model, temperature=0.3, max_tokens=1024, **kwargs):
+        if prompt == "fail":
+            raise RuntimeError("request failed")
+        index = int(prompt.split()[-1])
+        time.sleep(0.01 * (self.num_prompts - index))
+        return LLMResponse(
+            content=prompt, input_tokens=1, output_tokens=1, model=model, latency_ms=0.0
+        )
+
+    def estimate_cost(self, model, input_tokens, output_tokens):
+        return 0.0
+
+    @property
+    def available_models(self):
+        return ["echo"]
+
+
+class TestCompleteBatch:
+    def test_responses_in_prompt_order(self):
+        prompts = [f"prompt {i}" for i in range(6)]
+        responses = _EchoProvider(len(prompts)).complete_batch(prompts, "echo", max_concurrent=6)
+        assert [r.content for r in responses] == prompts
+
+    @pytest.mark.parametrize("failing", [0, 3])
+    def test_failure_propagates(self, failing):
+        prompts = [f"prompt {i}" for i in range(5)]
+        prompts[failing] = "fail"
+        with pytest.raises(RuntimeError, match="request failed"):
+            _EchoProvider(len(prompts)).complete_batch(prompts, "echo", max_concurrent=4)
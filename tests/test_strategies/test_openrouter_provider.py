@@ -0,0 +1,97 @@
+"""Tests for the OpenRouter provider's async client."""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from strategies.llm.base import ProviderConfig
+from strategies.llm.openrouter_provider import OpenRouterProvider
+
+
+class _CompletionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, so the client pools connections
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        body = json.dumps({
+            "choices": [{"message": {"content": f" reply to {request['model']} "}}],
+            "usage": {"prompt_tokens": 7, "completion_tokens": 3},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CompletionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def provider(server_url):
+    return OpenRouterProvider(ProviderConfig(api_key="test-key", base_url=server_url))
+
+
+class TestAsyncClient:
+    def test_acomplete_parses_response(self, provider):
+        response = asyncio.run(provider.acomplete("hi", "llama3"))
+        assert response.content == "reply to meta-llama/llama-3.3-70b-instruct"
+        assert response.input_tokens == 7
+        assert response.output_tokens == 3
+
+    def test_acomplete_across_event_loops(self, provider):
+        # Each asyncio.run closes its loop; the second call must not reuse
+        # a client bound to the first
+        first = asyncio.run(provider.acomplete("hi", "llama3"))
+        second = asyncio.run(provider.acomplete("hi again", "llama3"))
+        assert first.content == second.content
+
+    def test_async_context_manager_closes_client(self, provider):
+        async def run():
+            async with provider as p:
+                await p.acomplete("hi", "llama3")
+                client = p._async_client
+            return client
+
+        client = asyncio.run(run())
+        assert client.is_closed
+        assert provider._async_client is None
+
+    def test_aclose_without_client(self, provider):
+        asyncio.run(provider.aclose())
+
+
+class TestCompleteBatch:
+    def test_batch_builds_one_client(self, provider, monkeypatch):
+        client_settings = provider._client_settings
+        builds = []
+
+        def counting_settings():
+            builds.append(threading.current_thread().name)
+            time.sleep(0.05)  # Give other threads time to race for the client
+            return client_settings()
+
+        monkeypatch.setattr(provider, "_client_settings", counting_settings)
+        prompts = [f"prompt {i}" for i in range(8)]
+        responses = provider.complete_batch(prompts, "llama3", max_concurrent=4)
+
+        assert len(responses) == len(prompts)
+        assert all(r.content == "reply to meta-llama/llama-3.3-70b-instruct" for r in responses)
+        assert len(builds) == 1
+        provider._client.close()
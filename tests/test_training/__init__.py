@@ -0,0 +1 @@
+"""Tests for training data collection."""
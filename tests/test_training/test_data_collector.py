@@ -0,0 +1,63 @@
+"""Tests for training data collection."""
+
+import pytest
+
+from training.data_collector import DataCollector, GameHistory, MCTSMoveData, RunningStatistics
+
+
+def _move(turn):
+    return MCTSMoveData(
+        turn=turn, player=0, phase="MAIN", state_hash="", legal_moves=["Draw"],
+        visit_counts={"Draw": 5}, win_rates={"Draw": 0.5}, selected_move="Draw",
+        selected_visits=5, selected_win_rate=0.5,
+    )
+
+
+def _history(winner, num_moves, mcts_iterations=50, opponent="random"):
+    return GameHistory(
+        game_id=f"g{winner}{num_moves}", timestamp="", seed=None, mcts_player=0,
+        mcts_iterations=mcts_iterations, opponent_strategy=opponent, winner=winner,
+        final_scores=(0, 0), moves=[_move(t) for t in range(num_moves)],
+    )
+
+
+def _batch_statistics(histories):
+    """Summary computed over the whole list, as get_statistics used to."""
+    if not histories:
+        return {"num_games": 0}
+
+    wins = sum(1 for h in histories if h.mcts_won)
+    total_moves = sum(len(h.moves) for h in histories)
+    return {
+        "num_games": len(histories),
+        "mcts_wins": wins,
+        "mcts_win_rate": wins / len(histories),
+        "total_mcts_moves": total_moves,
+        "avg_mcts_moves_per_game": total_moves / len(histories),
+        "iterations_used": histories[0].mcts_iterations,
+        "opponent_strategy": histories[0].opponent_strategy,
+    }
+
+
+class TestRunningStatistics:
+    @pytest.mark.parametrize(
+        "histories",
+        [
+            [],
+            [
+                _history(0, 4),
+                _history(1, 7, mcts_iterations=100, opponent="heuristic"),
+                _history(None, 2),
+                _history(0, 0),
+                _history(1, 5),
+            ],
+        ],
+    )
+    def test_matches_batch_statistics(self, tmp_path, histories):
+        stats = RunningStatistics()
+        for history in histories:
+            stats.add(history)
+
+        expected = _batch_statistics(histories)
+        assert stats.to_dict() == expected
+        assert DataCollector(tmp_path).get_statistics(histories) == expected
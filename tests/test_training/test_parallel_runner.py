@@ -0,0 +1,23 @@
+"""Tests for the parallel training game runner."""
+
+from training.parallel_runner import ParallelGameRunner
+
+
+class TestMCTSStatsBatches:
+    def test_batches_report_every_game(self):
+        calls = []
+        results = ParallelGameRunner(num_workers=2).run_games_with_mcts_stats(
+            mcts_player=0,
+            opponent_strategy_name="random",
+            num_games=7,
+            mcts_iterations=5,
+            callback=lambda game_data, progress: calls.append((game_data, progress)),
+            start_seed=3,
+            batch_size=3,
+        )
+
+        assert len(results) == 7
+        assert len(calls) == len(results)
+        assert sorted(game["seed"] for game in results) == list(range(3, 10))
+        assert [progress.completed for _, progress in calls] == list(range(1, 8))
+        assert all(progress.total == 7 for _, progress in calls)
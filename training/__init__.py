@@ -1,6 +1,11 @@
 """Training module for MCTS-based learning and data collection."""
 
-from training.data_collector import DataCollector, GameHistory, MCTSMoveData
+from training.data_collector import (
+    DataCollector,
+    GameHistory,
+    MCTSMoveData,
+    RunningStatistics,
+)
 from training.parallel_runner import ParallelGameRunner
 
 __all__ = [
@@ -8,4 +13,5 @@ __all__ = [
     "DataCollector",
     "GameHistory",
     "MCTSMoveData",
+    "RunningStatistics",
 ]
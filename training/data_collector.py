@@ -7,7 +7,7 @@ import json
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from cuttle_engine.state import GameState
@@ -79,6 +79,45 @@ class GameHistory:
         return 1.0 if self.winner == self.mcts_player else 0.0
 
 
+@dataclass
+class RunningStatistics:
+    """Summary statistics accumulated one game at a time.
+
+    Lets callers keep the summary up to date while games stream in,
+    instead of making a second pass over all histories at the end.
+    """
+
+    num_games: int = 0
+    mcts_wins: int = 0
+    total_mcts_moves: int = 0
+    iterations_used: int | None = None
+    opponent_strategy: str | None = None
+
+    def add(self, history: GameHistory) -> None:
+        """Fold one game into the running totals."""
+        if self.num_games == 0:
+            self.iterations_used = history.mcts_iterations
+            self.opponent_strategy = history.opponent_strategy
+        self.num_games += 1
+        self.mcts_wins += history.mcts_won
+        self.total_mcts_moves += len(history.moves)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary in the same format as DataCollector.get_statistics()."""
+        if self.num_games == 0:
+            return {"num_games": 0}
+
+        return {
+            "num_games": self.num_games,
+            "mcts_wins": self.mcts_wins,
+            "mcts_win_rate": self.mcts_wins / self.num_games,
+            "total_mcts_moves": self.total_mcts_moves,
+            "avg_mcts_moves_per_game": self.total_mcts_moves / self.num_games,
+            "iterations_used": self.iterations_used,
+            "opponent_strategy": self.opponent_strategy,
+        }
+
+
 class DataCollector:
     """Collect and store training data from MCTS games.
 
@@ -95,7 +134,7 @@ class DataCollector:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def collect_from_game_data(self, game_data: dict) -> GameHistory:
+    def collect_from_game_data(self, game_data: dict[str, Any]) -> GameHistory:
         """Convert raw game data dict to GameHistory.
 
         Args:
@@ -149,7 +188,7 @@ class DataCollector:
             moves=moves,
         )
 
-    def _compute_state_hash(self, move_record: dict) -> str:
+    def _compute_state_hash(self, move_record: dict[str, Any]) -> str:
         """Compute a hash for deduplication/lookup."""
         # Use turn, player, and move info as proxy for state
         key = f"{move_record['turn']}:{move_record['player']}:{move_record['phase']}"
@@ -188,7 +227,7 @@ class DataCollector:
 
         return file_path
 
-    def _history_to_dict(self, history: GameHistory) -> dict:
+    def _history_to_dict(self, history: GameHistory) -> dict[str, Any]:
         """Convert GameHistory to JSON-serializable dict."""
         return {
             "game_id": history.game_id,
@@ -252,7 +291,7 @@ class DataCollector:
 
         return histories
 
-    def export_policy_targets(self, histories: list[GameHistory]) -> list[dict]:
+    def export_policy_targets(self, histories: list[GameHistory]) -> list[dict[str, Any]]:
         """Export move data as policy training targets.
 
         Returns list of dicts suitable for training a policy network:
@@ -282,7 +321,7 @@ class DataCollector:
                 samples.append(sample)
         return samples
 
-    def get_statistics(self, histories: list[GameHistory]) -> dict:
+    def get_statistics(self, histories: list[GameHistory]) -> dict[str, Any]:
         """Compute summary statistics for a collection of games.
 
         Args:
@@ -291,19 +330,7 @@ class DataCollector:
         Returns:
             Dict with statistics about the games.
         """
-        if not histories:
-            return {"num_games": 0}
-
-        wins = sum(1 for h in histories if h.mcts_won)
-        total_moves = sum(len(h.moves) for h in histories)
-        avg_moves = total_moves / len(histories) if histories else 0
-
-        return {
-            "num_games": len(histories),
-            "mcts_wins": wins,
-            "mcts_win_rate": wins / len(histories),
-            "total_mcts_moves": total_moves,
-            "avg_mcts_moves_per_game": avg_moves,
-            "iterations_used": histories[0].mcts_iterations if histories else None,
-            "opponent_strategy": histories[0].opponent_strategy if histories else None,
-        }
+        stats = RunningStatistics()
+        for history in histories:
+            stats.add(history)
+        return stats.to_dict()
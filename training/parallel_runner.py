@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import logging
+import logging.handlers
+import multiprocessing
 import os
 import time
 import uuid
+from collections.abc import Iterator
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from simulation.runner import GameResult
     from strategies.base import Strategy
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class BatchProgress:
@@ -48,13 +55,34 @@ class ParallelGameRunner:
         """
         self.num_workers = num_workers or os.cpu_count() or 4
 
+    @contextmanager
+    def _pool(self) -> Iterator[ProcessPoolExecutor]:
+        """Create a worker pool whose log records are handled by this process.
+
+        Workers enqueue records instead of writing to the shared stderr
+        pipe themselves; a listener thread here replays them through the
+        parent's logging configuration.
+        """
+        queue: multiprocessing.Queue[logging.LogRecord] = multiprocessing.Queue()
+        listener = logging.handlers.QueueListener(queue, _ParentLogHandler())
+        listener.start()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                initializer=_init_worker_logging,
+                initargs=(queue, logging.getLogger().getEffectiveLevel()),
+            ) as pool:
+                yield pool
+        finally:
+            listener.stop()
+
     def run_games(
         self,
         strategy0_name: str,
         strategy1_name: str,
         num_games: int,
-        strategy0_params: dict | None = None,
-        strategy1_params: dict | None = None,
+        strategy0_params: dict[str, Any] | None = None,
+        strategy1_params: dict[str, Any] | None = None,
         callback: Callable[[GameResult, BatchProgress], None] | None = None,
         start_seed: int = 0,
     ) -> list[GameResult]:
@@ -80,7 +108,7 @@ class ParallelGameRunner:
         results: list[GameResult] = []
         wins = [0, 0]
 
-        with ProcessPoolExecutor(max_workers=self.num_workers) as pool:
+        with self._pool() as pool:
             # Submit all games
             futures = {
                 pool.submit(
@@ -114,7 +142,7 @@ class ParallelGameRunner:
 
                 except Exception as e:
                     # Log error but continue with other games
-                    print(f"Game failed: {e}")
+                    logger.warning("Game failed: %s", e)
 
         return results
 
@@ -124,10 +152,11 @@ class ParallelGameRunner:
         opponent_strategy_name: str,
         num_games: int,
         mcts_iterations: int = 1000,
-        opponent_params: dict | None = None,
-        callback: Callable[[dict, BatchProgress], None] | None = None,
+        opponent_params: dict[str, Any] | None = None,
+        callback: Callable[[dict[str, Any], BatchProgress], None] | None = None,
         start_seed: int = 0,
-    ) -> list[dict]:
+        batch_size: int = 1,
+    ) -> list[dict[str, Any]]:
         """Run games collecting detailed MCTS statistics.
 
         This variant collects per-move MCTS statistics (visit counts, win rates)
@@ -141,31 +170,40 @@ class ParallelGameRunner:
             opponent_params: Parameters for opponent strategy.
             callback: Called after each game with (game_data, progress).
             start_seed: Starting random seed.
+            batch_size: Games each worker task runs before sending results
+                       back. Larger batches mean fewer round-trips to the
+                       parent; callbacks then arrive in bursts of this size.
 
         Returns:
             List of game data dicts with MCTS statistics per move.
         """
         opponent_params = opponent_params or {}
+        batch_size = max(1, batch_size)
         start_time = time.perf_counter()
-        results: list[dict] = []
+        results: list[dict[str, Any]] = []
         wins = [0, 0]
 
-        with ProcessPoolExecutor(max_workers=self.num_workers) as pool:
+        with self._pool() as pool:
             futures = {
                 pool.submit(
-                    _run_game_with_mcts_stats,
+                    _run_mcts_stats_batch,
                     mcts_player,
                     opponent_strategy_name,
                     opponent_params,
                     mcts_iterations,
-                    start_seed + i,
-                ): i
-                for i in range(num_games)
+                    [start_seed + i for i in range(b, min(b + batch_size, num_games))],
+                ): b
+                for b in range(0, num_games, batch_size)
             }
 
             for future in as_completed(futures):
                 try:
-                    game_data = future.result()
+                    batch = future.result()
+                except Exception as e:
+                    logger.warning("Batch failed: %s", e)
+                    continue
+
+                for game_data in batch:
                     results.append(game_data)
 
                     winner = game_data.get("winner")
@@ -181,17 +219,14 @@ class ParallelGameRunner:
                         )
                         callback(game_data, progress)
 
-                except Exception as e:
-                    print(f"Game failed: {e}")
-
         return results
 
 
 def _run_single_game(
     strategy0_name: str,
     strategy1_name: str,
-    strategy0_params: dict,
-    strategy1_params: dict,
+    strategy0_params: dict[str, Any],
+    strategy1_params: dict[str, Any],
     seed: int,
 ) -> GameResult:
     """Run a single game in a worker process.
@@ -210,13 +245,57 @@ def _run_single_game(
     return result
 
 
+def _run_mcts_stats_batch(
+    mcts_player: int,
+    opponent_strategy_name: str,
+    opponent_params: dict[str, Any],
+    mcts_iterations: int,
+    seeds: list[int],
+) -> list[dict[str, Any]]:
+    """Run several MCTS-stats games in one worker task.
+
+    Results are returned together so the parent pays one round-trip per
+    batch instead of per game. A failing game is reported and skipped
+    without discarding the rest of the batch.
+    """
+    batch: list[dict[str, Any]] = []
+    for seed in seeds:
+        try:
+            batch.append(
+                _run_game_with_mcts_stats(
+                    mcts_player,
+                    opponent_strategy_name,
+                    opponent_params,
+                    mcts_iterations,
+                    seed,
+                )
+            )
+        except Exception as e:
+            logger.warning("Game failed (seed %d): %s", seed, e)
+    return batch
+
+
+class _ParentLogHandler(logging.Handler):
+    """Dispatch records received from workers to the parent's loggers."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_worker_logging(queue: multiprocessing.Queue[logging.LogRecord], level: int) -> None:
+    """Worker initializer: send all log records to the parent via a queue."""
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(queue)]
+    root.setLevel(level)
+
+
 def _run_game_with_mcts_stats(
     mcts_player: int,
     opponent_strategy_name: str,
-    opponent_params: dict,
+    opponent_params: dict[str, Any],
     mcts_iterations: int,
     seed: int,
-) -> dict:
+) -> dict[str, Any]:
     """Run a game collecting MCTS statistics.
 
     Returns a dict with:
@@ -227,8 +306,8 @@ def _run_game_with_mcts_stats(
     - moves: List of move records with MCTS stats
     """
     from cuttle_engine.executor import execute_move
-    from cuttle_engine.move_generator import generate_legal_moves
-    from cuttle_engine.state import GamePhase, create_initial_state
+    from cuttle_engine.move_generator import get_legal_moves
+    from cuttle_engine.state import PHASE_NAMES, create_initial_state
     from strategies.mcts import MCTSStrategy
     from web.api.session_manager import StrategyFactory
 
@@ -246,7 +325,7 @@ def _run_game_with_mcts_stats(
     for i, strat in enumerate(strategies):
         strat.on_game_start(state, i)
 
-    game_data = {
+    game_data: dict[str, Any] = {
         "game_id": str(uuid.uuid4()),
         "seed": seed,
         "mcts_player": mcts_player,
@@ -259,17 +338,10 @@ def _run_game_with_mcts_stats(
 
     max_turns = 500
     while not state.is_game_over and state.turn_number <= max_turns:
-        # Determine acting player
-        if state.phase == GamePhase.COUNTER:
-            acting_player = state.counter_state.waiting_for_player
-        elif state.phase == GamePhase.DISCARD_FOUR:
-            acting_player = state.four_state.player
-        elif state.phase == GamePhase.RESOLVE_SEVEN:
-            acting_player = state.seven_state.player
-        else:
-            acting_player = state.current_player
+        # Determine who needs to act
+        acting_player = state.acting_player
 
-        legal_moves = generate_legal_moves(state)
+        legal_moves = get_legal_moves(state)
         if not legal_moves:
             break
 
@@ -291,7 +363,7 @@ def _run_game_with_mcts_stats(
             move_record = {
                 "turn": state.turn_number,
                 "player": acting_player,
-                "phase": state.phase.name,
+                "phase": PHASE_NAMES[state.phase],
                 "move": str(move),
                 "legal_move_count": len(legal_moves),
                 "mcts_stats": move_stats,
@@ -303,7 +375,7 @@ def _run_game_with_mcts_stats(
             move_record = {
                 "turn": state.turn_number,
                 "player": acting_player,
-                "phase": state.phase.name,
+                "phase": PHASE_NAMES[state.phase],
                 "move": str(move),
                 "legal_move_count": len(legal_moves),
                 "mcts_stats": None,
@@ -10,6 +10,7 @@ from typing import Any
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel, Field
 
+from simulation.runner import load_game_log
 from web.api.session_manager import (
     GameSession,
     PlayerConfig,
@@ -256,8 +257,7 @@ async def get_replay(game_id: str):
             continue
         game_file = date_dir / f"game_{game_id}.json"
         if game_file.exists():
-            with open(game_file) as f:
-                return json.load(f)
+            return load_game_log(game_file)
 
     raise HTTPException(status_code=404, detail="Replay not found")
 